@@ -10,7 +10,6 @@ corresponding finite state machine graph.
 """
 
 import math
-from lib.controllers.binary_table.Bit import Bit
 from lib.utilities.FinalProperty import FinalProperty
 from lib.controllers.binary_table.BinarySequence import BinarySequence
 
@@ -51,6 +50,15 @@ class State(object):
 	"""
 	SUCCESS = FinalProperty[int](0)
 
+	__slots__ = ("__label", "__terminal", "__root", "__op_status")
+
+	"""
+	The interned states, keyed by their
+	(label, terminal, root, op status) flags.
+
+	"""
+	__interned = dict()
+
 	def __init__(self, label: int, terminal: bool = False, root: bool = False, op_status: int = 0):
 		"""
 		State Constructor.
@@ -83,7 +91,7 @@ class State(object):
 
 		"""
 
-		return self.label == other.label
+		return self is other or self.label == other.label
 
 	def __lt__(self, other: 'State') -> bool:
 		"""
@@ -128,7 +136,37 @@ class State(object):
 
 		"""
 
-		return hash(self.__repr__())
+		return hash(self.label)
+
+	@staticmethod
+	def intern(label: int, terminal: bool = False, root: bool = False, op_status: int = 0) -> 'State':
+		"""
+		Return the single shared state with the label
+		and flags, creating it on first use. Interned
+		states are shared, so they must not be modified.
+
+		:param label: int, The integer label to associate
+			with the given node.
+		:param terminal: bool, Flag indicating whether
+			the state is procedurally terminal or not.
+		:param root: bool, Flag indicating whether the
+			state is the graph root/init state.
+		:param op_status: int, Operation status flag.
+		:return: State
+
+		:raises: ValueError, If the label or the
+			op status is invalid.
+
+		"""
+
+		key = (label, bool(terminal), bool(root), op_status)
+		state = State.__interned.get(key)
+
+		if state is None:
+			state = State(label=label, terminal=terminal, root=root, op_status=op_status)
+			State.__interned[key] = state
+
+		return state
 
 	def to_binary(self, label_size: int = -1) -> BinarySequence:
 		"""
@@ -143,7 +181,6 @@ class State(object):
 
 		"""
 
-		bs = BinarySequence(values=[])
 		bits = 1 if self.label == 0 else math.ceil(math.log(self.label, 2))
 		label_size = bits if label_size < 1 else label_size
 
@@ -151,16 +188,13 @@ class State(object):
 			msg = "Overflow Invalid Label Size (bits): {}"
 			raise ValueError(msg.format(bits))
 
-		converter = '{0:0' + str(label_size) + 'b}'
-		bitstr = converter.format(self.label)
-		bitstr = bitstr + Bit.BINARY_LABEL_1 if self.terminal else bitstr + Bit.BINARY_LABEL_0
-		bitstr = bitstr + Bit.BINARY_LABEL_1 if self.op_status == self.FAILURE else bitstr + Bit.BINARY_LABEL_0
-		bitstr = Bit.BINARY_LABEL_1 + bitstr if self.root else Bit.BINARY_LABEL_0 + bitstr
-
-		for char in bitstr:
-			bs.values.append(Bit(value=char))
-
-		return bs
+		# root bit, label bits, terminal bit, failure bit
+		label_size = max(label_size, self.label.bit_length())
+		value = (1 if self.root else 0) << (label_size + 2) \
+			| self.label << 2 \
+			| (1 if self.terminal else 0) << 1 \
+			| (1 if self.op_status == self.FAILURE else 0)
+		return BinarySequence.from_key(value=value, length=label_size + 3)
 
 	@property
 	def label(self) -> int:
@@ -16,6 +16,7 @@ from lib.State import State
 from lib.Controller import Controller
 from lib.controllers.Input import Input
 from lib.controllers.IOPair import IOPair
+from lib.controllers.Output import Output
 from lib.data.log.MachineLog import MachineLog
 
 __author__ = "Dylan Pozorski"
@@ -30,10 +31,14 @@ class TuringMachine(object):
 	Attributes:
 		controller (:obj:`Controller`):
 		tape_head (:obj:`Head`):
+		log (:obj:`MachineLog`): The machine's execution log.
+		state (:obj:`State`): The machine's present state
+			(None before its first step).
+		done (:obj:`bool`): Whether execution has terminated.
 
 	"""
 
-	def __init__(self, controller: Controller, tape_head: Head):
+	def __init__(self, controller: Controller, tape_head: Head, log: MachineLog = None):
 		"""
 		TuringMachine Constructor.
 
@@ -42,54 +47,110 @@ class TuringMachine(object):
 		:param tape_head: Head, interface used for
 			executing control behaviors on the TM's
 			memory (Tape).
+		:param log: MachineLog, The log (backend) to record
+			the machine's execution in. Defaults to an
+			in-memory MachineLog.
 
 		"""
 
 		self.controller = controller
 		self.tape_head = tape_head
-		self.__log = MachineLog()
+		self.__log = MachineLog() if log is None else log
+		self.__state, self.__timestep = None, 0
+		self.__done = False
 
-	def run(self) -> None:
+	def run(self, verbose: bool = True) -> None:
 		"""
 		Run the Turing Machine until execution terminates.
 
+		:param verbose: bool, Whether to print each
+			transition and the termination status.
+		:return: None
+
+		"""
+
+		self.reset()
+
+		try:
+			while not self.done:
+				input = self.query()
+				self.apply(
+					input=input,
+					output=self.controller.next(state=self.state, input=input),
+					verbose=verbose
+				)
+		finally:
+			self.log.close()
+
+	def reset(self) -> None:
+		"""
+		Clear the execution log and return the machine
+		to its initial (stateless) configuration.
+
 		:return: None
 
 		"""
 
 		self.log.clear()
-		done, old_state = False, None
-		timestep = 0
-
-		while not done:
-			done = True
-			input = Input(
-				word=self.tape_head.read(),
-				timestep=timestep
-			)
-			output = self.controller.next(
-				state=old_state,
-				input=input
-			)
-			action, new_state = output.action, output.state
-
-			if new_state is not None:
-				if action is not None:
+		self.__state, self.__timestep = None, 0
+		self.__done = False
+
+	def query(self) -> Input:
+		"""
+		Return the input of the machine's next
+		step (the word under the tape head).
+
+		:return: Input
+
+		"""
+
+		return Input(
+			word=self.tape_head.read(),
+			timestep=self.__timestep
+		)
+
+	def apply(self, input: Input, output: Output, verbose: bool = False) -> bool:
+		"""
+		Complete the step of the input with the
+		controller's output: execute and log the
+		transition action, move to the next state,
+		and check whether execution has terminated.
+
+		:param input: Input, The step's input (see query).
+		:param output: Output, The controller's output
+			for the present state and the input.
+		:param verbose: bool, Whether to print the
+			transition and the termination status.
+		:return: bool, Whether execution has terminated.
+
+		"""
+
+		old_state = self.__state
+		action, new_state = output.action, output.state
+		self.__done = True
+
+		if new_state is not None:
+			if action is not None:
+				if verbose:
 					params = [self.tape_head.operations, old_state, new_state, repr(action), self.tape_head]
 					print("{}. State {}->{}, {}, {}".format(*params))
-					action.exec(head=self.tape_head)
-					self.log.log(record=IOPair(input=input, output=output))
 
-				old_state = new_state
+				action.exec(head=self.tape_head)
+				self.log.log(record=IOPair(input=input, output=output))
+
+			self.__state = new_state
 
-			if new_state is None or (new_state.terminal and new_state.op_status == State.FAILURE):
+		if new_state is None or (new_state.terminal and new_state.op_status == State.FAILURE):
+			if verbose:
 				print("\033[91mProgram Terminated Unsuccessfully.\033[0m")
-			elif new_state.terminal and new_state.op_status == State.SUCCESS:
+		elif new_state.terminal and new_state.op_status == State.SUCCESS:
+			if verbose:
 				print("\033[92mProgram Terminated Successfully.\033[0m")
-			else:
-				done = False
+		else:
+			self.__done = False
 
-			timestep += 1
+		self.__timestep += 1
+		return self.__done
 
 	@property
 	def controller(self) -> Controller:
@@ -132,3 +193,22 @@ class TuringMachine(object):
 		"""
 
 		return self.__log
+
+	@property
+	def state(self) -> State:
+		"""
+		:obj:`State` The machine's present state
+			(None before its first step).
+
+		"""
+
+		return self.__state
+
+	@property
+	def done(self) -> bool:
+		"""
+		:obj:`bool` Whether execution has terminated.
+
+		"""
+
+		return self.__done
@@ -31,6 +31,8 @@ class IOPair(object):
 
 	"""
 
+	__slots__ = ("__input", "__output", "__label_size")
+
 	def __init__(self, input: Input, output: Output, label_size: int = -1):
 		"""
 		IOPair Constructor.
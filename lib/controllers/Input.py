@@ -30,6 +30,8 @@ class Input(object):
 
 	"""
 
+	__slots__ = ("__word", "__timestep")
+
 	def __init__(self, word: Word, timestep: int):
 		"""
 		Input Constructor.
@@ -35,6 +35,8 @@ class Output(object):
 
 	"""
 
+	__slots__ = ("__action", "__state", "__timestep")
+
 	def __init__(self, action: Action, state: State, timestep: int):
 		"""
 		Output Constructor.
@@ -98,9 +100,9 @@ class Output(object):
 
 		"""
 
-		state = self.state.to_binary(label_size=label_size)
-		output = state.values + self.action.to_binary().values
-		return BinarySequence(values=output)
+		(state_size, state), (action_size, action) = \
+			self.state.to_binary(label_size=label_size).key, self.action.to_binary().key
+		return BinarySequence.from_key(value=state << action_size | action, length=state_size + action_size)
 
 	@property
 	def action(self) -> Action:
@@ -11,8 +11,7 @@ control sequence.
 
 """
 
-import math
-from typing import List
+from typing import List, Tuple
 from lib.controllers.binary_table.Bit import Bit
 
 __author__ = "Dylan Pozorski"
@@ -27,9 +26,21 @@ class BinarySequence(object):
 	Attributes:
 		values (:obj:`List[Bit]`): List of bits in the
 			binary sequence.
+		key (:obj:`Tuple[int, int]`): The (length, integer
+			value) pair identifying the bit string.
+
+	The sequence is stored as its (length, integer value)
+	key, the first bit being the most significant (the
+	key is an internal detail; to_int reads the first bit
+	as the least significant, as it always has). The
+	list of bits is only built when the values are read
+	(and is then kept), so it must not be modified in place.
+	Equality, ordering and hashing are computed from the key.
 
 	"""
 
+	__slots__ = ("__key", "__values")
+
 	def __init__(self, values: List[Bit] = None):
 		"""
 		BinarySequence Constructor.
@@ -39,7 +50,10 @@ class BinarySequence(object):
 
 		"""
 
-		self.__values = values
+		self.__key, self.__values = (0, 0), None
+
+		if values is not None:
+			self.values = values
 
 	def __len__(self) -> int:
 		"""
@@ -50,7 +64,7 @@ class BinarySequence(object):
 
 		"""
 
-		return len(self.values)
+		return self.key[0]
 
 	def __str__(self) -> str:
 		"""
@@ -61,7 +75,8 @@ class BinarySequence(object):
 
 		"""
 
-		return ''.join([i.value for i in self.values])
+		length, value = self.key
+		return format(value, "0{}b".format(length)) if length > 0 else ""
 
 	def __repr__(self) -> str:
 		"""
@@ -84,20 +99,24 @@ class BinarySequence(object):
 
 		"""
 
-		return self.__str__() == other.__str__()
+		return self is other or self.key == other.key
 
 	def __lt__(self, other: 'BinarySequence') -> bool:
 		"""
 		Compare whether the the self-referenced
 		binary sequence is less than the other
-		binary sequence.
+		binary sequence (in lexicographic order
+		of the bit strings).
 
 		:param other: BinarySequence
 		:return: bool
 
 		"""
 
-		return self.__str__() < other.__str__()
+		(length, value), (other_length, other_value) = self.key, other.key
+		size = max(length, other_length)
+		aligned, other_aligned = value << (size - length), other_value << (size - other_length)
+		return aligned < other_aligned or (aligned == other_aligned and length < other_length)
 
 	def __hash__(self) -> int:
 		"""
@@ -108,7 +127,44 @@ class BinarySequence(object):
 
 		"""
 
-		return hash(self.__str__())
+		return hash(self.key)
+
+	def bit(self, index: int) -> int:
+		"""
+		Return the bit at the index (the first bit
+		being index 0, negative indices counting
+		from the end).
+
+		:param index: int, The index of the bit.
+		:return: int
+
+		:raises: IndexError, If the index is out of range.
+
+		"""
+
+		length, value = self.key
+
+		if index < -length or index >= length:
+			raise IndexError("Bit Index Out of Range:", index)
+
+		return (value >> ((length - 1 - index) % length)) & 1
+
+	def field(self, start: int, stop: int = None) -> int:
+		"""
+		Return the integer value of the bits from the
+		start index up to (excluding) the stop index,
+		following the list slicing conventions.
+
+		:param start: int, The index of the first bit.
+		:param stop: int, The index past the last bit
+			(the end of the sequence if None).
+		:return: int
+
+		"""
+
+		length, value = self.key
+		start, stop, _ = slice(start, stop).indices(length)
+		return (value >> (length - stop)) & ((1 << max(0, stop - start)) - 1)
 
 	def pad(self, padding: int, value: str = "0", left: bool = True) -> None:
 		"""
@@ -122,25 +178,56 @@ class BinarySequence(object):
 		"""
 
 		if value in [Bit.BINARY_LABEL_0, Bit.BINARY_LABEL_1]:
-			self.values = self.values if left else reversed(self.values)
-			[self.values.insert(0, Bit(value=value)) for _i in range(0, max(0, padding))]
-			self.values = self.values if left else reversed(self.values)
+			(length, current), padding = self.key, max(0, padding)
+			bits = ((1 << padding) - 1) if value == Bit.BINARY_LABEL_1 else 0
+			current = (bits << length) | current if left else (current << padding) | bits
+			self.__key, self.__values = (length + padding, current), None
 
 	def to_int(self) -> int:
 		"""
 		Return the value of the binary sequence
-		as an integer.
+		as an integer, the first bit being the
+		least significant.
 
 		:return: int
 
 		"""
 
-		int_rep = 0
+		length, value = self.key
+		return int(format(value, "0{}b".format(length))[::-1], 2) if length > 0 else 0
+
+	@staticmethod
+	def from_key(value: int, length: int) -> 'BinarySequence':
+		"""
+		Build the binary sequence of the given length
+		from its key value (the first bit being the
+		most significant, see key).
+
+		:param value: int, The key value of the sequence.
+		:param length: int, The number of bits.
+		:return: BinarySequence
+
+		:raises: ValueError, If the value is negative or
+			does not fit in the given number of bits.
+
+		"""
 
-		for i in reversed(range(0, len(self.values))):
-			int_rep += math.pow(2, i) * int(self.values[i].value)
+		if length < 0 or value < 0 or value >> length != 0:
+			raise ValueError("Invalid Binary Sequence Value:", value)
 
-		return int(int_rep)
+		sequence = BinarySequence()
+		sequence.__key = (length, value)
+		return sequence
+
+	@property
+	def key(self) -> Tuple[int, int]:
+		"""
+		:obj:`Tuple[int, int]` The (length, integer value)
+		pair identifying the bit string.
+
+		"""
+
+		return self.__key
 
 	@property
 	def values(self) -> List[Bit]:
@@ -151,8 +238,15 @@ class BinarySequence(object):
 
 		"""
 
+		if self.__values is None:
+			bits = self.__str__()
+			self.__values = [Bit.intern(value=c) for c in bits]
+
 		return self.__values
 
 	@values.setter
 	def values(self, values: List[Bit]) -> None:
-		self.__values = values if values is not None else []
+		values = values if values is not None else []
+		bits = ''.join([i.value for i in values])
+		self.__key = (len(bits), int(bits, 2) if len(bits) > 0 else 0)
+		self.__values = values
@@ -11,7 +11,6 @@ the next target state.
 
 """
 
-import copy
 from lib.State import State
 from typing import Set, List, Tuple
 from lib.controls.Write import Write
@@ -119,7 +118,7 @@ class BinaryTable(Controller):
 		"""
 
 		if entry not in self.entries:
-			if len(self.entries) > 0 and len(entry) != len(list(self.entries)[0]):
+			if len(self.entries) > 0 and len(entry) != len(next(iter(self.entries))):
 				raise ValueError("Control Sequence of Different Lengths")
 
 			if entry.source.root:
@@ -216,12 +215,12 @@ class BinaryTable(Controller):
 		"""
 
 		states = list()
-		pairs = [(entry.source.label, entry.condition.values[0].value) for entry in self.entries]
+		pairs = set([(entry.source.label, str(entry.condition.bit(index=0))) for entry in self.entries])
 
 		for entry in self.entries:
 			for condition in [Bit.BINARY_LABEL_0, Bit.BINARY_LABEL_1]:
 				if (entry.source.label, condition) not in pairs:
-					states.append((entry.source, Bit(value=condition)))
+					states.append((entry.source, Bit.intern(value=condition)))
 
 		return states
 
@@ -238,7 +237,7 @@ class BinaryTable(Controller):
 
 		sequences, exceptions = list(), list()
 		indefinites = self.indefinite_states()
-		bits = len(list(self.entries)[0].source.identity) \
+		bits = len(next(iter(self.entries)).source.identity) \
 			- (StateSequence.MIN_STATE_SEQUENCE_LEN - 3)
 		labeler = -1
 
@@ -250,14 +249,14 @@ class BinaryTable(Controller):
 			sequences.append(
 				ControlSequence(
 					source=indef[0],
-					condition=BinarySequence(values=[indef[1]]),
+					condition=BinarySequence.from_key(value=int(indef[1].value), length=1),
 					target=StateSequence(
-						identity=State(
+						identity=State.intern(
 							label=labeler,
 							terminal=True,
 							op_status=State.FAILURE
 						).to_binary(label_size=bits),
-						operation=Write(word=Word(name=indef[1].value)).to_binary()
+						operation=Write(word=Word.intern(name=indef[1].value)).to_binary()
 					)
 				)
 			)
@@ -300,20 +299,83 @@ class BinaryTable(Controller):
 		bits = len(list(self.entries)[0].source.identity) \
 			- (StateSequence.MIN_STATE_SEQUENCE_LEN - 3) \
 			if len(self.entries) > 0 else 0
-		converter = '{0:0' + str(bits) + 'b}'
+		index = dict([(s, i) for i, s in enumerate(states)])
+
+		def relabel(identity: BinarySequence) -> BinarySequence:
+			# keep the root bit and the trailing terminal/failure bits
+			value = identity.bit(index=0) << (bits + 2) \
+				| index[identity] << 2 \
+				| identity.field(start=-2)
+			return BinarySequence.from_key(value=value, length=bits + 3)
 
 		for entry in self.entries:
-			n = copy.deepcopy(entry)
-			ident = converter.format(states.index(n.source.identity))
-			values = [n.source.identity.values[0]] + [Bit(value=c) for c in ident] + n.source.identity.values[-2:]
-			n.source.identity = BinarySequence(values=values)
-			ident = converter.format(states.index(n.target.identity))
-			values = [n.target.identity.values[0]] + [Bit(value=c) for c in ident] + n.target.identity.values[-2:]
-			n.target.identity = BinarySequence(values=values)
-			rebased_seqs.append(n)
+			rebased_seqs.append(ControlSequence(
+				source=StateSequence(
+					identity=relabel(identity=entry.source.identity),
+					operation=entry.source.operation
+				),
+				condition=entry.condition,
+				target=StateSequence(
+					identity=relabel(identity=entry.target.identity),
+					operation=entry.target.operation
+				)
+			))
 
 		self.__entries = rebased_seqs
 
+	def to_int(self) -> int:
+		"""
+		Return the table's Goedel number, an exact
+		natural number the table can be decoded from
+		(see from_int). Equal tables (the same set of
+		control sequences) have the same number.
+
+		The control sequences are concatenated in
+		ascending order behind a leading 1 bit, followed
+		by their length (k bits), a 0 bit, and k 1 bits.
+
+		:return: int
+
+		"""
+
+		length = len(next(iter(self.entries))) if len(self) > 0 else 0
+		size = length.bit_length()
+		converter = "{0:0" + str(length) + "b}"
+		entries = sorted(set([entry.key[1] for entry in self.entries]))
+		payload = int("1" + "".join([converter.format(e) for e in entries]), 2)
+		return (((payload << size) | length) << (size + 1)) | ((1 << size) - 1)
+
+	@staticmethod
+	def from_int(number: int) -> 'BinaryTable':
+		"""
+		Decode a table from its Goedel number (see to_int)
+		in time linear in the number's size.
+
+		:param number: int, The table's Goedel number.
+		:return: BinaryTable
+
+		:raises: ValueError, If the number does not
+			encode a table.
+
+		"""
+
+		if number < 2:
+			raise ValueError("Invalid Table Number:", number)
+
+		size = (number ^ (number + 1)).bit_length() - 1
+		length = (number >> (size + 1)) & ((1 << size) - 1)
+		payload = number >> (2 * size + 1)
+		bits = format(payload, "b")[1:]
+
+		if payload == 0 or (length == 0 and len(bits) > 0) \
+				or (length > 0 and len(bits) % length != 0):
+			raise ValueError("Invalid Table Number:", number)
+
+		return BinaryTable(entries=set([
+			ControlSequence.from_key(value=int(bits[i:i + length], 2), length=length)
+			for i in range(0, len(bits), max(1, length))
+		]))
+
 	@property
 	def entries(self) -> Set[ControlSequence]:
 		"""
@@ -38,6 +38,14 @@ class Bit(object):
 	"""
 	BINARY_LABEL_1 = FinalProperty[str]("1")
 
+	__slots__ = ("__value",)
+
+	"""
+	The interned bits, keyed by value (see intern).
+
+	"""
+	__interned = dict()
+
 	def __init__(self, value: str):
 		"""
 		Bit Constructor.
@@ -48,6 +56,29 @@ class Bit(object):
 
 		self.value = value
 
+	@staticmethod
+	def intern(value: str) -> 'Bit':
+		"""
+		Return the single shared bit with the value,
+		creating it on first use. Interned bits are
+		shared, so they must not be modified.
+
+		:param value: str, The bit's value.
+		:return: Bit
+
+		:raises: ValueError if the value is not
+			a valid binary character.
+
+		"""
+
+		bit = Bit.__interned.get(value)
+
+		if bit is None:
+			bit = Bit(value=value)
+			Bit.__interned[value] = bit
+
+		return bit
+
 	@property
 	def value(self) -> str:
 		"""
@@ -11,8 +11,7 @@ some transition condition.
 
 """
 
-import math
-from typing import List
+from typing import List, Tuple
 from lib.controllers.binary_table.Bit import Bit
 from lib.controllers.binary_table.StateSequence import StateSequence
 from lib.controllers.binary_table.BinarySequence import BinarySequence
@@ -33,6 +32,8 @@ class ControlSequence(BinarySequence):
 
 	"""
 
+	__slots__ = ("__source", "__condition", "__target")
+
 	def __init__(
 			self,
 			source: StateSequence,
@@ -68,6 +69,35 @@ class ControlSequence(BinarySequence):
 
 		raise NotImplementedError
 
+	@staticmethod
+	def from_key(value: int, length: int) -> 'ControlSequence':
+		"""
+		Build the control sequence of the given length
+		from its key value (the source bits, the
+		condition bit and the target bits).
+
+		:param value: int, The key value of the sequence.
+		:param length: int, The number of bits.
+		:return: ControlSequence
+
+		:raises: ValueError, If the value is negative, does
+			not fit in the given number of bits, or the length
+			does not split into two state sequences around
+			a condition bit.
+
+		"""
+
+		if length % 2 == 0:
+			raise ValueError("Invalid Control Sequence Length:", length)
+
+		size = length // 2
+		sequence = BinarySequence.from_key(value=value, length=length)
+		return ControlSequence(
+			source=StateSequence.from_key(value=value >> (size + 1), length=size),
+			condition=BinarySequence.from_key(value=sequence.bit(index=size), length=1),
+			target=StateSequence.from_key(value=sequence.field(start=size + 1), length=size)
+		)
+
 	def to_int(self) -> int:
 		"""
 		Return the value of the control sequence
@@ -78,9 +108,9 @@ class ControlSequence(BinarySequence):
 		"""
 
 		int_rep, curr_len = self.target.to_int(), len(self.target)
-		int_rep += (self.condition.to_int() * math.pow(2, curr_len))
+		int_rep += self.condition.to_int() << curr_len
 		curr_len += len(self.condition)
-		return int_rep + int(self.source.to_int() * math.pow(2, curr_len))
+		return int_rep + (self.source.to_int() << curr_len)
 
 	@property
 	def source(self) -> StateSequence:
@@ -162,3 +192,16 @@ class ControlSequence(BinarySequence):
 		return self.source.values \
 			+ self.condition.values \
 			+ self.target.values
+
+	@property
+	def key(self) -> Tuple[int, int]:
+		"""
+		:obj:`Tuple[int, int]` Return the composed
+		(length, integer value) pair.
+
+		"""
+
+		(source_length, source), (condition_length, condition) = self.source.key, self.condition.key
+		target_length, target = self.target.key
+		length = source_length + condition_length + target_length
+		return length, (((source << condition_length) | condition) << target_length) | target
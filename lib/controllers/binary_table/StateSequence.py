@@ -11,8 +11,7 @@ state operation.
 
 """
 
-import math
-from typing import List
+from typing import List, Tuple
 from lib.State import State
 from lib.controls.Move import Move
 from lib.controls.Write import Write
@@ -54,6 +53,11 @@ class StateSequence(BinarySequence):
 			-10: Terminal State, Successful Program Execution
 			-11: Terminal State, Unsuccessful/Failed Program Execution
 
+	The label, flags and state are decoded once when the identity
+	is set, and the action when the operation is set, so reading
+	them costs no decoding or allocation. The sequences must not be
+	modified in place once assigned.
+
 	"""
 
 	"""
@@ -68,6 +72,11 @@ class StateSequence(BinarySequence):
 	"""
 	OPERATION_SEQUENCE_LEN = FinalProperty[int](2)
 
+	__slots__ = (
+		"__operation", "__identity", "__key", "__label", "__terminal",
+		"__root", "__op_status", "__state", "__action"
+	)
+
 	def __init__(self, operation: BinarySequence, identity: BinarySequence):
 		"""
 		StateSequence Constructor.
@@ -103,6 +112,7 @@ class StateSequence(BinarySequence):
 		"""
 
 		BinarySequence.__init__(self)
+		self.__identity = None
 		self.operation = operation
 		self.identity = identity
 
@@ -122,6 +132,33 @@ class StateSequence(BinarySequence):
 
 		raise NotImplementedError
 
+	@staticmethod
+	def from_key(value: int, length: int) -> 'StateSequence':
+		"""
+		Build the state sequence of the given length
+		from its key value (the identity bits followed
+		by the operation bits).
+
+		:param value: int, The key value of the sequence.
+		:param length: int, The number of bits.
+		:return: StateSequence
+
+		:raises: ValueError, If the value is negative, does
+			not fit in the given number of bits, or the length
+			is less than the min size of a state sequence.
+
+		"""
+
+		if length < StateSequence.MIN_STATE_SEQUENCE_LEN:
+			raise ValueError("Invalid State Sequence Length:", length)
+
+		size = StateSequence.OPERATION_SEQUENCE_LEN
+		sequence = BinarySequence.from_key(value=value, length=length)
+		return StateSequence(
+			identity=BinarySequence.from_key(value=value >> size, length=length - size),
+			operation=BinarySequence.from_key(value=sequence.field(start=-size), length=size)
+		)
+
 	def to_int(self) -> int:
 		"""
 		Return the value of the state sequence
@@ -131,9 +168,7 @@ class StateSequence(BinarySequence):
 
 		"""
 
-		int_rep = self.identity.to_int()
-		curr_len = len(self.identity)
-		return int_rep + int(self.operation.to_int() * math.pow(2, curr_len))
+		return self.identity.to_int() + (self.operation.to_int() << len(self.identity))
 
 	def to_state(self) -> State:
 		"""
@@ -144,12 +179,7 @@ class StateSequence(BinarySequence):
 
 		"""
 
-		return State(
-			label=self.label,
-			root=self.root,
-			terminal=self.terminal,
-			op_status=self.op_status
-		)
+		return self.__state
 
 	@property
 	def operation(self) -> BinarySequence:
@@ -176,7 +206,14 @@ class StateSequence(BinarySequence):
 		if len(operation) != self.OPERATION_SEQUENCE_LEN:
 			raise ValueError("Invalid Operation Bit:", operation)
 
-		self.__operation = operation
+		if operation.bit(index=0) == 0:
+			left = operation.bit(index=1) == 0
+			direction = Move.DIRECTION_LEFT if left else Move.DIRECTION_RIGHT
+			self.__action = Move(direction=direction)
+		else:
+			self.__action = Write(word=Word.intern(name=str(operation.bit(index=1))))
+
+		self.__operation, self.__key = operation, None
 
 	@property
 	def identity(self) -> BinarySequence:
@@ -195,13 +232,29 @@ class StateSequence(BinarySequence):
 
 		Set binary identity sequence values.
 
+		:raises: ValueError, If the identity sequence is too
+			short to hold the root, label and flag bits.
+
 		"""
 
 		return self.__identity
 
 	@identity.setter
 	def identity(self, identity: BinarySequence) -> None:
-		self.__identity = identity
+		if len(identity) < self.MIN_STATE_SEQUENCE_LEN - self.OPERATION_SEQUENCE_LEN:
+			raise ValueError("Invalid Identity Sequence:", identity)
+
+		self.__label = identity.field(start=1, stop=-2)
+		self.__root = identity.bit(index=0) == 1
+		self.__terminal = identity.bit(index=-2) == 1
+		self.__op_status = identity.bit(index=-1)
+		self.__state = State.intern(
+			label=self.__label,
+			root=self.__root,
+			terminal=self.__terminal,
+			op_status=self.__op_status
+		)
+		self.__identity, self.__key = identity, None
 
 	@property
 	def terminal(self) -> bool:
@@ -211,7 +264,7 @@ class StateSequence(BinarySequence):
 
 		"""
 
-		return self.values[-4].value == Bit.BINARY_LABEL_1
+		return self.__terminal
 
 	@property
 	def root(self) -> bool:
@@ -221,7 +274,7 @@ class StateSequence(BinarySequence):
 
 		"""
 
-		return self.values[0].value == Bit.BINARY_LABEL_1
+		return self.__root
 
 	@property
 	def op_status(self) -> int:
@@ -234,7 +287,7 @@ class StateSequence(BinarySequence):
 
 		"""
 
-		return int(self.values[-3].value)
+		return self.__op_status
 
 	@property
 	def values(self) -> List[Bit]:
@@ -246,6 +299,20 @@ class StateSequence(BinarySequence):
 		return self.identity.values \
 			+ self.operation.values
 
+	@property
+	def key(self) -> Tuple[int, int]:
+		"""
+		:obj:`Tuple[int, int]` Return the composed
+		(length, integer value) pair.
+
+		"""
+
+		if self.__key is None:
+			(identity_length, identity), (operation_length, operation) = self.identity.key, self.operation.key
+			self.__key = (identity_length + operation_length, (identity << operation_length) | operation)
+
+		return self.__key
+
 	@property
 	def label(self) -> int:
 		"""
@@ -253,8 +320,7 @@ class StateSequence(BinarySequence):
 
 		"""
 
-		bits = [i.value for i in self.identity.values[1:-2]]
-		return int(''.join(bits), 2)
+		return self.__label
 
 	def action(self) -> Action:
 		"""
@@ -263,9 +329,4 @@ class StateSequence(BinarySequence):
 
 		"""
 
-		if self.operation.values[0].value == Bit.BINARY_LABEL_0:
-			left = self.operation.values[1].value == Bit.BINARY_LABEL_0
-			direction = Move.DIRECTION_LEFT if left else Move.DIRECTION_RIGHT
-			return Move(direction=direction)
-		else:
-			return Write(word=Word(name=self.operation.values[1].value))
+		return self.__action
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+
+"""
+
+BatchScheduler Docstring
+
+The Batch Scheduler class runs many Turing Machines
+in lockstep. At every step it collects the pending
+queries of the machines driven by the same network
+controller and evaluates them with a single forward
+pass (one matrix multiply per layer), then dispatches
+each decision back to its machine. Evaluating the
+queries one at a time is dominated by NumPy's per
+call overhead rather than by the arithmetic.
+
+"""
+
+import numpy as np
+from typing import List, Tuple
+from lib.State import State
+from lib.controls.Action import Action
+from lib.TuringMachine import TuringMachine
+from lib.controllers.Output import Output
+from lib.controllers.network.Network import Network
+from lib.controllers.network.CachedNetwork import CachedNetwork
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+__class__ = "BatchScheduler"
+
+
+class BatchScheduler(object):
+	"""
+	BatchScheduler
+
+	Attributes:
+		machines (:obj:`List[TuringMachine]`): The scheduled
+			machines.
+		steps (:obj:`int`): The number of lockstep steps
+			taken by the last run.
+
+	The queries of machines driven by a network are batched
+	per network. Cached networks answer their queries from
+	their cache instead, and any other controller is asked
+	one query at a time, so machines with different kinds
+	of controllers can be scheduled together.
+
+	"""
+
+	def __init__(self, machines: List[TuringMachine] = None):
+		"""
+		BatchScheduler Constructor.
+
+		:param machines: List[TuringMachine], The machines
+			to schedule.
+
+		"""
+
+		self.__machines = list() if machines is None else list(machines)
+		self.__decisions = dict()
+		self.__steps = 0
+
+	def __len__(self) -> int:
+		"""
+		Return the number of scheduled machines.
+
+		:return: int
+
+		"""
+
+		return len(self.__machines)
+
+	def add(self, machine: TuringMachine) -> None:
+		"""
+		Add the machine to the schedule.
+
+		:param machine: TuringMachine, The machine to add.
+		:return: None
+
+		"""
+
+		self.__machines.append(machine)
+
+	def run(self, verbose: bool = False, max_steps: int = None) -> None:
+		"""
+		Reset every scheduled machine and step them
+		in lockstep until every machine terminates
+		(or the step limit is reached).
+
+		:param verbose: bool, Whether to print each
+			transition and the termination status.
+		:param max_steps: int, The maximum number of
+			lockstep steps (unlimited if None).
+		:return: None
+
+		"""
+
+		for machine in self.machines:
+			machine.reset()
+
+		self.__decisions.clear()
+		self.__steps = 0
+
+		try:
+			while max_steps is None or self.__steps < max_steps:
+				if self.step(verbose=verbose) == 0:
+					break
+
+				self.__steps += 1
+		finally:
+			for machine in self.machines:
+				machine.log.close()
+
+	def step(self, verbose: bool = False) -> int:
+		"""
+		Take one step of every running machine, batching
+		the queries of the machines driven by each network.
+
+		:param verbose: bool, Whether to print each
+			transition and the termination status.
+		:return: int, The number of machines stepped.
+
+		"""
+
+		batches, count = dict(), 0
+
+		for machine in self.machines:
+			if machine.done:
+				continue
+
+			count += 1
+			input, controller = machine.query(), machine.controller
+
+			if machine.state is None or not isinstance(controller, Network) \
+					or isinstance(controller, CachedNetwork):
+				output = controller.next(state=machine.state, input=input)
+				machine.apply(input=input, output=output, verbose=verbose)
+			else:
+				batches.setdefault(id(controller), (controller, list()))[1].append((machine, input))
+
+		for network, queries in batches.values():
+			features = network.encode_batch(
+				states=[m.state for m, _ in queries],
+				words=[i.word for _, i in queries]
+			)
+
+			for (machine, input), bits in zip(queries, network.predict(features=features)):
+				state, action = self.__decode(network=network, bits=bits)
+				output = Output(action=action, state=state, timestep=input.timestep)
+				machine.apply(input=input, output=output, verbose=verbose)
+
+		return count
+
+	def __decode(self, network: Network, bits: np.ndarray) -> Tuple[State, Action]:
+		"""
+		Decode the network's output bits, reusing the
+		decision of any identical output already decoded.
+
+		:param network: Network, The network evaluated.
+		:param bits: np.ndarray, The output bits.
+		:return: Tuple[State, Action]
+
+		"""
+
+		key = (id(network), bits.tobytes())
+		decision = self.__decisions.get(key)
+
+		if decision is None:
+			decision = network.decode(bits=bits)
+			self.__decisions[key] = decision
+
+		return decision
+
+	@property
+	def machines(self) -> List[TuringMachine]:
+		"""
+		:obj:`List[TuringMachine]` The scheduled machines.
+
+		"""
+
+		return self.__machines
+
+	@property
+	def steps(self) -> int:
+		"""
+		:obj:`int` The number of lockstep steps
+		taken by the last run.
+
+		"""
+
+		return self.__steps
@@ -0,0 +1,377 @@
+#!/usr/bin/env python
+
+"""
+
+CachedNetwork Docstring
+
+The Cached Network class is a hybrid of the network
+and table controllers. The network is only evaluated
+the first time a (present state, input bit) query is
+seen; its decoded decision is memoized, so once the
+machine's reachable states have been visited each
+transition costs a dictionary lookup. The memoized
+decisions can be exported as an ordinary table.
+
+"""
+
+import numpy as np
+from lib.State import State
+from collections import OrderedDict
+from typing import List, Tuple, Dict
+from lib.controls.Action import Action
+from lib.controllers.Input import Input
+from lib.controllers.Output import Output
+from lib.controllers.table.Edge import Edge
+from lib.controllers.table.Word import Word
+from lib.controllers.table.Table import Table
+from lib.controllers.binary_table.Bit import Bit
+from lib.controllers.network.Network import Network
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+__class__ = "CachedNetwork"
+
+
+class CachedNetwork(Network):
+	"""
+	CachedNetwork
+
+	Attributes:
+		cache_size (:obj:`int`): The maximum number of
+			memoized decisions (unbounded if None). The
+			least recently used decision is evicted first.
+		hits (:obj:`int`): The number of queries answered
+			from the cache.
+		misses (:obj:`int`): The number of queries that
+			evaluated the network.
+
+	A query's key is its present state's identity bits
+	(root, label, terminal, failure) and its input bit.
+	Setting the weights or the activation clears the cache.
+
+	"""
+
+	def __init__(
+			self,
+			weights: List[np.ndarray],
+			biases: List[np.ndarray],
+			label_size: int,
+			initial: State,
+			activation: str = "tanh",
+			cache_size: int = None):
+		"""
+		CachedNetwork Constructor.
+
+		:param weights: List[np.ndarray], The weight matrix
+			of each layer, shaped (inputs x outputs).
+		:param biases: List[np.ndarray], The bias vector
+			of each layer.
+		:param label_size: int, The size (in bits) of the
+			state labels the network reads and writes.
+		:param initial: State, The initial state of the
+			machine (returned when no state is provided).
+		:param activation: str, The hidden layer activation
+			function (tanh or relu).
+		:param cache_size: int, The maximum number of
+			memoized decisions (unbounded if None).
+
+		:raises: ValueError, If the cache size is invalid.
+
+		"""
+
+		if cache_size is not None and cache_size < 1:
+			raise ValueError("Invalid Cache Size:", cache_size)
+
+		self.__cache = OrderedDict()
+		self.__cache_size = cache_size
+		self.__hits, self.__misses = 0, 0
+		Network.__init__(
+			self,
+			weights=weights,
+			biases=biases,
+			label_size=label_size,
+			initial=initial,
+			activation=activation
+		)
+
+	def __len__(self) -> int:
+		"""
+		Return the number of memoized decisions.
+
+		:return: int
+
+		"""
+
+		return len(self.__cache)
+
+	def __str__(self) -> str:
+		"""
+		Return the informal string representation
+		of the cached network object.
+
+		:return: str
+
+		"""
+
+		return "Cached " + Network.__str__(self) + " [{} cached]".format(len(self))
+
+	def next(self, state: State, input: Input) -> Output:
+		"""
+		From the specified input, compute the transition
+		action and the next graph state, evaluating the
+		network only on a cache miss.
+
+		:param state: State, The current state that
+			the tape head is currently located.
+		:param input: Input, The current word
+			being read by the print head on the TM.
+		:return: Output
+
+		"""
+
+		action, match = None, self.initial
+
+		if state is not None:
+			key = CachedNetwork.key(state=state, word=input.word)
+			decision = self.__cache.get(key)
+
+			if decision is None:
+				self.__misses += 1
+				bits = self.predict(features=self.encode(state=state, word=input.word))
+				decision = self.decode(bits=bits[0])
+				self.__store(key=key, decision=decision)
+			else:
+				self.__hits += 1
+
+				if self.cache_size is not None:
+					self.__cache.move_to_end(key)
+
+			match, action = decision
+
+		return Output(
+			action=action,
+			state=match,
+			timestep=input.timestep
+		)
+
+	def enumerate(self, max_states: int = None) -> int:
+		"""
+		Memoize every decision reachable from the initial
+		state, evaluating each breadth-first frontier of
+		(state, input bit) queries as one batch. Terminal
+		states end execution, so they are not expanded.
+
+		:param max_states: int, The maximum number of
+			states to expand (unbounded if None).
+		:return: int, The number of states expanded.
+
+		"""
+
+		words = [Word.intern(name=Bit.BINARY_LABEL_0), Word.intern(name=Bit.BINARY_LABEL_1)]
+		frontier, seen = [self.initial], set()
+
+		while len(frontier) > 0:
+			pending = list()
+
+			for state in frontier:
+				identity = CachedNetwork.key(state=state, word=words[0])[:-1]
+
+				if state.terminal or identity in seen:
+					continue
+				elif max_states is not None and len(seen) >= max_states:
+					break
+
+				seen.add(identity)
+				pending.extend([(state, w) for w in words])
+
+			if len(pending) == 0:
+				break
+
+			features = np.concatenate([self.encode(state=s, word=w) for s, w in pending])
+			frontier = list()
+
+			for (state, word), bits in zip(pending, self.predict(features=features)):
+				decision = self.decode(bits=bits)
+				self.__store(key=CachedNetwork.key(state=state, word=word), decision=decision)
+				frontier.append(decision[0])
+
+		return len(seen)
+
+	def to_table(self) -> Table:
+		"""
+		Export the memoized decisions as a table
+		(see enumerate to memoize every reachable one).
+
+		:return: Table
+
+		:raises: ValueError, If the decisions lead to
+			an ambiguous initial state.
+
+		"""
+
+		entries = set()
+
+		for (root, label, terminal, failure, name), (target, action) in self.__cache.items():
+			source = State.intern(
+				label=label,
+				root=root,
+				terminal=terminal,
+				op_status=State.FAILURE if failure else State.SUCCESS
+			)
+			entries.add(Edge(
+				condition=Word.intern(name=name),
+				source=source,
+				target=target,
+				action=action
+			))
+
+		return Table(entries=entries)
+
+	def clear(self) -> None:
+		"""
+		Clear the memoized decisions and
+		the hit and miss counts.
+
+		:return: None
+
+		"""
+
+		self.__cache.clear()
+		self.__hits, self.__misses = 0, 0
+
+	def set_parameters(self, weights: List[np.ndarray], biases: List[np.ndarray]) -> None:
+		"""
+		Set the network's layer weights and biases,
+		clearing the memoized decisions.
+
+		:param weights: List[np.ndarray], The weight matrix
+			of each layer, shaped (inputs x outputs).
+		:param biases: List[np.ndarray], The bias vector
+			of each layer.
+		:return: None
+
+		:raises: ValueError, If the layers do not chain
+			together or do not match the label size.
+
+		"""
+
+		Network.set_parameters(self, weights=weights, biases=biases)
+		self.clear()
+
+	@staticmethod
+	def key(state: State, word: Word) -> Tuple[bool, int, bool, bool, str]:
+		"""
+		Return the cache key of the query (the present
+		state's identity bits and the input bit).
+
+		:param state: State, The present state.
+		:param word: Word, The input word.
+		:return: Tuple[bool, int, bool, bool, str]
+
+		"""
+
+		return (
+			bool(state.root),
+			state.label,
+			bool(state.terminal),
+			state.op_status == State.FAILURE,
+			word.name
+		)
+
+	@staticmethod
+	def from_network(network: Network, cache_size: int = None) -> 'CachedNetwork':
+		"""
+		Wrap a network's parameters in a cached network.
+
+		:param network: Network, The network to cache.
+		:param cache_size: int, The maximum number of
+			memoized decisions (unbounded if None).
+		:return: CachedNetwork
+
+		"""
+
+		return CachedNetwork(
+			weights=network.weights,
+			biases=network.biases,
+			label_size=network.label_size,
+			initial=network.initial,
+			activation=network.activation,
+			cache_size=cache_size
+		)
+
+	def __store(self, key: Tuple[bool, int, bool, bool, str], decision: Tuple[State, Action]) -> None:
+		"""
+		Memoize the decision, evicting the least recently
+		used decision if the cache is full.
+
+		:param key: Tuple[bool, int, bool, bool, str], The query key.
+		:param decision: Tuple[State, Action], The decoded decision.
+		:return: None
+
+		"""
+
+		self.__cache[key] = decision
+
+		if self.cache_size is not None and len(self.__cache) > self.cache_size:
+			self.__cache.popitem(last=False)
+
+	@property
+	def cache(self) -> Dict[Tuple[bool, int, bool, bool, str], Tuple[State, Action]]:
+		"""
+		:obj:`Dict[Tuple[bool, int, bool, bool, str], Tuple[State, Action]]`
+		The memoized (next state, action) decisions.
+
+		"""
+
+		return self.__cache
+
+	@property
+	def cache_size(self) -> int:
+		"""
+		:obj:`int` The maximum number of memoized
+		decisions (unbounded if None).
+
+		"""
+
+		return self.__cache_size
+
+	@property
+	def hits(self) -> int:
+		"""
+		:obj:`int` The number of queries answered
+		from the cache.
+
+		"""
+
+		return self.__hits
+
+	@property
+	def misses(self) -> int:
+		"""
+		:obj:`int` The number of queries that
+		evaluated the network.
+
+		"""
+
+		return self.__misses
+
+	@property
+	def activation(self) -> str:
+		"""
+		:obj:`str` The hidden layer activation
+		function (tanh or relu).
+
+		Set the activation function, clearing
+		the memoized decisions.
+
+		:raises: ValueError, If the activation
+			function is not supported.
+
+		"""
+
+		return Network.activation.fget(self)
+
+	@activation.setter
+	def activation(self, activation: str) -> None:
+		Network.activation.fset(self, activation)
+		self.clear()
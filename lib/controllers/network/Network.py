@@ -0,0 +1,545 @@
+#!/usr/bin/env python
+
+"""
+
+Network Docstring
+
+The Network class represents the control of the
+Turing Machine as a feed-forward neural network
+evaluated with NumPy. The network maps the binary
+encoding of the present state and the tape head's
+input bit to the binary encoding of the transition
+action and the next state (the same bit layout as
+the binary table's state sequences and the logged
+IOPairs).
+
+"""
+
+import numpy as np
+from typing import List, Tuple
+from lib.State import State
+from lib.controls.Move import Move
+from lib.controls.Write import Write
+from lib.Controller import Controller
+from lib.controls.Action import Action
+from lib.controllers.Input import Input
+from lib.controllers.Output import Output
+from lib.controllers.table.Word import Word
+from lib.controllers.binary_table.Bit import Bit
+from lib.utilities.FinalProperty import FinalProperty
+from lib.controllers.binary_table.BinaryTable import BinaryTable
+from lib.controllers.binary_table.StateSequence import StateSequence
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+__class__ = "Network"
+
+
+class Network(Controller):
+	"""
+	Network
+
+	Attributes:
+		weights (:obj:`List[np.ndarray]`): The weight matrix
+			of each layer, shaped (inputs x outputs).
+		biases (:obj:`List[np.ndarray]`): The bias vector
+			of each layer.
+		label_size (:obj:`int`): The size (in bits) of the
+			state labels the network reads and writes.
+		initial (:obj:`State`): The initial state of the
+			machine (returned when no state is provided).
+		activation (:obj:`str`): The hidden layer activation
+			function (tanh or relu). The output layer is
+			always a sigmoid, thresholded at 0.5.
+
+	The network's input features are the present state's
+	identity sequence (root bit, label bits, terminal bit,
+	status bit) followed by the input bit. Its outputs are
+	the next state's identity sequence followed by the
+	operation sequence (operation bit, parameter bit).
+
+	"""
+
+	"""
+	The supported hidden layer activation functions.
+
+	"""
+	ACTIVATIONS = FinalProperty[Tuple[str, str]](("tanh", "relu"))
+
+	"""
+	The gain applied to the compiled output layer's
+	pre-activations (see from_table).
+
+	"""
+	COMPILED_GAIN = FinalProperty[float](10.0)
+
+	def __init__(
+			self,
+			weights: List[np.ndarray],
+			biases: List[np.ndarray],
+			label_size: int,
+			initial: State,
+			activation: str = "tanh"):
+		"""
+		Network Constructor.
+
+		:param weights: List[np.ndarray], The weight matrix
+			of each layer, shaped (inputs x outputs).
+		:param biases: List[np.ndarray], The bias vector
+			of each layer.
+		:param label_size: int, The size (in bits) of the
+			state labels the network reads and writes.
+		:param initial: State, The initial state of the
+			machine (returned when no state is provided).
+		:param activation: str, The hidden layer activation
+			function (tanh or relu).
+
+		:raises: ValueError, If the layers do not chain
+			together or do not match the label size.
+
+		"""
+
+		Controller.__init__(self)
+		self.__label_size = label_size
+		self.activation = activation
+		self.initial = initial
+		self.set_parameters(weights=weights, biases=biases)
+
+	def __str__(self) -> str:
+		"""
+		Return the informal string representation
+		of the network object.
+
+		:return: str
+
+		"""
+
+		sizes = [self.input_size] + [len(b) for b in self.biases]
+		return "Network Controller ({}, {})".format(
+			"-".join([str(s) for s in sizes]),
+			self.activation
+		)
+
+	def __repr__(self) -> str:
+		"""
+		Return the canonical string representation
+		of the network object.
+
+		:return: str
+
+		"""
+
+		return self.__str__()
+
+	def next(self, state: State, input: Input) -> Output:
+		"""
+		From the specified input, compute the transition
+		action and the next graph state.
+
+		:param state: State, The current state that
+			the tape head is currently located.
+		:param input: Input, The current word
+			being read by the print head on the TM.
+		:return: Output
+
+		"""
+
+		action, match = None, self.initial
+
+		if state is not None:
+			bits = self.predict(features=self.encode(state=state, word=input.word))
+			match, action = self.decode(bits=bits[0])
+
+		return Output(
+			action=action,
+			state=match,
+			timestep=input.timestep
+		)
+
+	def encode(self, state: State, word: Word) -> np.ndarray:
+		"""
+		Encode the state and input word as a
+		(1 x input size) feature row.
+
+		:param state: State, The present state.
+		:param word: Word, The input word.
+		:return: np.ndarray
+
+		:raises: ValueError, If the word is not a bit or
+			the label overflows the label size.
+
+		"""
+
+		return self.encode_batch(states=[state], words=[word])
+
+	def encode_batch(self, states: List[State], words: List[Word]) -> np.ndarray:
+		"""
+		Encode the states and their input words as
+		(n x input size) feature rows.
+
+		:param states: List[State], The present states.
+		:param words: List[Word], The input words.
+		:return: np.ndarray
+
+		:raises: ValueError, If a word is not a bit or
+			a label overflows the label size.
+
+		"""
+
+		n = len(states)
+		features = np.empty((n, self.input_size), dtype=np.float64)
+		labels = np.fromiter([s.label for s in states], dtype=np.int64, count=n)
+		names = [w.name for w in words]
+
+		for name in names:
+			if name != Bit.BINARY_LABEL_0 and name != Bit.BINARY_LABEL_1:
+				msg = "Unable to Cast {} to Binary Sequence."
+				raise ValueError(msg.format(name))
+
+		if n > 0 and int(labels.max()) >= (1 << self.label_size):
+			msg = "Overflow Invalid Label Size (bits): {}"
+			raise ValueError(msg.format(self.label_size))
+
+		shifts = np.arange(self.label_size - 1, -1, -1, dtype=np.int64)
+		features[:, 0] = [s.root for s in states]
+		features[:, 1:self.label_size + 1] = (labels[:, None] >> shifts) & 1
+		features[:, -3] = [s.terminal for s in states]
+		features[:, -2] = [s.op_status == State.FAILURE for s in states]
+		features[:, -1] = [name == Bit.BINARY_LABEL_1 for name in names]
+		return features
+
+	def decode(self, bits: np.ndarray) -> Tuple[State, Action]:
+		"""
+		Decode an output bit row into the next
+		state and the transition action.
+
+		:param bits: np.ndarray, The output bits.
+		:return: Tuple[State, Action]
+
+		"""
+
+		bits = [int(b) for b in bits]
+		label = 0
+
+		for b in bits[1:self.label_size + 1]:
+			label = (label << 1) | b
+
+		state = State.intern(
+			label=label,
+			root=bits[0] == 1,
+			terminal=bits[-4] == 1,
+			op_status=State.FAILURE if bits[-3] == 1 else State.SUCCESS
+		)
+
+		if str(bits[-2]) == Move.OP_CODE:
+			direction = Move.DIRECTION_RIGHT if bits[-1] == 1 else Move.DIRECTION_LEFT
+			action = Move(direction=direction)
+		else:
+			action = Write(word=Word.intern(name=str(bits[-1])))
+
+		return state, action
+
+	def forward(self, features: np.ndarray) -> np.ndarray:
+		"""
+		Evaluate the network over a batch of feature
+		rows, returning the output probabilities.
+
+		:param features: np.ndarray, The (n x input size)
+			feature rows.
+		:return: np.ndarray, The (n x output size)
+			output probabilities.
+
+		"""
+
+		h = features
+
+		for w, b in zip(self.weights[:-1], self.biases[:-1]):
+			h = h @ w + b
+			h = np.tanh(h) if self.activation == "tanh" else np.maximum(h, 0.0)
+
+		z = h @ self.weights[-1] + self.biases[-1]
+		return 1.0 / (1.0 + np.exp(-np.clip(z, -500.0, 500.0)))
+
+	def predict(self, features: np.ndarray) -> np.ndarray:
+		"""
+		Evaluate the network over a batch of feature
+		rows, returning the thresholded output bits.
+
+		:param features: np.ndarray, The (n x input size)
+			feature rows.
+		:return: np.ndarray, The (n x output size) bits.
+
+		"""
+
+		return (self.forward(features=features) > 0.5).astype(np.uint8)
+
+	def set_parameters(self, weights: List[np.ndarray], biases: List[np.ndarray]) -> None:
+		"""
+		Set the network's layer weights and biases.
+
+		:param weights: List[np.ndarray], The weight matrix
+			of each layer, shaped (inputs x outputs).
+		:param biases: List[np.ndarray], The bias vector
+			of each layer.
+		:return: None
+
+		:raises: ValueError, If the layers do not chain
+			together or do not match the label size.
+
+		"""
+
+		if len(weights) == 0 or len(weights) != len(biases):
+			raise ValueError("Invalid Network Layers.")
+
+		size = self.input_size
+
+		for w, b in zip(weights, biases):
+			if w.ndim != 2 or w.shape[0] != size or b.shape != (w.shape[1],):
+				raise ValueError("Invalid Layer Shape:", w.shape, b.shape)
+
+			size = w.shape[1]
+
+		if size != self.output_size:
+			raise ValueError("Invalid Output Size:", size)
+
+		self.__weights = [np.asarray(w, dtype=np.float64) for w in weights]
+		self.__biases = [np.asarray(b, dtype=np.float64) for b in biases]
+
+	def save(self, filepath: str) -> None:
+		"""
+		Save the network's parameters as a .npz file.
+
+		:param filepath: str, The file path to save.
+		:return: None
+
+		"""
+
+		arrays = dict()
+
+		for i in range(0, len(self.weights)):
+			arrays["W" + str(i)] = self.weights[i]
+			arrays["b" + str(i)] = self.biases[i]
+
+		np.savez(
+			filepath,
+			label_size=np.asarray(self.label_size),
+			activation=np.asarray(self.activation),
+			initial=np.asarray([
+				self.initial.label, self.initial.root,
+				self.initial.terminal, self.initial.op_status
+			], dtype=np.int64),
+			**arrays
+		)
+
+	@staticmethod
+	def load(filepath: str) -> 'Network':
+		"""
+		Load a network saved with save (layers W0, b0,
+		W1, b1, ... along with the label size, activation,
+		and initial state).
+
+		:param filepath: str, The file path to load.
+		:return: Network
+
+		"""
+
+		with np.load(filepath) as data:
+			layers = len([k for k in data.files if k.startswith("W")])
+			initial = [int(v) for v in data["initial"]]
+
+			return Network(
+				weights=[data["W" + str(i)] for i in range(0, layers)],
+				biases=[data["b" + str(i)] for i in range(0, layers)],
+				label_size=int(data["label_size"]),
+				activation=str(data["activation"]),
+				initial=State(
+					label=initial[0],
+					root=initial[1] == 1,
+					terminal=initial[2] == 1,
+					op_status=initial[3]
+				)
+			)
+
+	@staticmethod
+	def initialize(
+			label_size: int,
+			hidden: List[int],
+			initial: State,
+			activation: str = "tanh",
+			seed: int = None) -> 'Network':
+		"""
+		Build an untrained network with the hidden layer
+		sizes, its weights drawn from a (Glorot) uniform
+		distribution and its biases set to zero.
+
+		:param label_size: int, The size (in bits) of the
+			state labels the network reads and writes.
+		:param hidden: List[int], The hidden layer sizes.
+		:param initial: State, The initial state of the machine.
+		:param activation: str, The hidden layer activation
+			function (tanh or relu).
+		:param seed: int, The initialization seed.
+		:return: Network
+
+		"""
+
+		random = np.random.default_rng(seed)
+		sizes = [label_size + 4] + list(hidden) + [label_size + 5]
+		weights, biases = list(), list()
+
+		for n_in, n_out in zip(sizes[:-1], sizes[1:]):
+			limit = np.sqrt(6.0 / (n_in + n_out))
+			weights.append(random.uniform(-limit, limit, size=(n_in, n_out)))
+			biases.append(np.zeros(n_out))
+
+		return Network(
+			weights=weights,
+			biases=biases,
+			label_size=label_size,
+			initial=initial,
+			activation=activation
+		)
+
+	@staticmethod
+	def from_table(table: BinaryTable) -> 'Network':
+		"""
+		Compile a binary table into an equivalent network
+		with one (relu) hidden unit per control sequence.
+		Each unit only fires when the present state's label
+		bits and the input bit match its sequence's source
+		and condition, and the output layer writes that
+		sequence's target state and operation. The table's
+		domain should be closed first, since inputs that match
+		no sequence decode to an arbitrary (all-zero) output.
+
+		:param table: BinaryTable, The table to compile.
+		:return: Network
+
+		:raises: ValueError, If the table is empty.
+
+		"""
+
+		if table.is_empty():
+			raise ValueError("Unable to Compile an Empty Table.")
+
+		entries = list(table.entries)
+		label_size = len(entries[0].source.identity) \
+			- (StateSequence.MIN_STATE_SEQUENCE_LEN - 3)
+		inputs, outputs = label_size + 4, label_size + 5
+		w0 = np.zeros((inputs, len(entries)))
+		b0 = np.zeros(len(entries))
+		w1 = np.zeros((len(entries), outputs))
+
+		for j, entry in enumerate(entries):
+			identity = entry.source.identity
+			pattern = [identity.bit(index=i) for i in range(1, len(identity) - 2)]
+			pattern.append(entry.condition.bit(index=0))
+			rows = list(range(1, label_size + 1)) + [inputs - 1]
+
+			for row, bit in zip(rows, pattern):
+				w0[row, j] = 1.0 if bit == 1 else -1.0
+
+			b0[j] = 1.0 - sum(pattern)
+			w1[j] = [entry.target.bit(index=i) for i in range(0, outputs)]
+
+		gain = Network.COMPILED_GAIN
+		return Network(
+			weights=[w0, w1 * gain],
+			biases=[b0, np.full(outputs, -0.5 * gain)],
+			label_size=label_size,
+			initial=table.initial_sequence().to_state(),
+			activation="relu"
+		)
+
+	@property
+	def weights(self) -> List[np.ndarray]:
+		"""
+		:obj:`List[np.ndarray]` The weight matrix of
+		each layer, shaped (inputs x outputs).
+
+		"""
+
+		return self.__weights
+
+	@property
+	def biases(self) -> List[np.ndarray]:
+		"""
+		:obj:`List[np.ndarray]` The bias vector
+		of each layer.
+
+		"""
+
+		return self.__biases
+
+	@property
+	def label_size(self) -> int:
+		"""
+		:obj:`int` The size (in bits) of the state
+		labels the network reads and writes.
+
+		"""
+
+		return self.__label_size
+
+	@property
+	def input_size(self) -> int:
+		"""
+		:obj:`int` The number of input features (state
+		identity bits and the input bit).
+
+		"""
+
+		return self.label_size + 4
+
+	@property
+	def output_size(self) -> int:
+		"""
+		:obj:`int` The number of output bits (state
+		identity bits and the operation bits).
+
+		"""
+
+		return self.label_size + 5
+
+	@property
+	def initial(self) -> State:
+		"""
+		:obj:`State` The initial state of the machine
+		(returned when no state is provided).
+
+		Set the initial state.
+
+		:raises: ValueError, If no initial state is provided.
+
+		"""
+
+		return self.__initial
+
+	@initial.setter
+	def initial(self, initial: State) -> None:
+		if initial is None:
+			raise ValueError("No Initial State Specified.")
+
+		self.__initial = initial
+
+	@property
+	def activation(self) -> str:
+		"""
+		:obj:`str` The hidden layer activation
+		function (tanh or relu).
+
+		Set the activation function.
+
+		:raises: ValueError, If the activation
+			function is not supported.
+
+		"""
+
+		return self.__activation
+
+	@activation.setter
+	def activation(self, activation: str) -> None:
+		if activation not in self.ACTIVATIONS:
+			raise ValueError("Invalid Activation:", activation)
+
+		self.__activation = activation
@@ -0,0 +1,496 @@
+#!/usr/bin/env python
+
+"""
+
+Trainer Docstring
+
+The Trainer class fits a network controller's weights
+to the processed IOPair sequences with mini-batch
+gradient descent (with momentum). The forward and
+backward passes are evaluated over every transition
+of a batch at once, the weights are checkpointed on
+each improvement, and training stops early once the
+held-out loss stops improving.
+
+"""
+
+import queue
+import threading
+import numpy as np
+from typing import List, Tuple, Dict, Iterable
+from lib.controllers.table.Word import Word
+from lib.data.loader.BatchLoader import BatchLoader
+from lib.controllers.binary_table.Bit import Bit
+from lib.controllers.network.Network import Network
+from lib.utilities.FinalProperty import FinalProperty
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+__class__ = "Trainer"
+
+
+class Trainer(object):
+	"""
+	Trainer
+
+	Attributes:
+		network (:obj:`Network`): The network being trained.
+		learning_rate (:obj:`float`): The gradient step size.
+		momentum (:obj:`float`): The momentum coefficient.
+		epochs (:obj:`int`): The maximum number of epochs.
+		patience (:obj:`int`): The number of epochs without
+			improvement before training stops early.
+		checkpoint (:obj:`str`): The file path the best weights
+			are saved to on each improvement (if any).
+
+	A processed sequence's IOPair rows are the input bit
+	and the output bits of each transition, so the present
+	state of a transition is the state of the previous row's
+	output (and the network's initial state for the first
+	row). Each batch of sequences is unrolled into one
+	(transitions x features) matrix.
+
+	"""
+
+	"""
+	The minimum decrease in the monitored loss
+	that counts as an improvement.
+
+	"""
+	MIN_DELTA = FinalProperty[float](1e-6)
+
+	"""
+	The probability clipping bound used when
+	computing the cross-entropy loss.
+
+	"""
+	EPSILON = FinalProperty[float](1e-12)
+
+	def __init__(
+			self,
+			network: Network,
+			learning_rate: float = 0.5,
+			momentum: float = 0.9,
+			epochs: int = 500,
+			patience: int = 20,
+			checkpoint: str = None):
+		"""
+		Trainer Constructor.
+
+		:param network: Network, The network to train.
+		:param learning_rate: float, The gradient step size.
+		:param momentum: float, The momentum coefficient.
+		:param epochs: int, The maximum number of epochs.
+		:param patience: int, The number of epochs without
+			improvement before training stops early.
+		:param checkpoint: str, The file path the best weights
+			are saved to on each improvement (if any).
+
+		:raises: ValueError, If the learning rate, momentum,
+			epochs, or patience are invalid.
+
+		"""
+
+		if learning_rate <= 0.0:
+			raise ValueError("Invalid Learning Rate:", learning_rate)
+		elif not 0.0 <= momentum < 1.0:
+			raise ValueError("Invalid Momentum:", momentum)
+		elif epochs < 1:
+			raise ValueError("Invalid Epochs:", epochs)
+		elif patience < 1:
+			raise ValueError("Invalid Patience:", patience)
+
+		self.__network = network
+		self.__learning_rate = learning_rate
+		self.__momentum = momentum
+		self.__epochs = epochs
+		self.__patience = patience
+		self.__checkpoint = checkpoint
+		self.__velocities = None
+		self.__reset()
+
+	def examples(self, inputs: np.ndarray, outputs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+		"""
+		Unroll a batch of sequences into its transitions'
+		(features, targets) matrices.
+
+		:param inputs: np.ndarray, The (batch x window x 1)
+			input bits.
+		:param outputs: np.ndarray, The (batch x window x
+			output size) output bits.
+		:return: Tuple[np.ndarray, np.ndarray]
+
+		:raises: ValueError, If the output bits do not
+			match the network's output size.
+
+		"""
+
+		if outputs.shape[-1] != self.network.output_size:
+			raise ValueError("Invalid Output Size:", outputs.shape[-1])
+
+		n, window = outputs.shape[:2]
+		width = self.network.input_size - 1
+		initial = self.network.encode(
+			state=self.network.initial,
+			word=Word.intern(name=Bit.BINARY_LABEL_0)
+		)[0, :width]
+		features = np.empty((n, window, width + 1), dtype=np.float64)
+		features[:, 0, :width] = initial
+		features[:, 1:, :width] = outputs[:, :-1, :width]
+		features[:, :, width] = inputs[:, :, -1]
+		return (
+			features.reshape(-1, width + 1),
+			np.asarray(outputs, dtype=np.float64).reshape(-1, self.network.output_size)
+		)
+
+	def gradients(
+			self,
+			features: np.ndarray,
+			targets: np.ndarray) -> Tuple[float, List[np.ndarray], List[np.ndarray]]:
+		"""
+		Compute the mean (per transition) binary cross-entropy
+		of the network's outputs and its gradients with respect
+		to each layer's weights and biases.
+
+		:param features: np.ndarray, The (n x input size) features.
+		:param targets: np.ndarray, The (n x output size) targets.
+		:return: Tuple[float, List[np.ndarray], List[np.ndarray]],
+			The loss and the weight and bias gradients.
+
+		"""
+
+		weights, biases = self.network.weights, self.network.biases
+		activations = [features]
+
+		for w, b in zip(weights[:-1], biases[:-1]):
+			z = activations[-1] @ w + b
+			activations.append(np.tanh(z) if self.network.activation == "tanh" else np.maximum(z, 0.0))
+
+		z = activations[-1] @ weights[-1] + biases[-1]
+		p = 1.0 / (1.0 + np.exp(-np.clip(z, -500.0, 500.0)))
+		loss = self.__loss(probabilities=p, targets=targets)
+
+		# the sigmoid and cross-entropy derivatives cancel
+		delta = (p - targets) / len(features)
+		d_weights, d_biases = [None] * len(weights), [None] * len(biases)
+
+		for i in reversed(range(0, len(weights))):
+			d_weights[i] = activations[i].T @ delta
+			d_biases[i] = delta.sum(axis=0)
+
+			if i > 0:
+				delta = delta @ weights[i].T
+
+				if self.network.activation == "tanh":
+					delta *= 1.0 - activations[i] ** 2
+				else:
+					delta *= activations[i] > 0.0
+
+		return loss, d_weights, d_biases
+
+	def step(self, features: np.ndarray, targets: np.ndarray) -> float:
+		"""
+		Take one (momentum) gradient step over the
+		batch of transitions.
+
+		:param features: np.ndarray, The (n x input size) features.
+		:param targets: np.ndarray, The (n x output size) targets.
+		:return: float, The loss before the step.
+
+		"""
+
+		loss, d_weights, d_biases = self.gradients(features=features, targets=targets)
+		params = self.network.weights + self.network.biases
+
+		if self.__velocities is None:
+			self.__velocities = [np.zeros_like(p) for p in params]
+
+		updated = list()
+
+		for p, g, v in zip(params, d_weights + d_biases, self.__velocities):
+			v *= self.momentum
+			v -= self.learning_rate * g
+			updated.append(p + v)
+
+		layers = len(self.network.weights)
+		self.network.set_parameters(weights=updated[:layers], biases=updated[layers:])
+		return loss
+
+	def evaluate(self, loader: Iterable) -> Dict[str, float]:
+		"""
+		Evaluate the network over one epoch of the loader,
+		returning the mean loss, the fraction of correct
+		output bits, and the fraction of transitions with
+		every output bit correct.
+
+		:param loader: Iterable, The evaluation (inputs, outputs)
+			batches (e.g. a BatchLoader).
+		:return: Dict[str, float]
+
+		"""
+
+		loss, bits, rows, n = 0.0, 0, 0, 0
+
+		for inputs, outputs in loader:
+			features, targets = self.examples(inputs=inputs, outputs=outputs)
+			p = self.network.forward(features=features)
+			correct = (p > 0.5) == (targets > 0.5)
+			loss += self.__loss(probabilities=p, targets=targets) * len(features)
+			bits += int(correct.sum())
+			rows += int(correct.all(axis=1).sum())
+			n += len(features)
+
+		n = max(n, 1)
+		return {
+			"loss": loss / n,
+			"bit_accuracy": bits / (n * self.network.output_size),
+			"accuracy": rows / n
+		}
+
+	def fit(self, train: BatchLoader, validation: Iterable = None) -> List[Dict[str, float]]:
+		"""
+		Train the network until its held-out (validation)
+		loss, or its training loss without a validation
+		split, stops improving for the patience's number
+		of epochs. The best weights are checkpointed on
+		each improvement and restored once training stops.
+
+		:param train: BatchLoader, The training batches.
+		:param validation: Iterable, The held-out batches
+			(e.g. a BatchLoader).
+		:return: List[Dict[str, float]], The per epoch history.
+
+		"""
+
+		history = list()
+		self.__reset()
+
+		for epoch in range(0, self.epochs):
+			losses, n = 0.0, 0
+
+			for inputs, outputs in train:
+				features, targets = self.examples(inputs=inputs, outputs=outputs)
+				losses += self.step(features=features, targets=targets) * len(features)
+				n += len(features)
+
+			record = {"epoch": epoch, "loss": losses / max(n, 1)}
+			history.append(record)
+
+			if self.__monitor(record=record, validation=validation):
+				break
+
+		self.__restore()
+		return history
+
+	def fit_online(
+			self,
+			sequences: queue.Queue,
+			batch_size: int = 2048,
+			validation: Iterable = None,
+			interval: int = 50,
+			stop: threading.Event = None) -> List[Dict[str, float]]:
+		"""
+		Train the network on executions consumed from a
+		queue as they are produced (see QueueLog), until the
+		producer puts None on the queue or the held-out loss
+		stops improving for the patience's number of checks.
+		Each execution is a (records x bits) bit array, and
+		a gradient step is taken once the consumed executions
+		hold a batch's number of transitions. The network is
+		checked every interval steps (and at the end), with
+		the best weights checkpointed and finally restored,
+		and the epochs limit the number of checks.
+
+		:param sequences: queue.Queue, The executions' queue.
+		:param batch_size: int, The number of transitions
+			per gradient step.
+		:param validation: Iterable, The held-out batches.
+		:param interval: int, The number of steps per check.
+		:param stop: threading.Event, Set once training stops
+			so the producer stops putting executions.
+		:return: List[Dict[str, float]], The per check history.
+
+		:raises: ValueError, If the batch size or interval
+			is invalid.
+
+		"""
+
+		if batch_size < 1:
+			raise ValueError("Invalid Batch Size:", batch_size)
+		elif interval < 1:
+			raise ValueError("Invalid Interval:", interval)
+
+		history, pending, size = list(), list(), 0
+		consumed, steps, losses, n = 0, 0, 0.0, 0
+		self.__reset()
+
+		try:
+			while len(history) < self.epochs:
+				sequence = sequences.get()
+
+				if isinstance(sequence, BaseException):
+					raise sequence
+				elif sequence is not None:
+					consumed += 1
+					pending.append(self.examples(
+						inputs=sequence[None, :, :1],
+						outputs=sequence[None, :, 1:]
+					))
+					size += len(sequence)
+
+					if size < batch_size:
+						continue
+
+				if size > 0:
+					features = np.concatenate([f for f, _ in pending])
+					targets = np.concatenate([t for _, t in pending])
+					losses += self.step(features=features, targets=targets) * len(features)
+					n += len(features)
+					steps += 1
+					pending, size = list(), 0
+
+				if sequence is None or steps % interval == 0:
+					record = {
+						"step": steps,
+						"sequences": consumed,
+						"loss": losses / max(n, 1)
+					}
+					history.append(record)
+					losses, n = 0.0, 0
+
+					if self.__monitor(record=record, validation=validation) or sequence is None:
+						break
+		finally:
+			if stop is not None:
+				stop.set()
+
+		self.__restore()
+		return history
+
+	def __reset(self) -> None:
+		"""
+		Reset the early stopping state.
+
+		:return: None
+
+		"""
+
+		self.__best, self.__wait = np.inf, 0
+		self.__best_parameters = None
+
+	def __monitor(self, record: Dict[str, float], validation: Iterable = None) -> bool:
+		"""
+		Add the held-out metrics to the history record and
+		checkpoint the weights if the monitored loss improved.
+
+		:param record: Dict[str, float], The history record.
+		:param validation: Iterable, The held-out batches.
+		:return: bool, Whether training should stop.
+
+		"""
+
+		if validation is not None:
+			for k, v in self.evaluate(loader=validation).items():
+				record["validation_" + k] = v
+
+		monitored = record.get("validation_loss", record["loss"])
+
+		if monitored < self.__best - self.MIN_DELTA:
+			self.__best, self.__wait = monitored, 0
+			self.__best_parameters = (
+				[w.copy() for w in self.network.weights],
+				[b.copy() for b in self.network.biases]
+			)
+
+			if self.checkpoint is not None:
+				self.network.save(filepath=self.checkpoint)
+
+			return False
+
+		self.__wait += 1
+		return self.__wait >= self.patience
+
+	def __restore(self) -> None:
+		"""
+		Restore the best checkpointed weights.
+
+		:return: None
+
+		"""
+
+		if self.__best_parameters is not None:
+			self.network.set_parameters(
+				weights=self.__best_parameters[0],
+				biases=self.__best_parameters[1]
+			)
+
+	def __loss(self, probabilities: np.ndarray, targets: np.ndarray) -> float:
+		"""
+		Return the mean (per transition) binary
+		cross-entropy of the output probabilities.
+
+		:param probabilities: np.ndarray, The output probabilities.
+		:param targets: np.ndarray, The target bits.
+		:return: float
+
+		"""
+
+		p = np.clip(probabilities, self.EPSILON, 1.0 - self.EPSILON)
+		loss = -(targets * np.log(p) + (1.0 - targets) * np.log(1.0 - p))
+		return float(loss.sum() / max(len(p), 1))
+
+	@property
+	def network(self) -> Network:
+		"""
+		:obj:`Network` The network being trained.
+
+		"""
+
+		return self.__network
+
+	@property
+	def learning_rate(self) -> float:
+		"""
+		:obj:`float` The gradient step size.
+
+		"""
+
+		return self.__learning_rate
+
+	@property
+	def momentum(self) -> float:
+		"""
+		:obj:`float` The momentum coefficient.
+
+		"""
+
+		return self.__momentum
+
+	@property
+	def epochs(self) -> int:
+		"""
+		:obj:`int` The maximum number of epochs.
+
+		"""
+
+		return self.__epochs
+
+	@property
+	def patience(self) -> int:
+		"""
+		:obj:`int` The number of epochs without
+		improvement before training stops early.
+
+		"""
+
+		return self.__patience
+
+	@property
+	def checkpoint(self) -> str:
+		"""
+		:obj:`str` The file path the best weights are
+		saved to on each improvement (if any).
+
+		"""
+
+		return self.__checkpoint
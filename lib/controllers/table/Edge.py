@@ -34,6 +34,8 @@ class Edge(object):
 
 	"""
 
+	__slots__ = ("__condition", "__action", "__source", "__target")
+
 	def __init__(self, condition: Word, source: State, target: State, action: Action = None):
 		"""
 		Edge Constructor.
@@ -107,10 +109,7 @@ class Edge(object):
 
 		"""
 
-		return hash(" ".join([
-			repr(self.source),
-			str(self.condition)
-		]))
+		return hash((self.source, self.condition))
 
 	def to_binary(self):
 		"""
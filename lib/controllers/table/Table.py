@@ -12,7 +12,6 @@ the next target state.
 """
 
 import math
-import copy
 from lib.State import State
 from typing import Set, List, Tuple
 from lib.controls.Write import Write
@@ -214,8 +213,8 @@ class Table(Controller):
 
 		for s in states:
 			for w in vocab:
-				tmp_s = State(label=s)
-				tmp_w = Word(name=w)
+				tmp_s = State.intern(label=s)
+				tmp_w = Word.intern(name=w)
 				e = Edge(source=tmp_s, condition=tmp_w, target=tmp_s)
 
 				if e not in self.entries:
@@ -239,7 +238,7 @@ class Table(Controller):
 
 		for indef in indefinites:
 			labeler += 1
-			s = State(
+			s = State.intern(
 				label=labeler,
 				terminal=True,
 				op_status=1
@@ -285,13 +284,28 @@ class Table(Controller):
 		[states.append(e.source) for e in self.entries]
 		[states.append(e.target) for e in self.entries]
 		states = sorted(list(set(states)))
+		index = dict([(s.label, i) for i, s in enumerate(states)])
 		rebased_edges = list()
 
+		# states may be shared (interned), so the rebased
+		# edges are given new states rather than relabeled
 		for edge in self.entries:
-			n = copy.deepcopy(edge)
-			n.source.label = states.index(n.source)
-			n.target.label = states.index(n.target)
-			rebased_edges.append(n)
+			rebased_edges.append(Edge(
+				condition=edge.condition,
+				action=edge.action,
+				source=State.intern(
+					label=index[edge.source.label],
+					terminal=edge.source.terminal,
+					root=edge.source.root,
+					op_status=edge.source.op_status
+				),
+				target=State.intern(
+					label=index[edge.target.label],
+					terminal=edge.target.terminal,
+					root=edge.target.root,
+					op_status=edge.target.op_status
+				)
+			))
 
 		self.__entries = rebased_edges
 
@@ -356,7 +370,7 @@ class Table(Controller):
 					)
 
 			if not found and source.root:
-				w = Word(name=condition.values[1].value)
+				w = Word.intern(name=condition.values[1].value)
 				source.operation = Write(word=w).to_binary()
 				controls.append(
 					ControlSequence(
@@ -87,8 +87,8 @@ class Vocabulary(object):
 
 		"""
 
-		if self.__contains__(item=Word(name=key)):
-			self.words.remove(Word(name=key))
+		if self.__contains__(item=Word.intern(name=key)):
+			self.words.remove(Word.intern(name=key))
 
 	@property
 	def words(self) -> Set[Word]:
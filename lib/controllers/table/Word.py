@@ -27,6 +27,14 @@ class Word(object):
 
 	"""
 
+	__slots__ = ("__name",)
+
+	"""
+	The interned words, keyed by name (see intern).
+
+	"""
+	__interned = dict()
+
 	def __init__(self, name: str):
 		"""
 		Word Constructor.
@@ -58,7 +66,7 @@ class Word(object):
 
 		"""
 
-		return self.name == other.name
+		return self is other or self.name == other.name
 
 	def __str__(self) -> str:
 		"""
@@ -82,6 +90,29 @@ class Word(object):
 
 		return self.name
 
+	@staticmethod
+	def intern(name: str) -> 'Word':
+		"""
+		Return the single shared word with the name,
+		creating it on first use. Interned words are
+		shared, so they must not be modified.
+
+		:param name: str, The name of the word.
+		:return: Word
+
+		:raises: ValueError on invalid word
+			definition.
+
+		"""
+
+		word = Word.__interned.get(name)
+
+		if word is None:
+			word = Word(name=name)
+			Word.__interned[name] = word
+
+		return word
+
 	def to_binary(self) -> BinarySequence:
 		"""
 		Convert the word into a binary sequence.
@@ -96,7 +127,7 @@ class Word(object):
 			msg = "Unable to Cast {} to Binary Sequence."
 			raise ValueError(msg.format(self.name))
 
-		return BinarySequence(values=[Bit(value=self.name)])
+		return BinarySequence.from_key(value=int(self.name), length=1)
 
 	@property
 	def name(self) -> str:
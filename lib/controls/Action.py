@@ -29,6 +29,8 @@ class Action(abc.ABC):
 
 	"""
 
+	__slots__ = ()
+
 	def __init__(self):
 		"""
 		Action Constructor.
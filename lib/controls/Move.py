@@ -48,6 +48,8 @@ class Move(Action):
 	"""
 	DIRECTION_RIGHT = FinalProperty[str]("R")
 
+	__slots__ = ("__direction",)
+
 	def __init__(self, direction: str):
 		"""
 		Move Constructor.
@@ -111,10 +113,10 @@ class Move(Action):
 		if self.direction == self.DIRECTION_LEFT:
 			param_code = Bit.BINARY_LABEL_0
 
-		return BinarySequence(values=[
-			Bit(value=self.OP_CODE),
-			Bit(value=param_code)
-		])
+		return BinarySequence.from_key(
+			value=int(self.OP_CODE) << 1 | int(param_code),
+			length=2
+		)
 
 	@property
 	def direction(self) -> str:
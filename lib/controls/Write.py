@@ -37,6 +37,8 @@ class Write(Action):
 	"""
 	OP_CODE = FinalProperty[str]("1")
 
+	__slots__ = ("__word",)
+
 	def __init__(self, word: Word):
 		"""
 		Write Constructor.
@@ -86,10 +88,10 @@ class Write(Action):
 			msg = "Unable to Cast {} to Binary Sequence."
 			raise ValueError(msg.format(self.word.name))
 
-		return BinarySequence(values=[
-			Bit(value=self.OP_CODE),
-			Bit(value=self.word.name)
-		])
+		return BinarySequence.from_key(
+			value=int(self.OP_CODE) << 1 | int(self.word.name),
+			length=2
+		)
 
 	def exec(self, head: Head) -> None:
 		"""
@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+
+"""
+
+BatchLoader Docstring
+
+The Batch Loader class feeds the processed training
+data (the consolidated bit tensor of IOPair sequences)
+to a learner as shuffled mini-batches, decoding the
+next batches on a background thread while the current
+batch is being consumed.
+
+"""
+
+import os
+import queue
+import threading
+import numpy as np
+from typing import Iterator, Tuple
+from lib.utilities.FinalProperty import FinalProperty
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+__class__ = "BatchLoader"
+
+
+class BatchLoader(object):
+	"""
+	BatchLoader
+
+	Attributes:
+		data (:obj:`np.ndarray`): The (examples x window x bits)
+			bit tensor of encoded IOPair sequences.
+		indices (:obj:`np.ndarray`): The example rows of the
+			data tensor to draw batches from.
+		batch_size (:obj:`int`): The number of sequences
+			per mini-batch.
+		input_bits (:obj:`int`): The number of leading bits
+			of each IOPair that encode its input.
+		shuffle (:obj:`bool`): Whether to shuffle the
+			sequences every epoch.
+		prefetch (:obj:`int`): The number of decoded batches
+			to queue ahead of the consumer.
+
+	"""
+
+	"""
+	Seconds between checks for a stopped consumer
+	while waiting on a full prefetch queue.
+
+	"""
+	POLL_INTERVAL = FinalProperty[float](0.1)
+
+	def __init__(
+			self,
+			data: np.ndarray,
+			batch_size: int = 32,
+			indices: np.ndarray = None,
+			input_bits: int = 1,
+			shuffle: bool = True,
+			prefetch: int = 2,
+			drop_last: bool = False,
+			dtype: type = np.float32,
+			seed: int = None):
+		"""
+		BatchLoader Constructor.
+
+		:param data: np.ndarray, The (examples x window x bits)
+			bit tensor of encoded IOPair sequences.
+		:param batch_size: int, The number of sequences
+			per mini-batch.
+		:param indices: np.ndarray, The example rows of the
+			data tensor to draw batches from (defaults to
+			every row).
+		:param input_bits: int, The number of leading bits
+			of each IOPair that encode its input.
+		:param shuffle: bool, Whether to shuffle the
+			sequences every epoch.
+		:param prefetch: int, The number of decoded batches
+			to queue ahead of the consumer.
+		:param drop_last: bool, Whether to drop the last
+			batch of an epoch if it is incomplete.
+		:param dtype: type, The dtype of the yielded arrays.
+		:param seed: int, The shuffling seed.
+
+		:raises: ValueError, If the data is not a 3-d tensor
+			or the batch size or prefetch depth is invalid.
+
+		"""
+
+		if data.ndim != 3:
+			raise ValueError("Invalid Data Shape:", data.shape)
+		elif batch_size < 1:
+			raise ValueError("Invalid Batch Size:", batch_size)
+		elif prefetch < 1:
+			raise ValueError("Invalid Prefetch Depth:", prefetch)
+
+		self.__data = data
+		self.__indices = np.arange(len(data)) if indices is None \
+			else np.asarray(indices, dtype=np.int64)
+		self.__batch_size = batch_size
+		self.__input_bits = input_bits
+		self.__shuffle = shuffle
+		self.__prefetch = prefetch
+		self.__drop_last = drop_last
+		self.__dtype = dtype
+		self.__random = np.random.default_rng(seed)
+
+	def __len__(self) -> int:
+		"""
+		Return the number of batches per epoch.
+
+		:return: int
+
+		"""
+
+		if self.__drop_last:
+			return len(self.indices) // self.batch_size
+
+		return -(-len(self.indices) // self.batch_size)
+
+	def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+		"""
+		Iterate over one epoch of mini-batches. Each
+		batch is an (inputs, outputs) pair of arrays of
+		shape (batch x window x input bits) and
+		(batch x window x output bits).
+
+		:return: Iterator[Tuple[np.ndarray, np.ndarray]]
+
+		"""
+
+		order = self.__random.permutation(self.indices) if self.shuffle \
+			else self.indices.copy()
+		batches = queue.Queue(maxsize=self.prefetch)
+		stop = threading.Event()
+		worker = threading.Thread(
+			target=self.__produce,
+			args=(order, batches, stop),
+			daemon=True
+		)
+		worker.start()
+
+		try:
+			while True:
+				batch = batches.get()
+
+				if batch is None:
+					break
+				elif isinstance(batch, BaseException):
+					raise batch
+
+				yield batch
+		finally:
+			stop.set()
+			worker.join()
+
+	def decode(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+		"""
+		Gather the example rows from the data tensor and
+		split them into (inputs, outputs) arrays.
+
+		:param rows: np.ndarray, The example rows to decode.
+		:return: Tuple[np.ndarray, np.ndarray]
+
+		"""
+
+		# read the rows in storage order for memory-mapped data
+		batch = np.asarray(self.__data[np.sort(rows)], dtype=self.__dtype)
+		return batch[:, :, :self.input_bits], batch[:, :, self.input_bits:]
+
+	@staticmethod
+	def load(processed_path: str, operation: str, **kwargs) -> 'BatchLoader':
+		"""
+		Build a loader over the operation's consolidated
+		bit tensor (<operation>.npy, see the preprocess
+		script's --consolidate option), memory-mapped
+		rather than read into memory.
+
+		:param processed_path: str, The processed data directory.
+		:param operation: str, The operation name.
+		:param kwargs: The BatchLoader constructor arguments.
+		:return: BatchLoader
+
+		"""
+
+		path = os.path.join(processed_path, operation + ".npy")
+		return BatchLoader(data=np.load(path, mmap_mode="r"), **kwargs)
+
+	def __produce(self, order: np.ndarray, batches: queue.Queue, stop: threading.Event) -> None:
+		"""
+		Decode the epoch's batches onto the queue, ending
+		with None (or the raised exception).
+
+		:param order: np.ndarray, The epoch's row order.
+		:param batches: queue.Queue, The prefetch queue.
+		:param stop: threading.Event, Set when the consumer
+			stops iterating.
+		:return: None
+
+		"""
+
+		try:
+			for i in range(0, len(self)):
+				batch = self.decode(
+					rows=order[i * self.batch_size:(i + 1) * self.batch_size]
+				)
+
+				if not self.__put(batches=batches, item=batch, stop=stop):
+					return
+		except Exception as e:
+			self.__put(batches=batches, item=e, stop=stop)
+			return
+
+		self.__put(batches=batches, item=None, stop=stop)
+
+	def __put(self, batches: queue.Queue, item: object, stop: threading.Event) -> bool:
+		"""
+		Put the item on the queue unless the consumer
+		stops iterating first.
+
+		:param batches: queue.Queue, The prefetch queue.
+		:param item: object, The item to queue.
+		:param stop: threading.Event, Set when the consumer
+			stops iterating.
+		:return: bool, Whether the item was queued.
+
+		"""
+
+		while not stop.is_set():
+			try:
+				batches.put(item, timeout=self.POLL_INTERVAL)
+				return True
+			except queue.Full:
+				pass
+
+		return False
+
+	@property
+	def data(self) -> np.ndarray:
+		"""
+		:obj:`np.ndarray` The (examples x window x bits)
+		bit tensor of encoded IOPair sequences.
+
+		"""
+
+		return self.__data
+
+	@property
+	def indices(self) -> np.ndarray:
+		"""
+		:obj:`np.ndarray` The example rows of the
+		data tensor to draw batches from.
+
+		"""
+
+		return self.__indices
+
+	@property
+	def batch_size(self) -> int:
+		"""
+		:obj:`int` The number of sequences
+		per mini-batch.
+
+		"""
+
+		return self.__batch_size
+
+	@property
+	def input_bits(self) -> int:
+		"""
+		:obj:`int` The number of leading bits of
+		each IOPair that encode its input.
+
+		"""
+
+		return self.__input_bits
+
+	@property
+	def shuffle(self) -> bool:
+		"""
+		:obj:`bool` Whether to shuffle the
+		sequences every epoch.
+
+		"""
+
+		return self.__shuffle
+
+	@property
+	def prefetch(self) -> int:
+		"""
+		:obj:`int` The number of decoded batches
+		to queue ahead of the consumer.
+
+		"""
+
+		return self.__prefetch
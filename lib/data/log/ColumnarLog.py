@@ -0,0 +1,462 @@
+#!/usr/bin/env python
+
+"""
+
+ColumnarLog Docstring
+
+The Columnar Log class is a machine log backend
+that stores each logged input/output pair as a
+single integer row (the id of the row's distinct
+edge) in a compact array instead of as a tree of
+IOPair, Input, Output, State, Action, and Word
+objects. IOPair views are built on demand.
+
+"""
+
+import math
+import array
+import bisect
+import numpy as np
+from typing import List, Tuple, Iterator
+from lib.State import State
+from lib.controls.Action import Action
+from lib.controllers.Input import Input
+from lib.controllers.Output import Output
+from lib.controllers.IOPair import IOPair
+from lib.controllers.table.Word import Word
+from lib.data.log.MachineLog import MachineLog
+from lib.utilities.FinalProperty import FinalProperty
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+__class__ = "ColumnarLog"
+
+
+class ColumnarLog(MachineLog):
+	"""
+	ColumnarLog
+
+	Attributes:
+		records (:obj:`List[IOPair]`): The list of input-
+			output pairs logged during the duration of
+			program execution (built on demand).
+		codes (:obj:`np.ndarray`): The edge id of each
+			row, in timestep order.
+		edge_count (:obj:`int`): The number of distinct
+			edges in the log's edge table.
+		nbytes (:obj:`int`): The number of bytes held
+			by the log's row arrays.
+
+	Each distinct edge (input word, output state, and
+	action) is stored once in an edge table; a row only
+	holds its edge's id, in 2 bytes (4 bytes once there
+	are more than 65536 distinct edges). Timesteps are
+	not stored while they are contiguous (the row's
+	timestep is the first timestep plus its index); a
+	timestep column is only materialized once a gap is
+	logged or a record is removed from the middle.
+
+	Edges are told apart by the input word's name, the
+	state's label and flags, and the action's op code and
+	parameter (its direction or word), so actions of any
+	loaded Move/Write class are encoded alike.
+
+	"""
+
+	"""
+	Array type code of the row ids while there
+	are few enough edges to fit in 2 bytes.
+
+	"""
+	NARROW_CODE = FinalProperty[str]("H")
+
+	"""
+	Array type code of the row ids once the
+	edges no longer fit in 2 bytes.
+
+	"""
+	WIDE_CODE = FinalProperty[str]("I")
+
+	"""
+	The maximum number of (word, state, action)
+	object identities remembered (see log) before
+	the identity cache is cleared.
+
+	"""
+	IDENTITY_CACHE_SIZE = FinalProperty[int](4096)
+
+	def __init__(self, records: List[IOPair] = None):
+		"""
+		ColumnarLog Constructor.
+
+		:param records: List[IOPair], The list of
+			machine log i/o records.
+
+		"""
+
+		self.clear()
+		MachineLog.__init__(self, records=records)
+
+	def __len__(self) -> int:
+		"""
+		Return the number of records in the
+		machine's log.
+
+		:return: int
+
+		"""
+
+		return len(self.__rows)
+
+	def log(self, record: IOPair) -> None:
+		"""
+		Log the record passed into this function
+		into the machine's record log. Appending the
+		next contiguous timestep is O(1) (amortized);
+		other timesteps are located with a binary search.
+
+		:param record: IOPair, Record to add.
+		:return: None
+
+		:raises: ValueError, If the record is incomplete
+			or conflicts with a logged record.
+
+		"""
+
+		input, output = record.input, record.output
+
+		if input is None or output is None:
+			raise ValueError("Record Missing I/O Component.")
+
+		timestep = input.timestep
+
+		if timestep != output.timestep:
+			raise ValueError("Timestep Mismatch in I/O.")
+
+		# the objects are pinned by the cache, so their ids stay unique
+		identity = (id(input.word), id(output.state), id(output.action))
+		edge = self.__identities.get(identity)
+		contiguous = self.__timesteps is None and timestep == self.__start + len(self.__rows)
+		row = None
+
+		if not contiguous:
+			row = self.__locate(timestep=timestep, word=input.word)
+
+			if row is None:
+				return
+
+		if edge is None:
+			edge = self.__encode_edge(word=input.word, state=output.state, action=output.action)
+
+			if len(self.__identities) >= self.IDENTITY_CACHE_SIZE:
+				self.__identities, self.__pinned = dict(), list()
+
+			self.__identities[identity] = edge
+			self.__pinned.append((input.word, output.state, output.action))
+
+		if contiguous:
+			self.__rows.append(edge)
+		else:
+			self.__insert(row=row, timestep=timestep, edge=edge)
+
+	def remove(self, record: IOPair) -> None:
+		"""
+		Remove the IOPair from the machine's log.
+
+		:param record: IOPair, The removed record.
+		:return: None
+
+		"""
+
+		timestep, size = record.input.timestep, len(self.__rows)
+		row = self.__find(timestep=timestep)
+
+		if row >= size or self.__timestep(index=row) != timestep \
+				or self.__edges[self.__rows[row]][0].name != record.input.word.name:
+			return
+
+		label = self.__edges[self.__rows[row]][1].label
+
+		if self.__timesteps is None and row == 0:
+			self.__start += 1
+		elif self.__timesteps is None and row < size - 1:
+			self.__materialize()
+
+		if self.__timesteps is not None:
+			del self.__timesteps[row]
+
+		del self.__rows[row]
+
+		if label == self.__max_label:
+			edges = np.unique(self.codes).tolist()
+			self.__max_label = max([self.__edges[e][1].label for e in edges], default=0)
+
+	def clear(self) -> None:
+		"""
+		Clear the record log.
+
+		:return: None
+
+		"""
+
+		self.__rows = array.array(self.NARROW_CODE)
+		self.__timesteps, self.__start = None, 0
+		self.__edges, self.__keys = list(), dict()
+		self.__identities, self.__pinned = dict(), list()
+		self.__max_label = 0
+
+	def record(self, index: int) -> IOPair:
+		"""
+		Build the IOPair view of the record stored
+		at the given row of the log.
+
+		:param index: int, The row to view.
+		:return: IOPair
+
+		:raises: IndexError, If the row is out of range.
+
+		"""
+
+		if index < 0 or index >= len(self.__rows):
+			raise IndexError("Record Index Out of Range.")
+
+		return self.__view(edge=self.__rows[index], timestep=self.__timestep(index=index))
+
+	def lookup(self, timestep: int) -> IOPair:
+		"""
+		Return the IOPair view of the record logged at
+		the timestep (None if the timestep is not logged).
+
+		:param timestep: int, The timestep to look up.
+		:return: IOPair
+
+		"""
+
+		row = self.__find(timestep=timestep)
+
+		if row < len(self.__rows) and self.__timestep(index=row) == timestep:
+			return self.record(index=row)
+
+		return None
+
+	def encode(self, label_size: int) -> Iterator[Tuple[str, str]]:
+		"""
+		Encode the logged records, in order, as their
+		(input, output) bit strings. Each distinct edge
+		is only converted to binary once.
+
+		:param label_size: int, The size (in bits) of
+			the output state labels.
+		:return: Iterator[Tuple[str, str]]
+
+		"""
+
+		encodings = [None] * len(self.__edges)
+
+		for edge in self.__rows:
+			row = encodings[edge]
+
+			if row is None:
+				row = self.encode_record(
+					record=self.__view(edge=edge, timestep=0),
+					label_size=label_size
+				)
+				encodings[edge] = row
+
+			yield row
+
+	@property
+	def records(self) -> List[IOPair]:
+		"""
+		:obj:`List[IOPair]` The list of input-output
+		pairs in timestep order (built on demand).
+
+		"""
+
+		return [self.record(index=i) for i in range(0, len(self.__rows))]
+
+	@property
+	def codes(self) -> np.ndarray:
+		"""
+		:obj:`np.ndarray` The edge id of each row,
+		in timestep order (a view of the rows).
+
+		"""
+
+		return np.frombuffer(self.__rows, dtype=np.dtype(self.__rows.typecode))
+
+	@property
+	def label_size(self) -> int:
+		"""
+		:obj:`int` The state label size to log the
+		IOPair with. Pads the state label if necessary.
+
+		"""
+
+		bits = self.__max_label
+		return int(math.ceil(math.log(max(1, bits), 2)))
+
+	@property
+	def edge_count(self) -> int:
+		"""
+		:obj:`int` The number of distinct edges
+		in the log's edge table.
+
+		"""
+
+		return len(self.__edges)
+
+	@property
+	def nbytes(self) -> int:
+		"""
+		:obj:`int` The number of bytes held by
+		the log's row arrays.
+
+		"""
+
+		size = len(self.__rows) * self.__rows.itemsize
+
+		if self.__timesteps is not None:
+			size += len(self.__timesteps) * self.__timesteps.itemsize
+
+		return size
+
+	def __encode_edge(self, word: Word, state: State, action: Action) -> int:
+		"""
+		Return the id of the record's edge, adding
+		it to the edge table if necessary.
+
+		:param word: Word, The input word.
+		:param state: State, The output state.
+		:param action: Action, The output action.
+		:return: int
+
+		"""
+
+		key = (
+			word.name, state.label, bool(state.root),
+			bool(state.terminal), state.op_status,
+			self.action_key(action=action)
+		)
+		edge = self.__keys.get(key)
+
+		if edge is None:
+			edge = len(self.__edges)
+
+			if edge > np.iinfo(np.dtype(self.__rows.typecode)).max:
+				self.__rows = array.array(self.WIDE_CODE, self.__rows)
+
+			self.__edges.append((word, state, action))
+			self.__keys[key] = edge
+			self.__max_label = max(self.__max_label, state.label)
+
+		return edge
+
+	def __view(self, edge: int, timestep: int) -> IOPair:
+		"""
+		Build the IOPair of the edge at the timestep.
+
+		:param edge: int, The edge's id.
+		:param timestep: int, The record's timestep.
+		:return: IOPair
+
+		"""
+
+		word, state, action = self.__edges[edge]
+		return IOPair(
+			input=Input(word=word, timestep=timestep),
+			output=Output(action=action, state=state, timestep=timestep)
+		)
+
+	def __timestep(self, index: int) -> int:
+		"""
+		Return the timestep of the given row.
+
+		:param index: int, The row.
+		:return: int
+
+		"""
+
+		if self.__timesteps is None:
+			return self.__start + index
+
+		return self.__timesteps[index]
+
+	def __find(self, timestep: int) -> int:
+		"""
+		Return the row holding, or the row that would
+		hold, the specified timestep.
+
+		:param timestep: int, The timestep to locate.
+		:return: int
+
+		"""
+
+		if self.__timesteps is None:
+			return min(max(0, timestep - self.__start), len(self.__rows))
+
+		return bisect.bisect_left(self.__timesteps, timestep)
+
+	def __locate(self, timestep: int, word: Word) -> int:
+		"""
+		Return the row the record of the timestep
+		would be inserted at, or None if the timestep
+		is already logged (with the same input).
+
+		:param timestep: int, The record's timestep.
+		:param word: Word, The record's input word.
+		:return: int
+
+		:raises: ValueError, If the timestep is logged
+			with a different input.
+
+		"""
+
+		row = self.__find(timestep=timestep)
+
+		if row < len(self.__rows) and self.__timestep(index=row) == timestep:
+			if self.__edges[self.__rows[row]][0].name != word.name:
+				raise ValueError("Conflicting I/O for Timestep.")
+
+			return None
+
+		return row
+
+	def __insert(self, row: int, timestep: int, edge: int) -> None:
+		"""
+		Insert the edge's row at the given (free)
+		row and timestep.
+
+		:param row: int, The row to insert at.
+		:param timestep: int, The record's timestep.
+		:param edge: int, The edge's id.
+		:return: None
+
+		"""
+
+		if len(self.__rows) == 0 and self.__timesteps is None:
+			self.__start = timestep
+			self.__rows.append(edge)
+			return
+
+		if self.__timesteps is None and row == 0 and timestep == self.__start - 1:
+			self.__start = timestep
+		elif self.__timesteps is None:
+			self.__materialize()
+
+		if self.__timesteps is not None:
+			self.__timesteps.insert(row, timestep)
+
+		self.__rows.insert(row, edge)
+
+	def __materialize(self) -> None:
+		"""
+		Store the (so far contiguous) timesteps
+		of the rows in a timestep column.
+
+		:return: None
+
+		"""
+
+		stop = self.__start + len(self.__rows)
+		self.__timesteps = array.array("q", range(self.__start, stop))
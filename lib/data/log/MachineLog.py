@@ -9,11 +9,17 @@ data from the Turing Machine..
 
 """
 
+import csv
 import math
-import copy
-import pandas as pd
-from typing import List
+import struct
+import numpy as np
+from collections import Counter
+from typing import List, Tuple, Iterator
+from lib.controls.Move import Move
+from lib.controls.Action import Action
 from lib.controllers.IOPair import IOPair
+from lib.controllers.binary_table.Bit import Bit
+from lib.utilities.FinalProperty import FinalProperty
 
 __author__ = "Dylan Pozorski"
 __project__ = "TuringMachine"
@@ -29,7 +35,39 @@ class MachineLog(object):
 			output pairs logged during the duration of
 			program execution.
 
+	The records are indexed by their timestep so that
+	logging, conflict checks, and removal do not need
+	to scan the entire log. The logged labels are
+	counted, so removing a record only rescans the
+	distinct labels (not the records) when the last
+	record holding the largest label is removed.
+
+	"""
+
+	"""
+	Leading bytes identifying a bit-packed log file.
+
+	"""
+	BIN_MAGIC = FinalProperty[bytes](b"TMLG")
+
+	"""
+	Version of the bit-packed log file layout.
+
+	"""
+	BIN_VERSION = FinalProperty[int](1)
+
+	"""
+	Bit-packed log file header layout: magic, version,
+	label size, input bits, output bits, record count.
+
+	"""
+	BIN_HEADER = FinalProperty[str]("<4sHHHHQ")
+
 	"""
+	The number of records packed per write.
+
+	"""
+	BIN_BLOCK_SIZE = FinalProperty[int](65536)
 
 	def __init__(self, records: List[IOPair] = None):
 		"""
@@ -40,7 +78,8 @@ class MachineLog(object):
 
 		"""
 
-		self.__records = []
+		self.__records = dict()
+		self.__labels, self.__max_label = Counter(), 0
 		records = [] if records is None else records
 
 		for record in records:
@@ -55,13 +94,8 @@ class MachineLog(object):
 
 		"""
 
-		ls = self.label_size
-		records = copy.deepcopy(self.__records)
-
-		for record in records:
-			record.label_size = ls
-
-		return '\n'.join([str(r) for r in records])
+		rows = self.encode(label_size=self.label_size)
+		return '\n'.join([','.join(row) for row in rows])
 
 	def __len__(self) -> int:
 		"""
@@ -89,12 +123,17 @@ class MachineLog(object):
 		elif record.input.timestep != record.output.timestep:
 			raise ValueError("Timestep Mismatch in I/O.")
 
-		if record not in self.__records:
-			for i in self.__records:
-				if i.input.timestep == record.input.timestep:
-					raise ValueError("Conflicting I/O for Timestep.")
+		existing = self.__records.get(record.input.timestep)
+
+		if existing is None:
+			label = record.output.state.label
+			self.__records[record.input.timestep] = record
+			self.__labels[label] += 1
 
-			self.__records.append(record)
+			if label > self.__max_label:
+				self.__max_label = label
+		elif existing != record:
+			raise ValueError("Conflicting I/O for Timestep.")
 
 	def export_csv(self, filepath: str, label_padding: int = 0) -> None:
 		"""
@@ -107,18 +146,200 @@ class MachineLog(object):
 
 		"""
 
-		items = []
 		ls = self.label_size + max(0, label_padding)
-		records = copy.deepcopy(self.__records)
 
-		for record in records:
-			record.label_size = ls
+		with open(filepath, "w", newline="") as f:
+			writer = csv.writer(f, lineterminator="\n")
+			writer.writerow(["input", "output"])
+			writer.writerows(self.encode(label_size=ls))
+
+	def export_bin(self, filepath: str, label_padding: int = 0) -> None:
+		"""
+		Export the machine log as a fixed-width,
+		bit-packed binary file. Each record's input and
+		output bits (as in the .csv export) are packed
+		with numpy.packbits into a whole number of bytes
+		following a small header (see BIN_HEADER), so the
+		rows can be memory-mapped with read_bin.
+
+		:param filepath: str, The file path to export.
+		:param label_padding: int, The number of bits to
+			pad the output state label (prepend w/ 0s).
+		:return: None
+
+		:raises: ValueError, If the records do not encode
+			to the same width.
+
+		"""
+
+		ls = self.label_size + max(0, label_padding)
+		rows = self.encode(label_size=ls)
+		first = next(rows, None)
+		widths = (0, 0) if first is None else (len(first[0]), len(first[1]))
+		header = struct.pack(
+			self.BIN_HEADER, self.BIN_MAGIC, self.BIN_VERSION,
+			ls, widths[0], widths[1], len(self)
+		)
+
+		with open(filepath, "wb") as f:
+			f.write(header)
+			block = [] if first is None else [''.join(first)]
+
+			for row in rows:
+				if len(row[0]) != widths[0] or len(row[1]) != widths[1]:
+					raise ValueError("Records of Different Lengths.")
+
+				block.append(''.join(row))
+
+				if len(block) == self.BIN_BLOCK_SIZE:
+					f.write(self.__pack(block=block, row_bits=sum(widths)))
+					block = []
+
+			if len(block) > 0:
+				f.write(self.__pack(block=block, row_bits=sum(widths)))
+
+	@staticmethod
+	def read_bin(filepath: str, unpack: bool = True) -> Tuple[int, int, np.ndarray]:
+		"""
+		Read a bit-packed machine log file written by
+		export_bin. The packed rows are memory-mapped
+		rather than read into memory.
+
+		:param filepath: str, The file path to read.
+		:param unpack: bool, Whether to unpack the rows
+			into a (records x bits) array of 0/1 values,
+			or return the memory-mapped (records x bytes)
+			packed array.
+		:return: Tuple[int, int, np.ndarray], The label
+			size, the number of input bits per row, and
+			the rows.
+
+		:raises: ValueError, If the file is not a
+			bit-packed machine log.
+
+		"""
+
+		size = struct.calcsize(MachineLog.BIN_HEADER)
+
+		with open(filepath, "rb") as f:
+			header = f.read(size)
+
+		if len(header) != size:
+			raise ValueError("Invalid Machine Log File.")
+
+		magic, version, ls, input_bits, output_bits, count = \
+			struct.unpack(MachineLog.BIN_HEADER, header)
+
+		if magic != MachineLog.BIN_MAGIC or version != MachineLog.BIN_VERSION:
+			raise ValueError("Invalid Machine Log File.")
+
+		row_bits = input_bits + output_bits
+		shape = (count, (row_bits + 7) // 8)
+		packed = np.zeros(shape, dtype=np.uint8) if count == 0 else \
+			np.memmap(filepath, dtype=np.uint8, mode="r", offset=size, shape=shape)
+
+		if unpack:
+			return ls, input_bits, np.unpackbits(packed, axis=1, count=row_bits)
+
+		return ls, input_bits, packed
+
+	@staticmethod
+	def __pack(block: List[str], row_bits: int) -> bytes:
+		"""
+		Pack a block of equal-length bit strings into
+		bytes, one whole number of bytes per row.
+
+		:param block: List[str], The rows' bit strings.
+		:param row_bits: int, The length of each row.
+		:return: bytes
+
+		"""
+
+		bits = np.frombuffer(''.join(block).encode("ascii"), dtype=np.uint8)
+		bits = (bits - ord(Bit.BINARY_LABEL_0)).reshape(len(block), row_bits)
+		return np.packbits(bits, axis=1).tobytes()
 
-		[items.append(str(record).split(','))
-			for record in records]
-		items = pd.DataFrame(items)
-		items.columns = ["input", "output"]
-		items.to_csv(path_or_buf=filepath, index=False)
+	def encode(self, label_size: int) -> Iterator[Tuple[str, str]]:
+		"""
+		Encode the logged records, in order, as their
+		(input, output) bit strings. Each distinct edge
+		(input word, output state, and action) is only
+		converted to binary once.
+
+		:param label_size: int, The size (in bits) of
+			the output state labels.
+		:return: Iterator[Tuple[str, str]]
+
+		"""
+
+		encodings = dict()
+
+		for record in self.__records.values():
+			key = self.edge_key(record=record)
+			row = encodings.get(key)
+
+			if row is None:
+				row = self.encode_record(record=record, label_size=label_size)
+				encodings[key] = row
+
+			yield row
+
+	@staticmethod
+	def edge_key(record: IOPair) -> Tuple:
+		"""
+		Return the key identifying the record's edge
+		(input word, output state, and action), which
+		fully determines the record's encoding.
+
+		:param record: IOPair, The record to key.
+		:return: Tuple
+
+		"""
+
+		state = record.output.state
+		return (
+			record.input.word.name, state.label, bool(state.root),
+			bool(state.terminal), state.op_status,
+			MachineLog.action_key(action=record.output.action)
+		)
+
+	@staticmethod
+	def action_key(action: Action) -> Tuple:
+		"""
+		Return the key identifying the action by its op
+		code and parameter (a move's direction or a write's
+		word), rather than by its class, so actions built
+		from any loaded Move/Write class key alike.
+
+		:param action: Action, The action to key.
+		:return: Tuple
+
+		"""
+
+		if action is None:
+			return None
+		elif action.OP_CODE == Move.OP_CODE:
+			return action.OP_CODE, action.direction
+
+		return action.OP_CODE, action.word.name
+
+	@staticmethod
+	def encode_record(record: IOPair, label_size: int) -> Tuple[str, str]:
+		"""
+		Encode a single record as its (input, output)
+		bit strings.
+
+		:param record: IOPair, The record to encode.
+		:param label_size: int, The size (in bits) of
+			the output state label.
+		:return: Tuple[str, str]
+
+		"""
+
+		return (
+			str(record.input.to_binary()),
+			str(record.output.to_binary(label_size=label_size))
+		)
 
 	def remove(self, record: IOPair) -> None:
 		"""
@@ -129,8 +350,30 @@ class MachineLog(object):
 
 		"""
 
-		if record in self.__records:
-			self.__records.remove(record)
+		existing = self.__records.get(record.input.timestep)
+
+		if existing is not None and (existing is record or existing == record):
+			label = existing.output.state.label
+			del self.__records[record.input.timestep]
+			self.__labels[label] -= 1
+
+			if self.__labels[label] == 0:
+				del self.__labels[label]
+
+				if label == self.__max_label:
+					self.__max_label = max(self.__labels, default=0)
+
+	def lookup(self, timestep: int) -> IOPair:
+		"""
+		Return the record logged at the timestep
+		(None if the timestep is not logged).
+
+		:param timestep: int, The timestep to look up.
+		:return: IOPair
+
+		"""
+
+		return self.__records.get(timestep)
 
 	def clear(self) -> None:
 		"""
@@ -140,16 +383,52 @@ class MachineLog(object):
 
 		"""
 
-		self.__records = []
+		self.__records = dict()
+		self.__labels, self.__max_label = Counter(), 0
+
+	def flush(self) -> None:
+		"""
+		Flush any buffered records to the log's
+		backing storage. The in-memory log has
+		nothing to flush.
+
+		:return: None
+
+		"""
+
+		pass
+
+	def close(self) -> None:
+		"""
+		Flush the log and release its backing storage
+		(called once a run ends). The in-memory log
+		keeps its records.
+
+		:return: None
+
+		"""
+
+		self.flush()
+
+	@property
+	def records(self) -> List[IOPair]:
+		"""
+		:obj:`List[IOPair]` The list of input-output
+		pairs in the order they were logged.
+
+		"""
+
+		return list(self.__records.values())
 
 	@property
 	def label_size(self) -> int:
 		"""
 		:obj:`int` The state label size to log the
 		IOPair with. Pads the state label if necessary.
+		The largest logged label is tracked as records
+		are logged and removed.
 
 		"""
 
-		bits = 1 if len(self.__records) == 0 else \
-			max([r.output.state.label for r in self.__records])
+		bits = self.__max_label
 		return int(math.ceil(math.log(max(1, bits), 2)))
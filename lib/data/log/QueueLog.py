@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+
+"""
+
+QueueLog Docstring
+
+The Queue Log class is a machine log sink that hands
+each finished execution to a consumer (e.g. an online
+trainer) through an in-process queue, as a bit array
+of its encoded input/output records, rather than
+exporting it to a .csv file to be preprocessed and
+reloaded.
+
+"""
+
+import queue
+import threading
+import numpy as np
+from typing import Tuple, Iterator
+from lib.controllers.IOPair import IOPair
+from lib.data.log.SinkLog import SinkLog
+from lib.utilities.FinalProperty import FinalProperty
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+__class__ = "QueueLog"
+
+
+class QueueLog(SinkLog):
+	"""
+	QueueLog
+
+	Attributes:
+		sequences (:obj:`queue.Queue`): The queue the
+			executions' bit arrays are put on.
+		label_size (:obj:`int`): The (fixed) size in bits
+			of the encoded output state labels.
+		count (:obj:`int`): The number of executions
+			put on the queue.
+
+	Each execution is put on the queue by flush (which the
+	Turing Machine calls once it terminates) as a uint8
+	array of shape (records x bits), holding the input bit
+	and the output bits of each record; only the rows of
+	the execution in progress are kept. A bounded queue
+	blocks the producing machine until the consumer catches
+	up; setting the stop event releases it, dropping the
+	execution.
+
+	"""
+
+	"""
+	Seconds between checks of the stop event
+	while waiting on a full queue.
+
+	"""
+	POLL_INTERVAL = FinalProperty[float](0.1)
+
+	def __init__(self, sequences: queue.Queue, label_size: int, stop: threading.Event = None):
+		"""
+		QueueLog Constructor.
+
+		:param sequences: queue.Queue, The queue to put
+			the executions' bit arrays on.
+		:param label_size: int, The size in bits of the
+			encoded output state labels.
+		:param stop: threading.Event, Set when the consumer
+			stops taking executions (if any).
+
+		:raises: ValueError, If the label size is invalid.
+
+		"""
+
+		self.__sequences = sequences
+		self.__stop = stop
+		self.__rows, self.__input_bits = list(), 0
+		self.__count = 0
+		SinkLog.__init__(self, label_size=label_size)
+
+	def __len__(self) -> int:
+		"""
+		Return the number of records of the
+		execution in progress.
+
+		:return: int
+
+		"""
+
+		return len(self.__rows)
+
+	def encode_row(self, record: IOPair) -> np.ndarray:
+		"""
+		Encode the record into the uint8 array of
+		its input bits followed by its output bits.
+
+		:param record: IOPair, The record to encode.
+		:return: np.ndarray
+
+		"""
+
+		i, o = SinkLog.encode_row(self, record=record)
+		self.__input_bits = len(i)
+		return np.frombuffer((i + o).encode("ascii"), dtype=np.uint8) - ord("0")
+
+	def write(self, row: np.ndarray, record: IOPair) -> None:
+		"""
+		Append the encoded row to the execution
+		in progress (the record itself is not kept).
+
+		:param row: np.ndarray, The record's encoded row.
+		:param record: IOPair, The logged record.
+		:return: None
+
+		"""
+
+		self.__rows.append(row)
+
+	def clear(self) -> None:
+		"""
+		Discard the execution in progress.
+
+		:return: None
+
+		"""
+
+		self.__rows = list()
+		SinkLog.clear(self)
+
+	def flush(self) -> None:
+		"""
+		Put the execution in progress on the queue (blocking
+		while the queue is full) and start a new execution.
+
+		:return: None
+
+		"""
+
+		if len(self.__rows) == 0:
+			return
+
+		sequence = np.stack(self.__rows)
+		self.clear()
+
+		while self.__stop is None or not self.__stop.is_set():
+			try:
+				self.__sequences.put(sequence, timeout=self.POLL_INTERVAL)
+				self.__count += 1
+				return
+			except queue.Full:
+				pass
+
+	def encode(self, label_size: int) -> Iterator[Tuple[str, str]]:
+		"""
+		Decode the rows of the execution in progress
+		into their (input, output) bit strings (the rows
+		are always encoded with the sink's label size).
+
+		:param label_size: int, Unused, the size (in bits)
+			of the output state labels.
+		:return: Iterator[Tuple[str, str]]
+
+		"""
+
+		for row in list(self.__rows):
+			bits = (row + ord("0")).tobytes().decode("ascii")
+			yield bits[:self.__input_bits], bits[self.__input_bits:]
+
+	@property
+	def sequences(self) -> queue.Queue:
+		"""
+		:obj:`queue.Queue` The queue the executions'
+		bit arrays are put on.
+
+		"""
+
+		return self.__sequences
+
+	@property
+	def count(self) -> int:
+		"""
+		:obj:`int` The number of executions
+		put on the queue.
+
+		"""
+
+		return self.__count
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+"""
+
+RingLog Docstring
+
+The Ring Log class is a machine log policy that
+only keeps the most recently logged input/output
+records, evicting the oldest record once the log
+reaches its size.
+
+"""
+
+from typing import List
+from lib.controllers.IOPair import IOPair
+from lib.data.log.MachineLog import MachineLog
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+__class__ = "RingLog"
+
+
+class RingLog(MachineLog):
+	"""
+	RingLog
+
+	Attributes:
+		size (:obj:`int`): The maximum number of
+			records kept in the log.
+
+	The oldest record is the one with the earliest
+	timestep. Only a cursor on that timestep is kept
+	next to the records, and it only moves forward while
+	records are logged in timestep order, so evicting
+	the oldest record is O(1) (amortized).
+
+	"""
+
+	def __init__(self, size: int, records: List[IOPair] = None):
+		"""
+		RingLog Constructor.
+
+		:param size: int, The maximum number of
+			records kept in the log.
+		:param records: List[IOPair], The list of
+			machine log i/o records.
+
+		:raises: ValueError, If the size is < 1.
+
+		"""
+
+		if size < 1:
+			raise ValueError("Invalid Ring Log Size:", size)
+
+		self.__size = size
+		self.__oldest = None
+		MachineLog.__init__(self, records=records)
+
+	def log(self, record: IOPair) -> None:
+		"""
+		Log the record passed into this function
+		into the machine's record log, evicting the
+		oldest record if the log is full.
+
+		:param record: IOPair, Record to add.
+		:return: None
+
+		"""
+
+		timestep = record.input.timestep
+		MachineLog.log(self, record=record)
+
+		if self.__oldest is None or timestep < self.__oldest:
+			self.__oldest = timestep
+
+		if len(self) > self.__size:
+			oldest = self.lookup(timestep=self.__oldest)
+
+			while oldest is None:
+				self.__oldest += 1
+				oldest = self.lookup(timestep=self.__oldest)
+
+			MachineLog.remove(self, record=oldest)
+			self.__oldest += 1
+
+	def clear(self) -> None:
+		"""
+		Clear the record log.
+
+		:return: None
+
+		"""
+
+		MachineLog.clear(self)
+		self.__oldest = None
+
+	@property
+	def size(self) -> int:
+		"""
+		:obj:`int` The maximum number of
+		records kept in the log.
+
+		"""
+
+		return self.__size
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+"""
+
+SamplingLog Docstring
+
+The Sampling Log class is a machine log policy
+that only keeps every k-th input/output record,
+along with every record that transitions the
+machine into a terminal state.
+
+"""
+
+from typing import List
+from lib.controllers.IOPair import IOPair
+from lib.data.log.MachineLog import MachineLog
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+__class__ = "SamplingLog"
+
+
+class SamplingLog(MachineLog):
+	"""
+	SamplingLog
+
+	Attributes:
+		interval (:obj:`int`): The number of timesteps
+			between sampled records.
+
+	"""
+
+	def __init__(self, interval: int, records: List[IOPair] = None):
+		"""
+		SamplingLog Constructor.
+
+		:param interval: int, The number of timesteps
+			between sampled records.
+		:param records: List[IOPair], The list of
+			machine log i/o records.
+
+		:raises: ValueError, If the interval is < 1.
+
+		"""
+
+		if interval < 1:
+			raise ValueError("Invalid Sampling Interval:", interval)
+
+		self.__interval = interval
+		MachineLog.__init__(self, records=records)
+
+	def log(self, record: IOPair) -> None:
+		"""
+		Log the record passed into this function
+		into the machine's record log if it falls on
+		the sampling interval or transitions into a
+		terminal state.
+
+		:param record: IOPair, Record to add.
+		:return: None
+
+		"""
+
+		if record.input is not None and record.output is not None \
+				and record.input.timestep % self.interval != 0 \
+				and not record.output.state.terminal:
+			return
+
+		MachineLog.log(self, record=record)
+
+	@property
+	def interval(self) -> int:
+		"""
+		:obj:`int` The number of timesteps
+		between sampled records.
+
+		"""
+
+		return self.__interval
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+
+"""
+
+SinkLog Docstring
+
+The Sink Log class is the abstract base of the
+machine log sinks that encode each input/output
+record into a fixed-width row as it is logged and
+hand the row off (to a file, a queue, ...) instead
+of holding the execution's records in memory.
+
+"""
+
+import abc
+from typing import Any
+from lib.controllers.IOPair import IOPair
+from lib.data.log.MachineLog import MachineLog
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+__class__ = "SinkLog"
+
+
+class SinkLog(MachineLog, abc.ABC):
+	"""
+	SinkLog
+
+	Attributes:
+		label_size (:obj:`int`): The (fixed) size in bits
+			of the encoded output state labels.
+
+	Since rows are encoded before the largest label of
+	the run is known, the label size must be supplied up
+	front (including any padding); records with labels that
+	overflow it raise a ValueError. Records must be logged
+	in timestep order, and each distinct edge is only
+	encoded once.
+
+	"""
+
+	def __init__(self, label_size: int):
+		"""
+		SinkLog Constructor.
+
+		:param label_size: int, The size in bits of the
+			encoded output state labels.
+
+		:raises: ValueError, If the label size is invalid.
+
+		"""
+
+		if label_size < 1:
+			raise ValueError("Invalid Label Size:", label_size)
+
+		self.__label_size = label_size
+		self.__encodings, self.__last = dict(), None
+		MachineLog.__init__(self)
+
+	def log(self, record: IOPair) -> None:
+		"""
+		Encode the record and write its row
+		to the sink.
+
+		:param record: IOPair, Record to add.
+		:return: None
+
+		:raises: ValueError, If the record is incomplete,
+			conflicts with the last logged record, is logged
+			out of timestep order, or its label overflows
+			the label size.
+
+		"""
+
+		if record.input is None or record.output is None:
+			raise ValueError("Record Missing I/O Component.")
+		elif record.input.timestep != record.output.timestep:
+			raise ValueError("Timestep Mismatch in I/O.")
+
+		if self.__last is not None \
+				and record.input.timestep <= self.__last.input.timestep:
+			if record == self.__last:
+				return
+
+			raise ValueError("Conflicting I/O for Timestep.")
+
+		key = self.edge_key(record=record)
+		row = self.__encodings.get(key)
+
+		if row is None:
+			label = record.output.state.label
+
+			if label.bit_length() > self.label_size:
+				raise ValueError("Label Overflows Label Size:", label)
+
+			row = self.encode_row(record=record)
+			self.__encodings[key] = row
+
+		self.__last = record
+		self.write(row=row, record=record)
+
+	def encode_row(self, record: IOPair) -> Any:
+		"""
+		Encode the record into the row written to
+		the sink (its (input, output) bit strings).
+
+		:param record: IOPair, The record to encode.
+		:return: Any
+
+		"""
+
+		return self.encode_record(record=record, label_size=self.label_size)
+
+	@abc.abstractmethod
+	def write(self, row: Any, record: IOPair) -> None:
+		"""
+		Write the encoded row of the logged
+		record to the sink.
+
+		:param row: Any, The record's encoded row.
+		:param record: IOPair, The logged record.
+		:return: None
+
+		"""
+
+		raise NotImplementedError
+
+	def remove(self, record: IOPair) -> None:
+		"""
+		Records that have been logged to the sink
+		cannot be removed.
+
+		:param record: IOPair, The removed record.
+		:return: None
+
+		:raises: ValueError, Always.
+
+		"""
+
+		raise ValueError("Cannot Remove Logged Record:", record)
+
+	def clear(self) -> None:
+		"""
+		Clear the record log, so that the next record
+		may start from any timestep. The encoded rows
+		are kept, since the label size is fixed.
+
+		:return: None
+
+		"""
+
+		self.__last = None
+
+	@property
+	def label_size(self) -> int:
+		"""
+		:obj:`int` The (fixed) size in bits of the
+		encoded output state labels.
+
+		"""
+
+		return self.__label_size
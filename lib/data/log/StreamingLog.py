@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+
+"""
+
+StreamingLog Docstring
+
+The Streaming Log class is a machine log sink
+that appends the input/output records to a .csv
+file as the Turing Machine produces them, rather
+than holding the entire execution in memory until
+it is exported.
+
+"""
+
+import csv
+from collections import deque
+from typing import List, Tuple, Iterator
+from lib.controllers.IOPair import IOPair
+from lib.data.log.SinkLog import SinkLog
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+__class__ = "StreamingLog"
+
+
+class StreamingLog(SinkLog):
+	"""
+	StreamingLog
+
+	Attributes:
+		filepath (:obj:`str`): The .csv file the records
+			are streamed to.
+		label_size (:obj:`int`): The (fixed) size in bits
+			of the output state labels written to the file.
+		batch_size (:obj:`int`): The number of encoded
+			records buffered before they are written.
+		records (:obj:`List[IOPair]`): The bounded tail of
+			the most recently logged records.
+		count (:obj:`int`): The number of records logged
+			to the sink since it was last cleared.
+
+	The written file has the same layout as the one
+	produced by MachineLog.export_csv (see SinkLog for
+	the label size and record order requirements).
+
+	"""
+
+	def __init__(self, filepath: str, label_size: int, batch_size: int = 4096, tail: int = 1024):
+		"""
+		StreamingLog Constructor.
+
+		:param filepath: str, The .csv file to stream
+			the records to (truncated on construction
+			and whenever the log is cleared).
+		:param label_size: int, The size in bits of the
+			output state labels written to the file.
+		:param batch_size: int, The number of encoded
+			records buffered before they are written.
+		:param tail: int, The number of most recent
+			records kept in memory.
+
+		:raises: ValueError, If the label size, batch size,
+			or tail length is invalid.
+
+		"""
+
+		if batch_size < 1:
+			raise ValueError("Invalid Batch Size:", batch_size)
+		elif tail < 0:
+			raise ValueError("Invalid Tail Length:", tail)
+
+		self.__filepath = filepath
+		self.__batch_size = batch_size
+		self.__tail = deque(maxlen=tail)
+		self.__file, self.__writer = None, None
+		self.__pending, self.__count = list(), 0
+		SinkLog.__init__(self, label_size=label_size)
+		self.clear()
+
+	def __len__(self) -> int:
+		"""
+		Return the number of records held in
+		the log's in-memory tail.
+
+		:return: int
+
+		"""
+
+		return len(self.__tail)
+
+	def write(self, row: Tuple[str, str], record: IOPair) -> None:
+		"""
+		Append the encoded row to the sink's write
+		buffer, writing the buffer out once it holds
+		a full batch of records.
+
+		:param row: Tuple[str, str], The record's encoded row.
+		:param record: IOPair, The logged record.
+		:return: None
+
+		"""
+
+		self.__pending.append(row)
+		self.__tail.append(record)
+		self.__count += 1
+
+		if len(self.__pending) >= self.batch_size:
+			self.flush()
+
+	def clear(self) -> None:
+		"""
+		Clear the record log, truncating the sink's
+		file and rewriting its header.
+
+		:return: None
+
+		"""
+
+		self.__pending = list()
+		self.close()
+		self.__file = open(self.filepath, "w", newline="")
+		self.__writer = csv.writer(self.__file, lineterminator="\n")
+		self.__writer.writerow(["input", "output"])
+		self.__tail.clear()
+		self.__count = 0
+		SinkLog.clear(self)
+
+	def flush(self) -> None:
+		"""
+		Write the buffered records to the sink's file.
+
+		:return: None
+
+		:raises: ValueError, If records are buffered
+			after the sink has been closed.
+
+		"""
+
+		if self.__file is None:
+			if len(self.__pending) > 0:
+				raise ValueError("Streaming Log is Closed.")
+
+			return
+
+		if len(self.__pending) > 0:
+			self.__writer.writerows(self.__pending)
+			self.__pending = list()
+
+		self.__file.flush()
+
+	def close(self) -> None:
+		"""
+		Flush the buffered records and close the
+		sink's file (the Turing Machine closes its log
+		once a run ends; clearing the log reopens it).
+
+		:return: None
+
+		"""
+
+		if self.__file is not None:
+			self.flush()
+			self.__file.close()
+			self.__file, self.__writer = None, None
+
+	def export_csv(self, filepath: str, label_padding: int = 0) -> None:
+		"""
+		The sink only holds the tail of the run in
+		memory, so the whole log cannot be exported
+		from it (its file is already the .csv export).
+
+		:param filepath: str, The file path to export.
+		:param label_padding: int, The number of bits to
+			pad the output state label (prepend w/ 0s).
+		:return: None
+
+		:raises: NotImplementedError, Always.
+
+		"""
+
+		raise NotImplementedError("Streamed Records Are Only in the Sink File:", self.filepath)
+
+	def export_bin(self, filepath: str, label_padding: int = 0) -> None:
+		"""
+		The sink only holds the tail of the run in
+		memory, so the whole log cannot be exported
+		from it (read the sink's .csv file instead).
+
+		:param filepath: str, The file path to export.
+		:param label_padding: int, The number of bits to
+			pad the output state label (prepend w/ 0s).
+		:return: None
+
+		:raises: NotImplementedError, Always.
+
+		"""
+
+		raise NotImplementedError("Streamed Records Are Only in the Sink File:", self.filepath)
+
+	def encode(self, label_size: int) -> Iterator[Tuple[str, str]]:
+		"""
+		Encode the records in the in-memory tail as
+		their (input, output) bit strings.
+
+		:param label_size: int, The size (in bits) of
+			the output state labels.
+		:return: Iterator[Tuple[str, str]]
+
+		"""
+
+		for record in list(self.__tail):
+			yield self.encode_record(record=record, label_size=label_size)
+
+	@property
+	def filepath(self) -> str:
+		"""
+		:obj:`str` The .csv file the records
+		are streamed to.
+
+		"""
+
+		return self.__filepath
+
+	@property
+	def batch_size(self) -> int:
+		"""
+		:obj:`int` The number of encoded records
+		buffered before they are written.
+
+		"""
+
+		return self.__batch_size
+
+	@property
+	def records(self) -> List[IOPair]:
+		"""
+		:obj:`List[IOPair]` The bounded tail of the
+		most recently logged records.
+
+		"""
+
+		return list(self.__tail)
+
+	@property
+	def count(self) -> int:
+		"""
+		:obj:`int` The number of records logged to
+		the sink since it was last cleared.
+
+		"""
+
+		return self.__count
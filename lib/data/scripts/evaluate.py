@@ -0,0 +1,221 @@
+import os
+import csv
+import argparse
+from typing import List, Dict, Any
+from lib.Head import Head
+from lib.TuringMachine import TuringMachine
+from lib.data.log.MachineLog import MachineLog
+from lib.controllers.network.Network import Network
+from lib.controllers.network.BatchScheduler import BatchScheduler
+from lib.data.scripts.generate import ADDITION, MULTIPLICATION, SUCCESSOR
+from lib.data.scripts.generate import load_controller, make_tape, operand_grid
+
+"""
+The default width (in operand values) of the
+operand size buckets the report is grouped by.
+
+"""
+BUCKET = 10
+
+fp = os.path.abspath(__file__)
+lib_data_path = os.path.dirname(os.path.dirname(fp))
+root_path = os.path.dirname(os.path.dirname(lib_data_path))
+network_path = os.path.join(root_path, "config/controller/network")
+
+
+def first_divergence(reference: MachineLog, candidate: MachineLog) -> int:
+	"""
+	Return the index of the first step at which the
+	candidate's log diverges from the reference's log
+	(None if the logs are equivalent). The controllers
+	may number their states differently, so the steps
+	must agree on the input, the action, and the root,
+	terminal, and status bits, and the state labels
+	must correspond one to one.
+
+	:param reference: MachineLog, The reference log.
+	:param candidate: MachineLog, The candidate log.
+	:return: int
+
+	"""
+
+	ref = list(reference.encode(label_size=reference.label_size))
+	can = list(candidate.encode(label_size=candidate.label_size))
+	forward, backward = dict(), dict()
+
+	for step, ((ri, ro), (ci, co)) in enumerate(zip(ref, can)):
+		if ri != ci or ro[0] != co[0] or ro[-4:] != co[-4:]:
+			return step
+
+		r_label, c_label = int(ro[1:-4] or "0", 2), int(co[1:-4] or "0", 2)
+
+		if forward.setdefault(r_label, c_label) != c_label \
+				or backward.setdefault(c_label, r_label) != r_label:
+			return step
+
+	return None if len(ref) == len(can) else min(len(ref), len(can))
+
+
+def evaluate(
+		operation: str,
+		network: Network,
+		max_a: int,
+		max_b: int,
+		reference_type: str = "table",
+		max_steps: int = None) -> List[Dict[str, Any]]:
+	"""
+	Run the network and the reference controller over
+	the operand grid in one batched schedule and compare
+	every example's execution step by step.
+
+	:param operation: str, The operation type.
+	:param network: Network, The network to evaluate.
+	:param max_a: int, The largest first operand.
+	:param max_b: int, The largest second operand
+		(ignored for the successor).
+	:param reference_type: str, The reference controller type.
+	:param max_steps: int, The step limit of the network's
+		machines (defaults to twice the longest reference run).
+	:return: List[Dict[str, Any]], The per example results.
+
+	"""
+
+	reference = load_controller(operation=operation, controller_type=reference_type)
+	grid = operand_grid(operation=operation, max_a=max_a, max_b=max_b)
+	references = [
+		TuringMachine(controller=reference, tape_head=Head(tape=make_tape(operation, a, b)))
+		for a, b in grid
+	]
+	candidates = [
+		TuringMachine(controller=network, tape_head=Head(tape=make_tape(operation, a, b)))
+		for a, b in grid
+	]
+
+	BatchScheduler(machines=references).run()
+
+	if max_steps is None:
+		max_steps = 2 * max([len(m.log) for m in references] + [0]) + 2
+
+	BatchScheduler(machines=candidates).run(max_steps=max_steps)
+	results = list()
+
+	for (a, b), ref, can in zip(grid, references, candidates):
+		step = first_divergence(reference=ref.log, candidate=can.log)
+		results.append({
+			"a": a,
+			"b": b,
+			"steps": len(ref.log),
+			"divergence": step,
+			"halted": can.done,
+			"tape": str(ref.tape_head) == str(can.tape_head),
+			"exact": step is None and can.done and str(ref.tape_head) == str(can.tape_head)
+		})
+
+	return results
+
+
+def summarize(results: List[Dict[str, Any]], bucket: int = BUCKET) -> List[Dict[str, Any]]:
+	"""
+	Summarize the per example results by operand size
+	(the larger operand, in buckets of the given width).
+
+	:param results: List[Dict[str, Any]], The per example results.
+	:param bucket: int, The bucket width.
+	:return: List[Dict[str, Any]], The per bucket summaries.
+
+	"""
+
+	groups = dict()
+
+	for r in results:
+		groups.setdefault(max(r["a"], r["b"]) // bucket, list()).append(r)
+
+	summary = list()
+
+	for key in sorted(groups.keys()):
+		group = groups[key]
+		diverged = [r["divergence"] for r in group if r["divergence"] is not None]
+		prefix = [
+			(r["steps"] if r["divergence"] is None else r["divergence"]) / max(r["steps"], 1)
+			for r in group
+		]
+		summary.append({
+			"size": "{}-{}".format(key * bucket, (key + 1) * bucket - 1),
+			"examples": len(group),
+			"accuracy": sum([r["exact"] for r in group]) / len(group),
+			"step_accuracy": sum(prefix) / len(group),
+			"diverged": len(diverged),
+			"mean_divergence": sum(diverged) / len(diverged) if len(diverged) > 0 else None,
+			"min_divergence": min(diverged) if len(diverged) > 0 else None,
+			"halted": sum([r["halted"] for r in group]) / len(group)
+		})
+
+	return summary
+
+
+def write_report(rows: List[Dict[str, Any]], filepath: str) -> None:
+	"""
+	Write the results (or summaries) to a .csv file.
+
+	:param rows: List[Dict[str, Any]], The rows to write.
+	:param filepath: str, The file path to write.
+	:return: None
+
+	"""
+
+	with open(filepath, "w", newline="") as f:
+		writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if len(rows) > 0 else [],
+			lineterminator="\n")
+		writer.writeheader()
+		writer.writerows(rows)
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(
+		description="Compare a network controller with a reference controller."
+	)
+	parser.add_argument("operation", choices=[ADDITION, MULTIPLICATION, SUCCESSOR])
+	parser.add_argument("--network", default=None,
+		help="network weights (default: config/controller/network/<operation>.npz)")
+	parser.add_argument("--reference", default="table",
+		help="reference controller type (default: table)")
+	parser.add_argument("--max-a", type=int, default=None,
+		help="largest first operand (default: 1000 for the successor, else 100)")
+	parser.add_argument("--max-b", type=int, default=100,
+		help="largest second operand (default: 100)")
+	parser.add_argument("--max-steps", type=int, default=None,
+		help="network step limit (default: twice the longest reference run)")
+	parser.add_argument("--bucket", type=int, default=BUCKET,
+		help="operand size bucket width (default: {})".format(BUCKET))
+	parser.add_argument("--report", default=None,
+		help="also write the per example results to this .csv file")
+	args = parser.parse_args()
+
+	if args.max_a is None:
+		args.max_a = 1000 if args.operation == SUCCESSOR else 100
+
+	if args.network is None:
+		args.network = os.path.join(network_path, args.operation + ".npz")
+
+	results = evaluate(
+		operation=args.operation,
+		network=Network.load(filepath=args.network),
+		max_a=args.max_a,
+		max_b=args.max_b,
+		reference_type=args.reference,
+		max_steps=args.max_steps
+	)
+
+	if args.report is not None:
+		write_report(rows=results, filepath=args.report)
+
+	print("{:>10} {:>8} {:>9} {:>9} {:>9} {:>10} {:>9} {:>7}".format(
+		"size", "examples", "accuracy", "step acc", "diverged", "mean div", "min div", "halted"
+	))
+
+	for s in summarize(results=results, bucket=args.bucket):
+		print("{:>10} {:>8} {:>9.4f} {:>9.4f} {:>9} {:>10} {:>9} {:>7.3f}".format(
+			s["size"], s["examples"], s["accuracy"], s["step_accuracy"], s["diverged"],
+			"-" if s["mean_divergence"] is None else "{:.1f}".format(s["mean_divergence"]),
+			"-" if s["min_divergence"] is None else s["min_divergence"], s["halted"]
+		))
@@ -0,0 +1,238 @@
+import os
+import json
+import argparse
+from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from lib.Head import Head
+from lib.Tape import Tape
+from lib.Controller import Controller
+from lib.TuringMachine import TuringMachine
+from lib.utilities.TapeGenerator import TapeGenerator
+from lib.utilities.JSONDeserializer import JSONDeserializer
+
+ADDITION = "addition"
+MULTIPLICATION = "multiplication"
+SUCCESSOR = "successor"
+
+"""
+The label padding to pad the output label with
+for each operation (see example-2.py).
+
+"""
+LABEL_PADDING = {
+	ADDITION: 2,
+	MULTIPLICATION: 0,
+	SUCCESSOR: 6
+}
+
+fp = os.path.abspath(__file__)
+lib_data_path = os.path.dirname(os.path.dirname(fp))
+root_path = os.path.dirname(os.path.dirname(lib_data_path))
+config_path = os.path.join(root_path, "config/controller")
+raw_data_path = os.path.join(root_path, "training/data/raw")
+
+controller = None
+
+
+def file_name(operation: str, a: int, b: int = 0) -> str:
+	"""
+	Return the raw log file name for the
+	operation over the operands.
+
+	:param operation: str, The operation type.
+	:param a: int, First operand on the tape.
+	:param b: int, Second operand on the tape
+		(ignored for the successor).
+	:return: str
+
+	"""
+
+	if operation == ADDITION:
+		return str(a) + "_plus_" + str(b) + ".csv"
+	elif operation == MULTIPLICATION:
+		return str(a) + "_times_" + str(b) + ".csv"
+
+	return "succeed_" + str(a) + ".csv"
+
+
+def load_controller(operation: str, controller_type: str = "binary_table") -> Controller:
+	"""
+	Load the operation's controller with its
+	domain closed and its labels rebased.
+
+	:param operation: str, The operation type.
+	:param controller_type: str, The controller type.
+	:return: Controller
+
+	"""
+
+	path = os.path.join(config_path, controller_type, operation + ".json")
+
+	with open(path) as f:
+		json_string = json.load(f)
+
+	c = JSONDeserializer.deserialize(obj_json=json_string)
+	c.close_domain()
+	c.rebase()
+	return c
+
+
+def init_worker(operation: str, controller_type: str) -> None:
+	"""
+	Load the controller once per worker process.
+
+	:param operation: str, The operation type.
+	:param controller_type: str, The controller type.
+	:return: None
+
+	"""
+
+	global controller
+	controller = load_controller(
+		operation=operation,
+		controller_type=controller_type
+	)
+
+
+def make_tape(operation: str, a: int, b: int = 0) -> Tape:
+	"""
+	Return the initial tape of the
+	operation over the operands.
+
+	:param operation: str, The operation type.
+	:param a: int, First operand on the tape.
+	:param b: int, Second operand on the tape
+		(ignored for the successor).
+	:return: Tape
+
+	"""
+
+	if operation == ADDITION:
+		return TapeGenerator.addition(a=a, b=b)
+	elif operation == MULTIPLICATION:
+		return TapeGenerator.multiplication(a=a, b=b)
+
+	return TapeGenerator.succession(a=a)
+
+
+def generate(operation: str, a: int, b: int, filepath: str) -> str:
+	"""
+	Run the worker's controller over the operands
+	and export the execution log to the file path.
+
+	:param operation: str, The operation type.
+	:param a: int, First operand on the tape.
+	:param b: int, Second operand on the tape
+		(ignored for the successor).
+	:param filepath: str, The file path to export.
+	:return: str, The exported file path.
+
+	"""
+
+	tape = make_tape(operation=operation, a=a, b=b)
+	tm = TuringMachine(controller=controller, tape_head=Head(tape=tape))
+	tm.run(verbose=False)
+
+	# export next to the target so partial files are never skipped
+	tmp_path = filepath + ".tmp"
+	tm.log.export_csv(
+		filepath=tmp_path,
+		label_padding=LABEL_PADDING[operation]
+	)
+	os.replace(tmp_path, filepath)
+	return filepath
+
+
+def operand_grid(operation: str, max_a: int, max_b: int) -> List[Tuple[int, int]]:
+	"""
+	Return the operand pairs to generate logs for.
+
+	:param operation: str, The operation type.
+	:param max_a: int, The largest first operand.
+	:param max_b: int, The largest second operand
+		(ignored for the successor).
+	:return: List[Tuple[int, int]]
+
+	"""
+
+	if operation == SUCCESSOR:
+		return [(a, 0) for a in range(0, max_a + 1)]
+
+	return [(a, b) for a in range(0, max_a + 1) for b in range(0, max_b + 1)]
+
+
+def generate_grid(
+		operation: str,
+		max_a: int,
+		max_b: int,
+		output_path: str = raw_data_path,
+		controller_type: str = "binary_table",
+		workers: int = None) -> List[str]:
+	"""
+	Generate the raw execution logs for the operation
+	over the operand grid across a pool of worker
+	processes, skipping logs that already exist.
+
+	:param operation: str, The operation type.
+	:param max_a: int, The largest first operand.
+	:param max_b: int, The largest second operand
+		(ignored for the successor).
+	:param output_path: str, The raw data directory
+		(logs are written to its operation subdirectory).
+	:param controller_type: str, The controller type.
+	:param workers: int, The number of worker processes
+		(defaults to the number of CPUs).
+	:return: List[str], The generated file paths.
+
+	"""
+
+	op_path = os.path.join(output_path, operation)
+	os.makedirs(op_path, exist_ok=True)
+	jobs = list()
+
+	for a, b in operand_grid(operation=operation, max_a=max_a, max_b=max_b):
+		filepath = os.path.join(op_path, file_name(operation=operation, a=a, b=b))
+
+		if not os.path.exists(filepath):
+			jobs.append((a, b, filepath))
+
+	if len(jobs) == 0:
+		return []
+
+	with ProcessPoolExecutor(
+			max_workers=workers,
+			initializer=init_worker,
+			initargs=(operation, controller_type)) as pool:
+		futures = [pool.submit(generate, operation, a, b, f) for a, b, f in jobs]
+		return [future.result() for future in futures]
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(
+		description="Generate raw training logs over a grid of operands."
+	)
+	parser.add_argument("operation", choices=[ADDITION, MULTIPLICATION, SUCCESSOR])
+	parser.add_argument("--max-a", type=int, default=None,
+		help="largest first operand (default: 1000 for the successor, else 100)")
+	parser.add_argument("--max-b", type=int, default=100,
+		help="largest second operand (default: 100)")
+	parser.add_argument("--output", default=raw_data_path,
+		help="raw data directory (default: training/data/raw)")
+	parser.add_argument("--controller", default="binary_table",
+		help="controller type to run (default: binary_table)")
+	parser.add_argument("--workers", type=int, default=None,
+		help="number of worker processes (default: CPU count)")
+	args = parser.parse_args()
+
+	if args.max_a is None:
+		args.max_a = 1000 if args.operation == SUCCESSOR else 100
+
+	paths = generate_grid(
+		operation=args.operation,
+		max_a=args.max_a,
+		max_b=args.max_b,
+		output_path=args.output,
+		controller_type=args.controller,
+		workers=args.workers
+	)
+	print("Generated {} {} logs.".format(len(paths), args.operation))
@@ -0,0 +1,164 @@
+import os
+import io
+import copy
+import json
+import argparse
+import tracemalloc
+import contextlib
+from typing import Callable, Any, Dict, Tuple
+from lib.Head import Head
+from lib.State import State
+from lib.controls.Move import Move
+from lib.controls.Write import Write
+from lib.TuringMachine import TuringMachine
+from lib.controllers.Input import Input
+from lib.controllers.Output import Output
+from lib.controllers.IOPair import IOPair
+from lib.controllers.table.Edge import Edge
+from lib.controllers.table.Word import Word
+from lib.controllers.binary_table.Bit import Bit
+from lib.utilities.TapeGenerator import TapeGenerator
+from lib.utilities.JSONDeserializer import JSONDeserializer
+from lib.controllers.binary_table.BinarySequence import BinarySequence
+
+fp = os.path.abspath(__file__)
+lib_data_path = os.path.dirname(os.path.dirname(fp))
+root_path = os.path.dirname(os.path.dirname(lib_data_path))
+config_path = os.path.join(root_path, "config/controller")
+
+
+def measure(build: Callable[[], Any]) -> Tuple[int, Any]:
+	"""
+	Return the bytes still allocated by the build
+	function's result (and the result itself).
+
+	:param build: Callable[[], Any], The build function.
+	:return: Tuple[int, Any]
+
+	"""
+
+	tracemalloc.start()
+	before = tracemalloc.take_snapshot()
+	result = build()
+	after = tracemalloc.take_snapshot()
+	tracemalloc.stop()
+	size = sum([s.size_diff for s in after.compare_to(before, "filename")])
+	return size, result
+
+
+def object_sizes(count: int = 100000) -> Dict[str, float]:
+	"""
+	Return the average bytes per instance of the core
+	model classes (excluding the objects they reference).
+
+	:param count: int, The number of instances to build.
+	:return: Dict[str, float]
+
+	"""
+
+	word, state = Word(name=Bit.BINARY_LABEL_1), State(label=1)
+	move, inputs = Move(direction=Move.DIRECTION_LEFT), Input(word=word, timestep=0)
+	output = Output(action=move, state=state, timestep=0)
+	builders = [
+		("State", lambda i: State(label=i)),
+		("Word", lambda i: Word(name=Bit.BINARY_LABEL_0)),
+		("Bit", lambda i: Bit(value=Bit.BINARY_LABEL_0)),
+		("BinarySequence", lambda i: BinarySequence(values=None)),
+		("Edge", lambda i: Edge(condition=word, source=state, target=state, action=move)),
+		("Input", lambda i: Input(word=word, timestep=i)),
+		("Output", lambda i: Output(action=move, state=state, timestep=i)),
+		("IOPair", lambda i: IOPair(input=inputs, output=output)),
+		("Move", lambda i: Move(direction=Move.DIRECTION_LEFT)),
+		("Write", lambda i: Write(word=word))
+	]
+	sizes = dict()
+
+	for name, builder in builders:
+		size, _ = measure(lambda: [builder(i) for i in range(0, count)])
+		list_size, _ = measure(lambda: [None for _ in range(0, count)])
+		sizes[name] = (size - list_size) / count
+
+	return sizes
+
+
+def table_memory(operation: str, controller_type: str, copies: int = 100) -> Tuple[int, int]:
+	"""
+	Return the bytes allocated by copies of the operation's
+	controller (domain closed and rebased) and its number
+	of entries.
+
+	:param operation: str, The operation type.
+	:param controller_type: str, The controller type.
+	:param copies: int, The number of copies to load.
+	:return: Tuple[int, int]
+
+	"""
+
+	with open(os.path.join(config_path, controller_type, operation + ".json")) as f:
+		controller = JSONDeserializer.deserialize(obj_json=json.load(f))
+
+	controller.close_domain()
+	controller.rebase()
+
+	# copied rather than deserialized, since deserializing
+	# re-imports the model classes' modules
+	size, _ = measure(lambda: [copy.deepcopy(controller) for _ in range(0, copies)])
+	return size // copies, len(controller)
+
+
+def log_memory(a: int, b: int) -> Tuple[int, int]:
+	"""
+	Return the bytes held by the log of an addition
+	run (and its number of records).
+
+	:param a: int, First operand on the tape.
+	:param b: int, Second operand on the tape.
+	:return: Tuple[int, int]
+
+	"""
+
+	with open(os.path.join(config_path, "binary_table", "addition.json")) as f:
+		controller = JSONDeserializer.deserialize(obj_json=json.load(f))
+
+	controller.close_domain()
+	controller.rebase()
+	tm = TuringMachine(controller=controller, tape_head=Head(tape=TapeGenerator.addition(a=a, b=b)))
+
+	def build() -> Any:
+		with contextlib.redirect_stdout(io.StringIO()):
+			tm.run()
+
+		return tm.log
+
+	size, log = measure(build)
+	return size, len(log)
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(
+		description="Report the memory held by the core model objects, tables, and logs."
+	)
+	parser.add_argument("--count", type=int, default=100000,
+		help="instances per class (default: 100000)")
+	parser.add_argument("--copies", type=int, default=100,
+		help="copies of each table loaded (default: 100)")
+	parser.add_argument("--operand", type=int, default=300,
+		help="addition operands of the logged run (default: 300)")
+	args = parser.parse_args()
+
+	for name, size in object_sizes(count=args.count).items():
+		print("{:>16} {:>8.1f} bytes/object".format(name, size))
+
+	for controller_type in ["table", "binary_table"]:
+		for operation in ["addition", "multiplication", "successor"]:
+			size, entries = table_memory(
+				operation=operation,
+				controller_type=controller_type,
+				copies=args.copies
+			)
+			print("{:>16} {:>14} {:>8.1f} bytes/entry ({} entries)".format(
+				controller_type, operation, size / max(entries, 1), entries
+			))
+
+	size, records = log_memory(a=args.operand, b=args.operand)
+	print("{:>16} {:>8.1f} bytes/record ({} records)".format("MachineLog", size / max(records, 1), records))
@@ -1,79 +1,456 @@
 import os
-import pandas as pd
+import re
+import csv
+import json
+import hashlib
+import argparse
+import numpy as np
+from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
 
+"""
+The default length (in records) of the
+processed sequence window.
 
-def pad_sequence(df: pd.DataFrame, padding: int = 0) -> pd.DataFrame:
+"""
+WINDOW = 20
+
+"""
+The name of the manifest file recording the raw
+files (and parameters) the processed files were
+built from.
+
+"""
+MANIFEST = "manifest.json"
+
+"""
+The version of the manifest layout.
+
+"""
+MANIFEST_VERSION = 1
+
+"""
+The file name suffix of the partial files an
+interrupted generator can leave behind (skipped).
+
+"""
+TEMP_SUFFIX = ".tmp"
+
+"""
+The file name suffixes of an operation's consolidated
+bit tensor, its row index, and its sequence trie.
+
+"""
+TENSOR_SUFFIX = ".npy"
+INDEX_SUFFIX = ".index.csv"
+TRIE_SUFFIX = ".trie.npz"
+
+fp = os.path.abspath(__file__)
+lib_data_path = os.path.dirname(os.path.dirname(fp))
+root_path = os.path.dirname(os.path.dirname(lib_data_path))
+raw_data_path = os.path.join(root_path, "training/data/raw")
+data_path = os.path.join(root_path, "training/data/processed")
+
+
+def read_sequence(filepath: str) -> List[List[str]]:
+	"""
+	Read the (input, output) rows of a
+	machine log .csv file.
+
+	:param filepath: str, The file path to read.
+	:return: List[List[str]]
+
+	"""
+
+	with open(filepath, newline="") as f:
+		reader = csv.reader(f)
+		next(reader, None)
+		return [row for row in reader if len(row) > 0]
+
+
+def write_sequence(rows: List[List[str]], filepath: str) -> None:
+	"""
+	Write the (input, output) rows as a
+	machine log .csv file.
+
+	:param rows: List[List[str]], The rows to write.
+	:param filepath: str, The file path to write.
+	:return: None
+
+	"""
+
+	with open(filepath, "w", newline="") as f:
+		writer = csv.writer(f, lineterminator="\n")
+		writer.writerow(["input", "output"])
+		writer.writerows(rows)
+
+
+def pad_sequence(rows: List[List[str]], padding: int = 0) -> List[List[str]]:
 	"""
 	Pad the sequence with dummy terminal
 	state values for the provided padding
 	length.
 
-	:param df: pd.DataFrame, The dataframe to pad.
+	:param rows: List[List[str]], The rows to pad.
 	:param padding: int, The length of the padding
-	:return: pd.DataFrame
+	:return: List[List[str]]
+
+	:raises: ValueError, If the sequence does not
+		end in a successful terminal state.
 
 	"""
 
 	padding = max(0, padding)
 
-	if padding > 0 and len(df) > 0:
-		items = list()
-		i = df["input"][len(df) - 1]
-		o = df["output"][len(df) - 1][:-2]
+	if padding > 0 and len(rows) > 0:
+		i = rows[-1][0]
+		o = rows[-1][1][:-2]
 
 		if o[-2:] != "10":
 			raise ValueError
 
-		o = o + "1" + i
+		rows = rows + [[i, o + "1" + i]] * padding
 
-		for p in range(0, padding):
-			items.append({
-				"input": i,
-				"output": o
-			})
+	return rows
 
-		df = df.append(items)
 
-	return df
+def trunc_sequence(rows: List[List[str]], max_len: int = -1) -> List[List[str]]:
+	"""
+	Truncate the length of the passed
+	in sequence to the max length.
 
+	:param rows: List[List[str]], The rows to truncate.
+	:param max_len: int, The length to truncate the
+		sequence to (no truncation if < 0).
+	:return: List[List[str]]
 
-def trunc_sequence(df: pd.DataFrame, max_len: int = -1) -> pd.DataFrame:
 	"""
-	Truncate the length of the passed
-	in dataframe to the max length.
 
-	:param df: pd.DataFrame, The dataframe to truncate.
-	:param max_len: int, The length to truncate the df to.
-	:return: pd.DataFrame
+	return rows if max_len < 0 else rows[:max_len]
 
+
+def preprocess_file(source: str, target: str, window: int = WINDOW) -> str:
 	"""
+	Truncate and pad the raw sequence to the
+	window length and write it to the target.
 
-	return df.truncate(after=(max_len - 1))
+	:param source: str, The raw file path.
+	:param target: str, The processed file path.
+	:param window: int, The processed sequence length.
+	:return: str, The processed file path.
 
+	"""
 
-fp = os.path.abspath(__file__)
-lib_data_path = os.path.dirname(os.path.dirname(fp))
-root_path = os.path.dirname(os.path.dirname(lib_data_path))
-raw_data_path = os.path.join(root_path, "training/data/raw")
-data_path = os.path.join(root_path, "training/data/processed")
+	rows = trunc_sequence(rows=read_sequence(filepath=source), max_len=window)
+	rows = pad_sequence(rows=rows, padding=(window - len(rows)))
+	write_sequence(rows=rows, filepath=target)
+	return target
+
+
+def file_hash(filepath: str) -> str:
+	"""
+	Return the SHA-1 digest of the file's contents.
+
+	:param filepath: str, The file path to hash.
+	:return: str
+
+	"""
+
+	with open(filepath, "rb") as f:
+		return hashlib.sha1(f.read()).hexdigest()
+
+
+def load_manifest(processed_path: str) -> Dict[str, Dict[str, Any]]:
+	"""
+	Load the manifest entries (keyed by the raw file
+	path relative to the raw data directory) from the
+	processed data directory. A missing or outdated
+	manifest has no entries.
+
+	:param processed_path: str, The processed data directory.
+	:return: Dict[str, Dict[str, Any]]
+
+	"""
+
+	path = os.path.join(processed_path, MANIFEST)
+
+	if not os.path.exists(path):
+		return dict()
+
+	with open(path) as f:
+		manifest = json.load(f)
+
+	if manifest.get("version") != MANIFEST_VERSION:
+		return dict()
+
+	return manifest.get("files", dict())
+
+
+def save_manifest(processed_path: str, entries: Dict[str, Dict[str, Any]]) -> None:
+	"""
+	Write the manifest entries to the processed
+	data directory.
+
+	:param processed_path: str, The processed data directory.
+	:param entries: Dict[str, Dict[str, Any]], The entries
+		keyed by the raw file's relative path.
+	:return: None
 
-for op in os.listdir(raw_data_path):
-	op_raw_data_dir_path = os.path.join(raw_data_path, op)
-	op_data_dir_path = os.path.join(data_path, op)
-
-	if os.path.isdir(op_raw_data_dir_path):
-		for fn in os.listdir(op_raw_data_dir_path):
-			op_raw_data_file_path = os.path.join(op_raw_data_dir_path, fn)
-
-			if not os.path.isdir(op_raw_data_file_path):
-				df = pd.read_csv(
-					op_raw_data_file_path,
-					dtype={
-						'input': str,
-						'output': str
-					}
+	"""
+
+	path = os.path.join(processed_path, MANIFEST)
+	manifest = {"version": MANIFEST_VERSION, "files": entries}
+
+	with open(path + ".tmp", "w") as f:
+		json.dump(manifest, f, indent=1, sort_keys=True)
+
+	os.replace(path + ".tmp", path)
+
+
+def is_current(entry: Dict[str, Any], source: str, target: str, parameters: Dict[str, Any]) -> bool:
+	"""
+	Evaluate whether the manifest entry shows that the
+	target was processed from the source's current
+	contents with the same parameters. The contents
+	are only hashed when the size or mtime differ;
+	a matching hash refreshes the entry's mtime.
+
+	:param entry: Dict[str, Any], The manifest entry.
+	:param source: str, The raw file path.
+	:param target: str, The processed file path.
+	:param parameters: Dict[str, Any], The preprocessing
+		parameters.
+	:return: bool
+
+	"""
+
+	if entry is None or entry.get("parameters") != parameters \
+			or not os.path.exists(target):
+		return False
+
+	stat = os.stat(source)
+
+	if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+		return True
+	elif entry.get("size") == stat.st_size and entry.get("sha1") == file_hash(filepath=source):
+		entry["mtime_ns"] = stat.st_mtime_ns
+		return True
+
+	return False
+
+
+def operands(filename: str) -> List[int]:
+	"""
+	Return the operands encoded in a log file name
+	(e.g. [3, 4] for 3_plus_4.csv).
+
+	:param filename: str, The log file name.
+	:return: List[int]
+
+	"""
+
+	return [int(n) for n in re.findall(r"\d+", filename)]
+
+
+def consolidate(processed_path: str, operation: str, filenames: List[str]) -> str:
+	"""
+	Consolidate an operation's processed sequences into
+	a single (examples x window x bits) uint8 bit tensor,
+	saved as <operation>.npy so it can be opened with
+	np.load(mmap_mode='r'), along with <operation>.index.csv
+	mapping each example row back to its file and operands.
+
+	:param processed_path: str, The processed data directory.
+	:param operation: str, The operation (subdirectory) name.
+	:param filenames: List[str], The processed file names
+		to consolidate, in row order.
+	:return: str, The tensor file path.
+
+	:raises: ValueError, If the sequences differ in length
+		or row width.
+
+	"""
+
+	op_data_dir_path = os.path.join(processed_path, operation)
+	tensor_path = os.path.join(processed_path, operation + TENSOR_SUFFIX)
+	index_path = os.path.join(processed_path, operation + INDEX_SUFFIX)
+	tensor, shape = None, None
+
+	with open(index_path, "w", newline="") as f:
+		writer = csv.writer(f, lineterminator="\n")
+		writer.writerow(["row", "file", "a", "b"])
+
+		for row, fn in enumerate(filenames):
+			bits = [i + o for i, o in read_sequence(filepath=os.path.join(op_data_dir_path, fn))]
+
+			if tensor is None:
+				shape = (len(bits), len(bits[0]) if len(bits) > 0 else 0)
+				tensor = np.lib.format.open_memmap(
+					tensor_path, mode="w+", dtype=np.uint8,
+					shape=(len(filenames),) + shape
 				)
-				op_data_file_path = os.path.join(op_data_dir_path, fn)
-				df = trunc_sequence(df=df, max_len=20)
-				df = pad_sequence(df=df, padding=(20 - len(df)))
-				df.to_csv(path_or_buf=op_data_file_path, index=False)
+
+			if len(bits) != shape[0] or any([len(b) != shape[1] for b in bits]):
+				raise ValueError("Sequence Shape Mismatch:", fn)
+
+			values = np.frombuffer(''.join(bits).encode("ascii"), dtype=np.uint8)
+			tensor[row] = (values - ord("0")).reshape(shape)
+			writer.writerow([row, fn] + (operands(filename=fn) + ["", ""])[:2])
+
+	if tensor is None:
+		np.save(tensor_path, np.zeros((0, 0, 0), dtype=np.uint8))
+	else:
+		tensor.flush()
+
+	return tensor_path
+
+
+def preprocess(
+		raw_path: str = raw_data_path,
+		processed_path: str = data_path,
+		window: int = WINDOW,
+		workers: int = None,
+		incremental: bool = False,
+		consolidated: bool = False,
+		trie: bool = False) -> List[str]:
+	"""
+	Preprocess every raw sequence (one directory
+	per operation) across a pool of worker processes,
+	and record the processed raw files in a manifest.
+
+	:param raw_path: str, The raw data directory.
+	:param processed_path: str, The processed data directory.
+	:param window: int, The processed sequence length.
+	:param workers: int, The number of worker processes
+		(defaults to the number of CPUs).
+	:param incremental: bool, Whether to only process raw
+		files that are new, changed, or were processed with
+		different parameters according to the manifest (the
+		processed files of removed raw files are deleted).
+	:param consolidated: bool, Whether to also write each
+		operation's consolidated bit tensor and index (only
+		rebuilt for operations with processed or removed files).
+	:param trie: bool, Whether to also write each operation's
+		deduplicated trie of raw sequences (see SequenceTrie;
+		only rebuilt for operations with processed or removed
+		files).
+	:return: List[str], The processed file paths.
+
+	"""
+
+	sources, targets = list(), list()
+	parameters = {"window": window}
+	manifest = load_manifest(processed_path=processed_path) if incremental else dict()
+	entries = dict()
+
+	for op in sorted(os.listdir(raw_path)):
+		op_raw_data_dir_path = os.path.join(raw_path, op)
+		op_data_dir_path = os.path.join(processed_path, op)
+
+		if os.path.isdir(op_raw_data_dir_path):
+			os.makedirs(op_data_dir_path, exist_ok=True)
+
+			for fn in sorted(os.listdir(op_raw_data_dir_path)):
+				op_raw_data_file_path = os.path.join(op_raw_data_dir_path, fn)
+
+				if not os.path.isdir(op_raw_data_file_path) and not fn.endswith(TEMP_SUFFIX):
+					key = os.path.relpath(op_raw_data_file_path, raw_path)
+					target = os.path.join(op_data_dir_path, fn)
+					entry = manifest.get(key)
+
+					if is_current(entry, op_raw_data_file_path, target, parameters):
+						entries[key] = entry
+					else:
+						stat = os.stat(op_raw_data_file_path)
+						entries[key] = {
+							"size": stat.st_size,
+							"mtime_ns": stat.st_mtime_ns,
+							"sha1": file_hash(filepath=op_raw_data_file_path),
+							"parameters": parameters
+						}
+						sources.append(op_raw_data_file_path)
+						targets.append(target)
+
+	paths = list()
+
+	if len(sources) > 0:
+		with ProcessPoolExecutor(max_workers=workers) as pool:
+			chunksize = max(1, len(sources) // (4 * (workers or os.cpu_count() or 1)))
+			windows = [window] * len(sources)
+			paths = list(pool.map(preprocess_file, sources, targets, windows, chunksize=chunksize))
+
+	# raw files removed since the last run leave stale processed files
+	removed = [k for k in manifest.keys() if k not in entries]
+
+	for key in removed:
+		target = os.path.join(processed_path, key)
+
+		if os.path.exists(target):
+			os.remove(target)
+
+	os.makedirs(processed_path, exist_ok=True)
+	save_manifest(processed_path=processed_path, entries=entries)
+
+	changed = set([os.path.basename(os.path.dirname(p)) for p in paths])
+	changed.update([k.split(os.sep)[0] for k in removed])
+	ops = sorted(set([k.split(os.sep)[0] for k in list(entries.keys()) + removed]))
+
+	for op in ops:
+		filenames = sorted([
+			os.path.basename(k) for k in entries.keys()
+			if k.split(os.sep)[0] == op
+		])
+		tensor_path = os.path.join(processed_path, op + TENSOR_SUFFIX)
+		trie_path = os.path.join(processed_path, op + TRIE_SUFFIX)
+
+		if consolidated and (op in changed or not incremental
+				or not os.path.exists(tensor_path)):
+			consolidate(
+				processed_path=processed_path,
+				operation=op,
+				filenames=filenames
+			)
+
+		if trie and (op in changed or not incremental
+				or not os.path.exists(trie_path)):
+			# imported here, so the script runs without lib on the path
+			from lib.data.store.SequenceTrie import SequenceTrie
+
+			SequenceTrie.from_files(filepaths=[
+				os.path.join(raw_path, op, fn) for fn in filenames
+			]).save(filepath=trie_path)
+
+	return paths
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(
+		description="Truncate and pad the raw training logs to a fixed window."
+	)
+	parser.add_argument("--window", type=int, default=WINDOW,
+		help="processed sequence length (default: {})".format(WINDOW))
+	parser.add_argument("--raw", default=raw_data_path,
+		help="raw data directory (default: training/data/raw)")
+	parser.add_argument("--processed", default=data_path,
+		help="processed data directory (default: training/data/processed)")
+	parser.add_argument("--workers", type=int, default=None,
+		help="number of worker processes (default: CPU count)")
+	parser.add_argument("--incremental", action="store_true",
+		help="only process new or changed raw files (see {})".format(MANIFEST))
+	parser.add_argument("--consolidate", action="store_true",
+		help="also write each operation's <op>.npy bit tensor and <op>.index.csv")
+	parser.add_argument("--trie", action="store_true",
+		help="also write each operation's deduplicated <op>.trie.npz of raw sequences "
+		"(needs lib importable, e.g. python -m lib.data.scripts.preprocess)")
+	args = parser.parse_args()
+
+	paths = preprocess(
+		raw_path=args.raw,
+		processed_path=args.processed,
+		window=args.window,
+		workers=args.workers,
+		incremental=args.incremental,
+		consolidated=args.consolidate,
+		trie=args.trie
+	)
+	print("Processed {} files.".format(len(paths)))
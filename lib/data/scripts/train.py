@@ -0,0 +1,410 @@
+import os
+import csv
+import queue
+import argparse
+import threading
+import numpy as np
+from typing import Tuple, Set
+from lib.Head import Head
+from lib.TuringMachine import TuringMachine
+from lib.data.log.QueueLog import QueueLog
+from lib.data.loader.BatchLoader import BatchLoader
+from lib.controllers.network.Network import Network
+from lib.controllers.network.Trainer import Trainer
+from lib.controllers.binary_table.StateSequence import StateSequence
+from lib.data.scripts.generate import LABEL_PADDING
+from lib.data.scripts.generate import load_controller, make_tape, operand_grid
+
+"""
+The default fraction of an operation's first
+operands whose sequences are held out.
+
+"""
+HOLDOUT = 0.1
+
+"""
+The default curriculum of online training: the
+largest operand of each successive stage.
+
+"""
+CURRICULUM = (4, 8, 16, 32)
+
+fp = os.path.abspath(__file__)
+lib_data_path = os.path.dirname(os.path.dirname(fp))
+root_path = os.path.dirname(os.path.dirname(lib_data_path))
+data_path = os.path.join(root_path, "training/data/processed")
+network_path = os.path.join(root_path, "config/controller/network")
+
+
+def operand_split(
+		processed_path: str,
+		operation: str,
+		holdout: float = HOLDOUT,
+		seed: int = None) -> Tuple[np.ndarray, np.ndarray]:
+	"""
+	Split the rows of the operation's consolidated
+	bit tensor by their first operand, so the held-out
+	rows are runs over operands never trained on.
+
+	:param processed_path: str, The processed data directory.
+	:param operation: str, The operation name.
+	:param holdout: float, The fraction of first
+		operands to hold out.
+	:param seed: int, The split seed.
+	:return: Tuple[np.ndarray, np.ndarray], The training
+		and held-out rows.
+
+	"""
+
+	with open(os.path.join(processed_path, operation + ".index.csv"), newline="") as f:
+		index = [(int(r["row"]), r["a"]) for r in csv.DictReader(f)]
+
+	operands = sorted(set([a for _, a in index]))
+	count = int(round(holdout * len(operands)))
+	random = np.random.default_rng(seed)
+	held = set(random.permutation(operands)[:count].tolist()) if count > 0 else set()
+	rows = np.asarray([r for r, _ in index], dtype=np.int64)
+	mask = np.asarray([a in held for _, a in index], dtype=bool)
+	return rows[~mask], rows[mask]
+
+
+def train(
+		operation: str,
+		processed_path: str = data_path,
+		output: str = None,
+		hidden: Tuple[int, ...] = (64,),
+		activation: str = "tanh",
+		batch_size: int = 32,
+		learning_rate: float = 0.5,
+		momentum: float = 0.9,
+		epochs: int = 500,
+		patience: int = 20,
+		holdout: float = HOLDOUT,
+		seed: int = None) -> Network:
+	"""
+	Train a network controller on the operation's
+	consolidated bit tensor (see the preprocess script's
+	--consolidate option), checkpointing its best weights
+	to the output path.
+
+	:param operation: str, The operation name.
+	:param processed_path: str, The processed data directory.
+	:param output: str, The weights file path (defaults to
+		config/controller/network/<operation>.npz).
+	:param hidden: Tuple[int, ...], The hidden layer sizes.
+	:param activation: str, The hidden layer activation.
+	:param batch_size: int, The sequences per mini-batch.
+	:param learning_rate: float, The gradient step size.
+	:param momentum: float, The momentum coefficient.
+	:param epochs: int, The maximum number of epochs.
+	:param patience: int, The early stopping patience.
+	:param holdout: float, The fraction of first
+		operands to hold out.
+	:param seed: int, The initialization and split seed.
+	:return: Network
+
+	"""
+
+	if output is None:
+		output = os.path.join(network_path, operation + ".npz")
+
+	os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+	train_rows, held_rows = operand_split(
+		processed_path=processed_path,
+		operation=operation,
+		holdout=holdout,
+		seed=seed
+	)
+	loader = BatchLoader.load(
+		processed_path=processed_path,
+		operation=operation,
+		batch_size=batch_size,
+		indices=train_rows,
+		dtype=np.float64,
+		seed=seed
+	)
+	validation = None if len(held_rows) == 0 else BatchLoader(
+		data=loader.data,
+		batch_size=max(batch_size, len(held_rows)),
+		indices=held_rows,
+		shuffle=False,
+		dtype=np.float64
+	)
+
+	# the state labels are as wide as the padded output labels
+	network = Network.initialize(
+		label_size=loader.data.shape[-1] - loader.input_bits - 5,
+		hidden=list(hidden),
+		initial=load_controller(operation=operation).initial_sequence().to_state(),
+		activation=activation,
+		seed=seed
+	)
+	trainer = Trainer(
+		network=network,
+		learning_rate=learning_rate,
+		momentum=momentum,
+		epochs=epochs,
+		patience=patience,
+		checkpoint=output
+	)
+	history = trainer.fit(train=loader, validation=validation)
+	print("Trained {} epochs: {}".format(len(history), history[-1]))
+	network.save(filepath=output)
+	return network
+
+
+def online_label_size(operation: str) -> int:
+	"""
+	Return the (padded) label size of the operation's
+	binary table, the label size of its online logs.
+
+	:param operation: str, The operation name.
+	:return: int
+
+	"""
+
+	entries = list(load_controller(operation=operation).entries)
+	bits = len(entries[0].source.identity) - (StateSequence.MIN_STATE_SEQUENCE_LEN - 3)
+	return max(bits, 1) + LABEL_PADDING[operation]
+
+
+def produce(
+		operation: str,
+		curriculum: Tuple[int, ...],
+		passes: int,
+		held: Set[int],
+		sequences: queue.Queue,
+		stop: threading.Event,
+		label_size: int,
+		seed: int = None) -> None:
+	"""
+	Run the operation's binary table over each stage of
+	the curriculum (every operand pair up to the stage's
+	largest operand, skipping held-out first operands, in
+	a shuffled order, for the number of passes), putting
+	each execution on the queue, then put None. A full
+	queue blocks the producer until the trainer catches
+	up, and setting the stop event ends production.
+
+	:param operation: str, The operation name.
+	:param curriculum: Tuple[int, ...], The largest
+		operand of each stage.
+	:param passes: int, The number of passes per stage.
+	:param held: Set[int], The held-out first operands.
+	:param sequences: queue.Queue, The executions' queue.
+	:param stop: threading.Event, Set when training stops.
+	:param label_size: int, The label size of the logs.
+	:param seed: int, The shuffling seed.
+	:return: None
+
+	"""
+
+	try:
+		controller = load_controller(operation=operation)
+		log = QueueLog(sequences=sequences, label_size=label_size, stop=stop)
+		random = np.random.default_rng(seed)
+
+		for stage in curriculum:
+			grid = [
+				(a, b) for a, b in operand_grid(operation=operation, max_a=stage, max_b=stage)
+				if a not in held
+			]
+
+			for _ in range(0, passes):
+				for i in random.permutation(len(grid)):
+					if stop.is_set():
+						return
+
+					a, b = grid[i]
+					tape = make_tape(operation=operation, a=a, b=b)
+					TuringMachine(controller=controller, tape_head=Head(tape=tape), log=log).run(verbose=False)
+
+		item = None
+	except Exception as e:
+		item = e
+
+	while not stop.is_set():
+		try:
+			sequences.put(item, timeout=QueueLog.POLL_INTERVAL)
+			return
+		except queue.Full:
+			pass
+
+
+def train_online(
+		operation: str,
+		output: str = None,
+		curriculum: Tuple[int, ...] = CURRICULUM,
+		passes: int = 3,
+		hidden: Tuple[int, ...] = (64,),
+		activation: str = "tanh",
+		batch_size: int = 2048,
+		learning_rate: float = 0.5,
+		momentum: float = 0.9,
+		checks: int = 500,
+		interval: int = 50,
+		patience: int = 20,
+		holdout: float = HOLDOUT,
+		queue_size: int = 64,
+		seed: int = None) -> Network:
+	"""
+	Train a network controller online: a producer thread
+	runs the operation's binary table over a curriculum of
+	growing operands and hands each execution straight to
+	the trainer through a bounded queue, so no intermediate
+	.csv files are written. The runs over a held-out fraction
+	of the first operands (up to the last stage) are the
+	validation set.
+
+	:param operation: str, The operation name.
+	:param output: str, The weights file path (defaults to
+		config/controller/network/<operation>.npz).
+	:param curriculum: Tuple[int, ...], The largest
+		operand of each stage.
+	:param passes: int, The number of passes per stage.
+	:param hidden: Tuple[int, ...], The hidden layer sizes.
+	:param activation: str, The hidden layer activation.
+	:param batch_size: int, The transitions per step.
+	:param learning_rate: float, The gradient step size.
+	:param momentum: float, The momentum coefficient.
+	:param checks: int, The maximum number of checks.
+	:param interval: int, The number of steps per check.
+	:param patience: int, The early stopping patience.
+	:param holdout: float, The fraction of first
+		operands to hold out.
+	:param queue_size: int, The number of executions the
+		queue holds before the producer blocks.
+	:param seed: int, The initialization and split seed.
+	:return: Network
+
+	"""
+
+	if output is None:
+		output = os.path.join(network_path, operation + ".npz")
+
+	os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+	label_size = online_label_size(operation=operation)
+	controller = load_controller(operation=operation)
+	operands = list(range(0, max(curriculum) + 1))
+	count = int(round(holdout * len(operands)))
+	random = np.random.default_rng(seed)
+	held = set(random.permutation(operands)[:count].tolist()) if count > 0 else set()
+
+	# the held-out runs are gathered up front as the validation set
+	collected = queue.Queue()
+	log = QueueLog(sequences=collected, label_size=label_size)
+
+	for a, b in operand_grid(operation=operation, max_a=max(curriculum), max_b=max(curriculum)):
+		if a in held:
+			tape = make_tape(operation=operation, a=a, b=b)
+			TuringMachine(controller=controller, tape_head=Head(tape=tape), log=log).run(verbose=False)
+
+	validation = [(s[None, :, :1], s[None, :, 1:]) for s in list(collected.queue)]
+	network = Network.initialize(
+		label_size=label_size,
+		hidden=list(hidden),
+		initial=controller.initial_sequence().to_state(),
+		activation=activation,
+		seed=seed
+	)
+	trainer = Trainer(
+		network=network,
+		learning_rate=learning_rate,
+		momentum=momentum,
+		epochs=checks,
+		patience=patience,
+		checkpoint=output
+	)
+	sequences, stop = queue.Queue(maxsize=queue_size), threading.Event()
+	producer = threading.Thread(
+		target=produce,
+		args=(operation, tuple(curriculum), passes, held, sequences, stop, label_size, seed),
+		daemon=True
+	)
+	producer.start()
+
+	try:
+		history = trainer.fit_online(
+			sequences=sequences,
+			batch_size=batch_size,
+			validation=None if len(validation) == 0 else validation,
+			interval=interval,
+			stop=stop
+		)
+	finally:
+		stop.set()
+		producer.join()
+
+	print("Trained {} checks: {}".format(len(history), history[-1] if len(history) > 0 else None))
+	network.save(filepath=output)
+	return network
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(
+		description="Train a network controller on the consolidated (or online) training data."
+	)
+	parser.add_argument("operation", choices=["addition", "multiplication", "successor"])
+	parser.add_argument("--processed", default=data_path,
+		help="processed data directory (default: training/data/processed)")
+	parser.add_argument("--output", default=None,
+		help="weights file (default: config/controller/network/<operation>.npz)")
+	parser.add_argument("--hidden", default="64",
+		help="comma separated hidden layer sizes (default: 64)")
+	parser.add_argument("--activation", default="tanh", choices=list(Network.ACTIVATIONS))
+	parser.add_argument("--batch-size", type=int, default=None,
+		help="sequences per mini-batch (default: 32), or transitions per step online (default: 2048)")
+	parser.add_argument("--learning-rate", type=float, default=0.5)
+	parser.add_argument("--momentum", type=float, default=0.9)
+	parser.add_argument("--epochs", type=int, default=500)
+	parser.add_argument("--patience", type=int, default=20)
+	parser.add_argument("--holdout", type=float, default=HOLDOUT,
+		help="fraction of first operands held out (default: {})".format(HOLDOUT))
+	parser.add_argument("--seed", type=int, default=None)
+	parser.add_argument("--online", action="store_true",
+		help="train on executions produced while training, without intermediate .csv files")
+	parser.add_argument("--curriculum", default=",".join([str(c) for c in CURRICULUM]),
+		help="online: comma separated largest operand of each stage (default: {})".format(
+			",".join([str(c) for c in CURRICULUM])))
+	parser.add_argument("--passes", type=int, default=3,
+		help="online: passes over each curriculum stage (default: 3)")
+	parser.add_argument("--interval", type=int, default=50,
+		help="online: gradient steps between held-out checks (default: 50)")
+	parser.add_argument("--queue-size", type=int, default=64,
+		help="online: executions queued before generation blocks (default: 64)")
+	args = parser.parse_args()
+	hidden = tuple([int(h) for h in args.hidden.split(",") if h != ""])
+
+	if args.online:
+		train_online(
+			operation=args.operation,
+			output=args.output,
+			curriculum=tuple([int(c) for c in args.curriculum.split(",") if c != ""]),
+			passes=args.passes,
+			hidden=hidden,
+			activation=args.activation,
+			batch_size=2048 if args.batch_size is None else args.batch_size,
+			learning_rate=args.learning_rate,
+			momentum=args.momentum,
+			checks=args.epochs,
+			interval=args.interval,
+			patience=args.patience,
+			holdout=args.holdout,
+			queue_size=args.queue_size,
+			seed=args.seed
+		)
+	else:
+		train(
+			operation=args.operation,
+			processed_path=args.processed,
+			output=args.output,
+			hidden=hidden,
+			activation=args.activation,
+			batch_size=32 if args.batch_size is None else args.batch_size,
+			learning_rate=args.learning_rate,
+			momentum=args.momentum,
+			epochs=args.epochs,
+			patience=args.patience,
+			holdout=args.holdout,
+			seed=args.seed
+		)
@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+
+"""
+
+SequenceTrie Docstring
+
+The Sequence Trie class stores the IOPair sequences
+of an operation's execution logs as a prefix trie,
+so runs that share an identical opening (e.g. every
+successor run's initial scan) are stored, and can be
+learned from, only once.
+
+"""
+
+import os
+import csv
+import numpy as np
+from typing import List, Tuple, Dict
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+__class__ = "SequenceTrie"
+
+
+class SequenceTrie(object):
+	"""
+	SequenceTrie
+
+	Attributes:
+		keys (:obj:`List[str]`): The keys (e.g. log file
+			names) of the stored sequences.
+		rows (:obj:`int`): The total number of IOPair rows
+			added across every stored sequence.
+
+	Node 0 is the (empty) root. Every other node holds a
+	single IOPair row, and the path from the root to a node
+	spells out a sequence prefix. Rows are interned in a
+	symbol table so each node is a (parent, symbol) pair.
+
+	"""
+
+	def __init__(self):
+		"""
+		SequenceTrie Constructor.
+
+		"""
+
+		self.__parents, self.__symbols = [-1], [-1]
+		self.__rows, self.__codes = list(), dict()
+		self.__children = dict()
+		self.__keys = dict()
+		self.__count = 0
+
+	def __len__(self) -> int:
+		"""
+		Return the number of (unique prefix)
+		nodes stored in the trie.
+
+		:return: int
+
+		"""
+
+		return len(self.__parents) - 1
+
+	def __contains__(self, key: str) -> bool:
+		"""
+		Examine whether a sequence is stored
+		under the key.
+
+		:param key: str, The sequence key.
+		:return: bool
+
+		"""
+
+		return key in self.__keys
+
+	def add(self, key: str, sequence: List[Tuple[str, str]]) -> int:
+		"""
+		Add the sequence of (input, output) rows to
+		the trie under the key.
+
+		:param key: str, The sequence key.
+		:param sequence: List[Tuple[str, str]], The rows.
+		:return: int, The sequence's final node.
+
+		"""
+
+		node = 0
+
+		for row in sequence:
+			row = tuple(row)
+			symbol = self.__codes.get(row)
+
+			if symbol is None:
+				symbol = len(self.__rows)
+				self.__rows.append(row)
+				self.__codes[row] = symbol
+
+			child = self.__children.get((node, symbol))
+
+			if child is None:
+				child = len(self.__parents)
+				self.__parents.append(node)
+				self.__symbols.append(symbol)
+				self.__children[(node, symbol)] = child
+
+			node = child
+
+		self.__keys[key] = node
+		self.__count += len(sequence)
+		return node
+
+	def sequence(self, key: str) -> List[Tuple[str, str]]:
+		"""
+		Return the rows stored under the key.
+
+		:param key: str, The sequence key.
+		:return: List[Tuple[str, str]]
+
+		:raises: KeyError, If no sequence has the key.
+
+		"""
+
+		return self.path(node=self.__keys[key])
+
+	def path(self, node: int) -> List[Tuple[str, str]]:
+		"""
+		Return the rows on the path from the
+		root to the node.
+
+		:param node: int, The trie node.
+		:return: List[Tuple[str, str]]
+
+		"""
+
+		rows = list()
+
+		while node > 0:
+			rows.append(self.__rows[self.__symbols[node]])
+			node = self.__parents[node]
+
+		rows.reverse()
+		return rows
+
+	def leaves(self) -> List[int]:
+		"""
+		Return the nodes without children. Every stored
+		sequence is a prefix of a leaf's path, so the
+		leaves' paths are the unique sequences a learner
+		needs to process.
+
+		:return: List[int]
+
+		"""
+
+		internal = np.zeros(len(self.__parents), dtype=bool)
+		internal[np.asarray(self.__parents[1:], dtype=np.int64)] = True
+		return [int(n) for n in np.flatnonzero(~internal) if n > 0]
+
+	def unique_sequences(self) -> List[List[Tuple[str, str]]]:
+		"""
+		Return the rows of every leaf's path.
+
+		:return: List[List[Tuple[str, str]]]
+
+		"""
+
+		return [self.path(node=n) for n in self.leaves()]
+
+	def save(self, filepath: str) -> None:
+		"""
+		Save the trie's node arrays, symbol table,
+		and keys as a compressed .npz file.
+
+		:param filepath: str, The file path to save.
+		:return: None
+
+		"""
+
+		keys = sorted(self.__keys.keys())
+		np.savez_compressed(
+			filepath,
+			parents=np.asarray(self.__parents, dtype=np.int64),
+			symbols=np.asarray(self.__symbols, dtype=np.int64),
+			inputs=np.asarray([r[0] for r in self.__rows], dtype=str),
+			outputs=np.asarray([r[1] for r in self.__rows], dtype=str),
+			keys=np.asarray(keys, dtype=str),
+			nodes=np.asarray([self.__keys[k] for k in keys], dtype=np.int64),
+			count=np.asarray(self.__count, dtype=np.int64)
+		)
+
+	@staticmethod
+	def load(filepath: str) -> 'SequenceTrie':
+		"""
+		Load a trie saved with save.
+
+		:param filepath: str, The file path to load.
+		:return: SequenceTrie
+
+		"""
+
+		trie = SequenceTrie()
+
+		with np.load(filepath) as data:
+			rows = list(zip(data["inputs"].tolist(), data["outputs"].tolist()))
+			parents, symbols = data["parents"].tolist(), data["symbols"].tolist()
+			keys = dict(zip(data["keys"].tolist(), data["nodes"].tolist()))
+			count = int(data["count"])
+
+		trie.__restore(parents=parents, symbols=symbols, rows=rows, keys=keys, count=count)
+		return trie
+
+	@staticmethod
+	def from_files(filepaths: List[str]) -> 'SequenceTrie':
+		"""
+		Build a trie from machine log .csv files,
+		keyed by their file names.
+
+		:param filepaths: List[str], The log file paths.
+		:return: SequenceTrie
+
+		"""
+
+		trie = SequenceTrie()
+
+		for filepath in filepaths:
+			with open(filepath, newline="") as f:
+				reader = csv.reader(f)
+				next(reader, None)
+				trie.add(
+					key=os.path.basename(filepath),
+					sequence=[row for row in reader if len(row) > 0]
+				)
+
+		return trie
+
+	def __restore(
+			self,
+			parents: List[int],
+			symbols: List[int],
+			rows: List[Tuple[str, str]],
+			keys: Dict[str, int],
+			count: int) -> None:
+		"""
+		Restore the trie's state from its saved arrays.
+
+		:param parents: List[int], The node parents.
+		:param symbols: List[int], The node symbols.
+		:param rows: List[Tuple[str, str]], The symbol table.
+		:param keys: Dict[str, int], The sequence end nodes.
+		:param count: int, The total number of rows added.
+		:return: None
+
+		"""
+
+		self.__parents, self.__symbols = parents, symbols
+		self.__rows = rows
+		self.__codes = dict([(r, i) for i, r in enumerate(rows)])
+		self.__children = dict([
+			((parents[n], symbols[n]), n) for n in range(1, len(parents))
+		])
+		self.__keys, self.__count = keys, count
+
+	@property
+	def keys(self) -> List[str]:
+		"""
+		:obj:`List[str]` The keys (e.g. log file
+		names) of the stored sequences.
+
+		"""
+
+		return list(self.__keys.keys())
+
+	@property
+	def rows(self) -> int:
+		"""
+		:obj:`int` The total number of IOPair rows
+		added across every stored sequence.
+
+		"""
+
+		return self.__count
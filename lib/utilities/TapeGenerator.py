@@ -53,7 +53,7 @@ class TapeGenerator(object):
 		"""
 
 		a = TapeGenerator.succession(a=a)
-		a.data.append(Word(name=Bit.BINARY_LABEL_0))
+		a.data.append(Word.intern(name=Bit.BINARY_LABEL_0))
 		[a.data.append(c) for c in TapeGenerator.succession(a=b)]
 		return a
 
@@ -92,7 +92,7 @@ class TapeGenerator(object):
 		tape = TapeGenerator.new_tape()
 
 		for i in range(0, (a + 1)):
-			tape.data.append(Word(name=Bit.BINARY_LABEL_1))
+			tape.data.append(Word.intern(name=Bit.BINARY_LABEL_1))
 
 		return tape
 
@@ -108,10 +108,10 @@ class TapeGenerator(object):
 		return Tape(
 			vocab=Vocabulary(
 				words={
-					Word(name=Bit.BINARY_LABEL_0),
-					Word(name=Bit.BINARY_LABEL_1)
+					Word.intern(name=Bit.BINARY_LABEL_0),
+					Word.intern(name=Bit.BINARY_LABEL_1)
 				}
 			),
-			default=Word(name=Bit.BINARY_LABEL_0),
+			default=Word.intern(name=Bit.BINARY_LABEL_0),
 			data=[]
 		)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+"""
+
+BinarySequence Tests
+
+Pin the integer value convention of the binary
+sequences (the first bit is the least significant,
+while the internal key reads it as the most
+significant) and check the table Goedel numbers
+round-trip.
+
+"""
+
+import os
+import json
+import unittest
+from lib.controllers.binary_table.Bit import Bit
+from lib.controllers.binary_table.BinaryTable import BinaryTable
+from lib.controllers.binary_table.StateSequence import StateSequence
+from lib.controllers.binary_table.BinarySequence import BinarySequence
+from lib.controllers.binary_table.ControlSequence import ControlSequence
+from lib.utilities.JSONDeserializer import JSONDeserializer
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+config_path = os.path.join(root_path, "config/controller/binary_table")
+
+
+def sequence(bits: str) -> BinarySequence:
+	"""
+	Build the binary sequence of the bit string.
+
+	:param bits: str, The bit string.
+	:return: BinarySequence
+
+	"""
+
+	return BinarySequence(values=[Bit.intern(value=b) for b in bits])
+
+
+class BinarySequenceTest(unittest.TestCase):
+
+	def test_to_int(self):
+		self.assertEqual(sequence("100").to_int(), 1)
+		self.assertEqual(sequence("001").to_int(), 4)
+		self.assertEqual(sequence("110").to_int(), 3)
+		self.assertEqual(sequence("").to_int(), 0)
+		self.assertEqual(sequence("100").key, (3, 4))
+		self.assertEqual(str(BinarySequence.from_key(value=4, length=3)), "100")
+
+	def test_composed_to_int(self):
+		state = StateSequence(identity=sequence("1010001"), operation=sequence("10"))
+		self.assertEqual(state.to_int(), 1 + 4 + 64 + 128)
+
+		target = StateSequence(identity=sequence("0110001"), operation=sequence("01"))
+		control = ControlSequence(source=state, condition=sequence("1"), target=target)
+		expected = target.to_int() + (1 << 9) + (state.to_int() << 10)
+		self.assertEqual(control.to_int(), expected)
+		self.assertEqual(ControlSequence.from_key(value=control.key[1], length=len(control)), control)
+
+	def test_goedel_round_trip(self):
+		for operation in ["multiplication", "addition"]:
+			with open(os.path.join(config_path, operation + ".json")) as f:
+				table = JSONDeserializer.deserialize(obj_json=json.load(f))
+
+			table = BinaryTable(entries=set(table.entries))
+			self.assertEqual(BinaryTable.from_int(number=table.to_int()).entries, table.entries)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+"""
+
+ColumnarLog Tests
+
+Check the columnar log against the in-memory
+machine log on runs driven by controllers loaded
+from their JSON configurations.
+
+"""
+
+import io
+import os
+import json
+import unittest
+import tempfile
+import contextlib
+from lib.Head import Head
+from lib.State import State
+from lib.TuringMachine import TuringMachine
+from lib.controllers.Input import Input
+from lib.controllers.Output import Output
+from lib.controllers.IOPair import IOPair
+from lib.controllers.table.Word import Word
+from lib.data.log.MachineLog import MachineLog
+from lib.data.log.ColumnarLog import ColumnarLog
+from lib.utilities.TapeGenerator import TapeGenerator
+from lib.utilities.JSONDeserializer import JSONDeserializer
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+config_path = os.path.join(root_path, "config/controller")
+
+
+def run(controller_type: str, operation: str, log: MachineLog) -> MachineLog:
+	"""
+	Log a run of the JSON-loaded controller on a
+	small multiplication (or addition) tape.
+
+	:param controller_type: str, The controller type.
+	:param operation: str, The operation type.
+	:param log: MachineLog, The log to record to.
+	:return: MachineLog
+
+	"""
+
+	with open(os.path.join(config_path, controller_type, operation + ".json")) as f:
+		controller = JSONDeserializer.deserialize(obj_json=json.load(f))
+
+	if operation == "addition":
+		tape = TapeGenerator.addition(a=11, b=6)
+	else:
+		tape = TapeGenerator.multiplication(a=5, b=3)
+
+	tm = TuringMachine(controller=controller, tape_head=Head(tape=tape), log=log)
+
+	with contextlib.redirect_stdout(io.StringIO()):
+		tm.run(verbose=False)
+
+	return tm.log
+
+
+class ColumnarLogTest(unittest.TestCase):
+
+	def test_json_table_run(self):
+		for controller_type in ["table", "binary_table"]:
+			for operation in ["multiplication", "addition"]:
+				expected = run(controller_type, operation, MachineLog())
+				actual = run(controller_type, operation, ColumnarLog())
+
+				self.assertEqual(len(expected), len(actual))
+				self.assertTrue(all([r.output.action is not None for r in actual.records]))
+				self.assertEqual(str(expected), str(actual))
+
+				with tempfile.TemporaryDirectory() as directory:
+					files = list()
+
+					for name, log in [("expected", expected), ("actual", actual)]:
+						filepath = os.path.join(directory, name)
+						log.export_csv(filepath=filepath + ".csv", label_padding=1)
+						log.export_bin(filepath=filepath + ".bin", label_padding=1)
+
+						with open(filepath + ".csv") as f, open(filepath + ".bin", "rb") as b:
+							files.append((f.read(), b.read()))
+
+					self.assertEqual(files[0], files[1])
+
+	def test_contiguous_rows(self):
+		log = run("table", "multiplication", ColumnarLog())
+		self.assertEqual(log.nbytes, 2 * len(log))
+		self.assertEqual(
+			[r.input.timestep for r in log.records],
+			list(range(1, len(log) + 1))
+		)
+
+	def test_out_of_order_and_removal(self):
+		records = run("table", "multiplication", MachineLog()).records
+		log = ColumnarLog(records=list(reversed(records[:10])) + records[20:30])
+
+		self.assertEqual(len(log), 20)
+		self.assertEqual(str(log.records[0]), str(records[0]))
+		self.assertEqual(log.records[-1].input.timestep, records[29].input.timestep)
+
+		log.log(record=records[25])
+		self.assertEqual(len(log), 20)
+		log.remove(record=records[5])
+		self.assertEqual(len(log), 19)
+		self.assertNotIn(records[5].input.timestep, [r.input.timestep for r in log.records])
+
+		existing = records[25]
+		name = "1" if existing.input.word.name == "0" else "0"
+		conflict = IOPair(
+			input=Input(word=Word.intern(name=name), timestep=existing.input.timestep),
+			output=existing.output
+		)
+
+		with self.assertRaises(ValueError):
+			log.log(record=conflict)
+
+	def test_rejected_records_leave_edges(self):
+		records = run("table", "multiplication", MachineLog()).records
+		log = ColumnarLog(records=records)
+		label_size, edge_count = log.label_size, log.edge_count
+		existing = records[len(records) // 2]
+		state = State.intern(label=2 ** (label_size + 4))
+		output = Output(action=existing.output.action, state=state, timestep=existing.input.timestep)
+		name = "1" if existing.input.word.name == "0" else "0"
+
+		with self.assertRaises(ValueError):
+			log.log(record=IOPair(
+				input=Input(word=Word.intern(name=name), timestep=existing.input.timestep),
+				output=output
+			))
+
+		log.log(record=IOPair(input=existing.input, output=output))
+		self.assertEqual((log.label_size, log.edge_count), (label_size, edge_count))
+		self.assertEqual(str(log), str(MachineLog(records=records)))
+
+
+if __name__ == "__main__":
+	unittest.main()
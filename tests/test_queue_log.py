@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+"""
+
+QueueLog Tests
+
+Check that the queue log keeps only the encoded
+rows of the execution in progress and puts them
+on its queue when flushed.
+
+"""
+
+import queue
+import unittest
+from lib.State import State
+from lib.controls.Move import Move
+from lib.controllers.Input import Input
+from lib.controllers.Output import Output
+from lib.controllers.IOPair import IOPair
+from lib.controllers.table.Word import Word
+from lib.data.log.MachineLog import MachineLog
+from lib.data.log.QueueLog import QueueLog
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+
+
+def record(label: int, timestep: int) -> IOPair:
+	"""
+	Build a record moving left into the labeled state.
+
+	:param label: int, The output state's label.
+	:param timestep: int, The record's timestep.
+	:return: IOPair
+
+	"""
+
+	return IOPair(
+		input=Input(word=Word.intern(name=str(timestep % 2)), timestep=timestep),
+		output=Output(
+			action=Move(direction=Move.DIRECTION_LEFT),
+			state=State.intern(label=label),
+			timestep=timestep
+		)
+	)
+
+
+class QueueLogTest(unittest.TestCase):
+
+	def test_rows(self):
+		records = [record(label=t % 4, timestep=t) for t in range(1, 9)]
+		sequences = queue.Queue()
+		log = QueueLog(sequences=sequences, label_size=3)
+
+		for r in records:
+			log.log(record=r)
+
+		self.assertEqual(len(log), len(records))
+		self.assertEqual(log.records, [])
+		rows = list(MachineLog(records=records).encode(label_size=3))
+		self.assertEqual(str(log), '\n'.join([','.join(row) for row in rows]))
+
+		with self.assertRaises(ValueError):
+			log.remove(record=records[0])
+
+		with self.assertRaises(ValueError):
+			log.log(record=record(label=8, timestep=9))
+
+		log.flush()
+		sequence = sequences.get_nowait()
+		self.assertEqual(sequence.shape, (len(records), len(''.join(rows[0]))))
+		self.assertEqual(sequence[:, 0].tolist(), [t % 2 for t in range(1, 9)])
+		self.assertEqual((len(log), log.count), (0, 1))
+
+		log.log(record=records[0])
+		self.assertEqual(len(log), 1)
+
+
+if __name__ == "__main__":
+	unittest.main()
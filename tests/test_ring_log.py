@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""
+
+RingLog Tests
+
+Check that the ring log keeps the records of the
+latest timesteps as it evicts the oldest ones.
+
+"""
+
+import unittest
+from lib.State import State
+from lib.controls.Move import Move
+from lib.controllers.Input import Input
+from lib.controllers.Output import Output
+from lib.controllers.IOPair import IOPair
+from lib.controllers.table.Word import Word
+from lib.data.log.RingLog import RingLog
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+
+
+def record(label: int, timestep: int) -> IOPair:
+	"""
+	Build a record moving left into the labeled state.
+
+	:param label: int, The output state's label.
+	:param timestep: int, The record's timestep.
+	:return: IOPair
+
+	"""
+
+	return IOPair(
+		input=Input(word=Word.intern(name="0"), timestep=timestep),
+		output=Output(
+			action=Move(direction=Move.DIRECTION_LEFT),
+			state=State.intern(label=label),
+			timestep=timestep
+		)
+	)
+
+
+def timesteps(log: RingLog) -> list:
+	"""
+	Return the sorted timesteps held by the log.
+
+	:param log: RingLog, The log.
+	:return: list
+
+	"""
+
+	return sorted([r.input.timestep for r in log.records])
+
+
+class RingLogTest(unittest.TestCase):
+
+	def test_eviction(self):
+		log = RingLog(size=3)
+
+		for t in range(1, 11):
+			log.log(record=record(label=t, timestep=t))
+
+		self.assertEqual(timesteps(log), [8, 9, 10])
+		self.assertEqual(log.label_size, 4)
+
+		log.log(record=record(label=10, timestep=10))
+		log.log(record=record(label=1, timestep=14))
+		self.assertEqual(timesteps(log), [9, 10, 14])
+		self.assertEqual(log.label_size, 4)
+
+		log.remove(record=log.lookup(timestep=9))
+		log.log(record=record(label=1, timestep=20))
+		log.log(record=record(label=1, timestep=21))
+		self.assertEqual(timesteps(log), [14, 20, 21])
+		self.assertEqual(log.label_size, 0)
+
+		log.log(record=record(label=1, timestep=2))
+		self.assertEqual(timesteps(log), [14, 20, 21])
+
+		log.clear()
+		log.log(record=record(label=1, timestep=5))
+		self.assertEqual(timesteps(log), [5])
+
+
+if __name__ == "__main__":
+	unittest.main()
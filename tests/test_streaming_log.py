@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+"""
+
+StreamingLog Tests
+
+Check the streaming log's label size checks, that
+it refuses whole-log exports, and that a run closes
+the log's file.
+
+"""
+
+import io
+import os
+import unittest
+import tempfile
+import contextlib
+from lib.State import State
+from lib.Head import Head
+from lib.controls.Move import Move
+from lib.TuringMachine import TuringMachine
+from lib.controllers.Input import Input
+from lib.controllers.Output import Output
+from lib.controllers.IOPair import IOPair
+from lib.controllers.table.Edge import Edge
+from lib.controllers.table.Word import Word
+from lib.controllers.table.Table import Table
+from lib.data.log.StreamingLog import StreamingLog
+from lib.utilities.TapeGenerator import TapeGenerator
+
+__author__ = "Dylan Pozorski"
+__project__ = "TuringMachine"
+
+
+def record(label: int, timestep: int) -> IOPair:
+	"""
+	Build a record moving left into the labeled state.
+
+	:param label: int, The output state's label.
+	:param timestep: int, The record's timestep.
+	:return: IOPair
+
+	"""
+
+	return IOPair(
+		input=Input(word=Word.intern(name="0"), timestep=timestep),
+		output=Output(
+			action=Move(direction=Move.DIRECTION_LEFT),
+			state=State.intern(label=label),
+			timestep=timestep
+		)
+	)
+
+
+class StreamingLogTest(unittest.TestCase):
+
+	def test_label_overflow(self):
+		with tempfile.TemporaryDirectory() as directory:
+			log = StreamingLog(filepath=os.path.join(directory, "log.csv"), label_size=2)
+			log.log(record=record(label=3, timestep=1))
+
+			# powers of two need one more bit than ceil(log2)
+			with self.assertRaises(ValueError):
+				log.log(record=record(label=4, timestep=2))
+
+			with self.assertRaises(ValueError):
+				log.remove(record=record(label=3, timestep=1))
+
+			log.close()
+
+	def test_export_raises(self):
+		with tempfile.TemporaryDirectory() as directory:
+			log = StreamingLog(filepath=os.path.join(directory, "log.csv"), label_size=2, tail=2)
+
+			for t in range(1, 6):
+				log.log(record=record(label=1, timestep=t))
+
+			for export in [log.export_csv, log.export_bin]:
+				with self.assertRaises(NotImplementedError):
+					export(filepath=os.path.join(directory, "export"))
+
+			self.assertFalse(os.path.exists(os.path.join(directory, "export")))
+			log.close()
+
+	def test_run_closes_file(self):
+		table = Table(entries={
+			Edge(
+				condition=Word.intern(name=name),
+				source=State.intern(label=0, root=True),
+				target=State.intern(label=1, terminal=True),
+				action=Move(direction=Move.DIRECTION_RIGHT)
+			) for name in ["0", "1"]
+		})
+
+		with tempfile.TemporaryDirectory() as directory:
+			filepath = os.path.join(directory, "log.csv")
+			log = StreamingLog(filepath=filepath, label_size=2)
+			tm = TuringMachine(
+				controller=table,
+				tape_head=Head(tape=TapeGenerator.succession(a=2)),
+				log=log
+			)
+
+			with contextlib.redirect_stdout(io.StringIO()):
+				tm.run(verbose=False)
+
+			with open(filepath) as f:
+				self.assertEqual(len(f.readlines()), log.count + 1)
+
+			with self.assertRaises(ValueError):
+				log.log(record=record(label=1, timestep=10))
+				log.flush()
+
+
+if __name__ == "__main__":
+	unittest.main()